@@ -1,7 +1,64 @@
 """Define the aioguardian package."""
 
-from aioguardian.client import Client
+from __future__ import annotations
+
+# Importing typing is a large share of the package's import time, so it is avoided
+# here (type checkers treat this name the same as typing.TYPE_CHECKING):
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from aioguardian.client import Client
+    from aioguardian.fleet import Fleet
+    from aioguardian.poller import Poller
 
 __all__ = [
     "Client",
+    "Fleet",
+    "Poller",
 ]
+
+# Public names are imported from their modules on first use, so that importing the
+# package itself is nearly free:
+_LAZY_IMPORTS = {
+    "Client": "aioguardian.client",
+    "Fleet": "aioguardian.fleet",
+    "Poller": "aioguardian.poller",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import a public name on first use.
+
+    Args:
+    ----
+        name: The name of the attribute.
+
+    Returns:
+    -------
+        The attribute.
+
+    Raises:
+    ------
+        AttributeError: Raised when the package has no such attribute.
+
+    """
+    if (module_name := _LAZY_IMPORTS.get(name)) is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    import importlib  # pylint: disable=import-outside-toplevel
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the package's attributes (including the lazily imported ones).
+
+    Returns
+    -------
+        A list of attribute names.
+
+    """
+    return sorted([*globals(), *__all__])
@@ -3,26 +3,113 @@
 from __future__ import annotations
 
 import asyncio
-import json
+from collections.abc import AsyncGenerator
+import contextlib
+import functools
+import importlib
+import logging
 from types import TracebackType
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
-import asyncio_dgram
-from typing_extensions import Self  # noqa: UP035
-
-from aioguardian.commands.iot import IOTCommands
-from aioguardian.commands.sensor import SensorCommands
-from aioguardian.commands.system import SystemCommands
-from aioguardian.commands.valve import ValveCommands
-from aioguardian.commands.wifi import WiFiCommands
 from aioguardian.const import LOGGER
-from aioguardian.errors import SocketError, _raise_on_command_error
-from aioguardian.helpers.command import Command, get_command_from_code
+from aioguardian.errors import GuardianError, SocketError, _raise_on_command_error
+from aioguardian.helpers.cache import ResponseCache
+from aioguardian.helpers.coalesce import RequestCoalescer
+from aioguardian.helpers.codec import JsonCodec, get_default_codec
+from aioguardian.helpers.command import (
+    READ_ONLY_COMMANDS,
+    RESTART_COMMANDS,
+    Command,
+    get_command_from_code,
+    get_request_key,
+)
+from aioguardian.helpers.datagram import DatagramEndpoint, DeviceStream
+from aioguardian.helpers.debug import DebugLogging
+from aioguardian.helpers.metrics import MetricsRecorder
+from aioguardian.helpers.retry import DEFAULT_ATTEMPTS, RetryPolicy, RttEstimator
+from aioguardian.helpers.scheduler import COMMAND_PRIORITIES, RequestScheduler
+
+if TYPE_CHECKING:
+    import asyncio_dgram
+    from typing_extensions import Self  # noqa: UP035
+
+    from aioguardian.commands.iot import IOTCommands
+    from aioguardian.commands.sensor import SensorCommands
+    from aioguardian.commands.system import SystemCommands
+    from aioguardian.commands.valve import ValveCommands
+    from aioguardian.commands.wifi import WiFiCommands
+    from aioguardian.health import HealthPolicy, HealthSupervisor
+    from aioguardian.poller import Overflow, Poller, PollUpdate
 
-DEFAULT_COMMAND_RETRIES: int = 3
+DEFAULT_COMMAND_RETRIES: int = DEFAULT_ATTEMPTS
 DEFAULT_PORT: int = 7777
 DEFAULT_REQUEST_TIMEOUT: int = 10
 
+# A response that arrives sooner than this fraction of the fastest round trip seen so
+# far can't be answering the request that was just sent:
+STALE_RESPONSE_RTT_FRACTION = 0.5
+
+# After acknowledging a reboot, factory reset, or firmware upgrade, a device restarts
+# (the Guardian API docs say that reboots happen 3 seconds after the command is
+# received). Until it answers a ping again, commands are held rather than sent:
+RESTART_PROBE_INTERVAL = 0.5
+# A device that answers a ping this long after acknowledging a restart has evidently
+# finished restarting (even if no probe caught it offline):
+RESTART_GRACE_PERIOD = 6.0
+# If a device still hasn't come back after this long, held commands are released (and
+# will most likely time out):
+RESTART_TIMEOUT = 300.0
+
+# The command classes behind each of a client's command groups (which are only imported
+# when a group is first used):
+COMMAND_CLASSES: dict[str, tuple[str, str]] = {
+    "iot": ("aioguardian.commands.iot", "IOTCommands"),
+    "sensor": ("aioguardian.commands.sensor", "SensorCommands"),
+    "system": ("aioguardian.commands.system", "SystemCommands"),
+    "valve": ("aioguardian.commands.valve", "ValveCommands"),
+    "wifi": ("aioguardian.commands.wifi", "WiFiCommands"),
+}
+
+
+def get_command_class(group: str) -> type:
+    """Return the command class behind a command group (importing it if needed).
+
+    Args:
+    ----
+        group: The name of the command group (e.g., ``"valve"``).
+
+    Returns:
+    -------
+        The command class.
+
+    """
+    module_name, class_name = COMMAND_CLASSES[group]
+    return cast(type, getattr(importlib.import_module(module_name), class_name))
+
+
+def _wrap_socket_error(err: Exception, action: str) -> Exception:
+    """Return a socket-level error as a SocketError (leaving other errors alone).
+
+    Errors like an ICMP "port unreachable" from a device that has left the network
+    show up as an ``OSError``; as a ``SocketError``, they count against the health of
+    the connection. (Timeouts are left alone, since they are retried.)
+
+    Args:
+    ----
+        err: The error.
+        action: What was being done (e.g., ``"send to"``).
+
+    Returns:
+    -------
+        The error to raise.
+
+    """
+    if not isinstance(err, OSError) or isinstance(err, TimeoutError):
+        return err
+    socket_error = SocketError(f"Unable to {action} the device: {err}")
+    socket_error.__cause__ = err
+    return socket_error
+
 
 class Client:
     """Define the class that can send commands to a Guardian device.
@@ -33,6 +120,19 @@ class Client:
         port: The port to connect to.
         request_timeout: The number of seconds to wait before timing out a request.
         command_retries: The number of retries to use on a failed command.
+        endpoint: An optional shared datagram endpoint to communicate over (rather
+            than a socket of this client's own).
+        retry_policy: An optional policy for retrying timed out commands (overrides
+            ``command_retries``).
+        cache: An optional cache of responses to read-only commands.
+        codec: An optional JSON codec (by default, the fastest one installed).
+        metrics: An optional recorder of request metrics.
+        debug_logging: Optional settings for logging received datagrams (by default,
+            every decoded response is logged when ``DEBUG`` logging is enabled).
+        health: An optional policy for supervising the health of the connection
+            (pinging the device while idle and failing fast while it is unreachable).
+        scheduler: An optional scheduler that admits requests to the device in order
+            of priority (by default, one that allows a few requests in flight).
 
     """
 
@@ -43,6 +143,14 @@ class Client:
         port: int = DEFAULT_PORT,
         request_timeout: int = DEFAULT_REQUEST_TIMEOUT,
         command_retries: int = DEFAULT_COMMAND_RETRIES,
+        endpoint: DatagramEndpoint | None = None,
+        retry_policy: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        codec: JsonCodec | None = None,
+        metrics: MetricsRecorder | None = None,
+        debug_logging: DebugLogging | None = None,
+        health: HealthPolicy | None = None,
+        scheduler: RequestScheduler | None = None,
     ) -> None:
         """Initialize.
 
@@ -52,23 +160,167 @@ class Client:
             port: The port to connect to.
             request_timeout: The number of seconds to wait before timing out a request.
             command_retries: The number of retries to use on a failed command.
+            endpoint: An optional shared datagram endpoint to communicate over (rather
+                than a socket of this client's own).
+            retry_policy: An optional policy for retrying timed out commands
+                (overrides ``command_retries``).
+            cache: An optional cache of responses to read-only commands.
+            codec: An optional JSON codec (by default, the fastest one installed).
+            metrics: An optional recorder of request metrics.
+            debug_logging: Optional settings for logging received datagrams (by
+                default, every decoded response is logged when ``DEBUG`` logging is
+                enabled).
+            health: An optional policy for supervising the health of the connection
+                (pinging the device while idle and failing fast while it is
+                unreachable).
+            scheduler: An optional scheduler that admits requests to the device in
+                order of priority (by default, one that allows a few requests in
+                flight).
 
         """
-        self._command_retries = command_retries
+        self._cache = cache
+        self._coalescer = RequestCoalescer()
+        self._codec = codec or get_default_codec()
+        self._debug_logging = debug_logging or DebugLogging()
+        self._endpoint = endpoint
+        self._health: HealthSupervisor | None = None
+        if health is not None:
+            # pylint: disable-next=import-outside-toplevel
+            from aioguardian.health import HealthSupervisor
+
+            self._health = HealthSupervisor(health, self._probe, self.reconnect)
         self._ip = ip_address
-        # Since device communication happens over a single UDP port, concurrent
-        # operations can return faulty data; we use a lock so the user doesn't have to
-        # know anything about that:
-        self._lock: asyncio.Lock = asyncio.Lock()
+        self._metrics = metrics
+        # Every response echoes the code of the command that produced it, so replies
+        # are routed back to their callers by command code; that allows commands with
+        # different codes to be in flight at the same time. Two requests for the same
+        # command code can't be told apart, so we use a lock per code to serialize
+        # those:
+        self._command_locks: dict[Command, asyncio.Lock] = {}
+        # The number of timed out attempts (by command code) whose responses may still
+        # show up late:
+        self._late_responses: dict[int, int] = {}
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        # The UID of the paired sensor (if any) each outstanding request is about:
+        self._expected_uids: dict[int, str | None] = {}
+        self._poller: Poller | None = None
+        self._received_count = 0
         self._port = port
+        self._reader_task: asyncio.Task | None = None
+        # Set unless the device is restarting:
+        self._ready = asyncio.Event()
+        self._ready.set()
+        self._restart_acknowledged_at = 0.0
+        self._restart_task: asyncio.Task | None = None
+        self._sent_at: dict[int, float] = {}
         self._request_timeout = request_timeout
-        self._stream: asyncio_dgram.aio.DatagramStream | None = None
+        self._retry_policy = retry_policy or RetryPolicy(attempts=command_retries)
+        # Per-attempt timeouts of read-only commands adapt to the round-trip time
+        # observed for each command, never exceeding the request timeout (commands
+        # differ too much in how long the device takes to answer them to share one
+        # estimate):
+        self._rtts: dict[Command, RttEstimator] = {}
+        self._scheduler = RequestScheduler() if scheduler is None else scheduler
+        self._stream: DeviceStream | None = None
+
+    @property
+    def restarting(self) -> bool:
+        """Return whether the device is restarting (and commands are being held).
+
+        Returns
+        -------
+            Whether the device is restarting.
+
+        """
+        return not self._ready.is_set()
+
+    @property
+    def scheduler(self) -> RequestScheduler:
+        """Return the scheduler that admits this client's requests to the device.
+
+        Returns
+        -------
+            A request scheduler.
+
+        """
+        return self._scheduler
+
+    @functools.cached_property
+    def iot(self) -> IOTCommands:
+        """Return the IOT commands (loaded on first use).
+
+        Returns
+        -------
+            An instance of :class:`~aioguardian.commands.iot.IOTCommands`.
+
+        """
+        return cast("IOTCommands", self._load_commands("iot"))
+
+    @functools.cached_property
+    def sensor(self) -> SensorCommands:
+        """Return the sensor commands (loaded on first use).
+
+        Returns
+        -------
+            An instance of :class:`~aioguardian.commands.sensor.SensorCommands`.
+
+        """
+        return cast("SensorCommands", self._load_commands("sensor"))
+
+    @functools.cached_property
+    def system(self) -> SystemCommands:
+        """Return the system commands (loaded on first use).
+
+        Returns
+        -------
+            An instance of :class:`~aioguardian.commands.system.SystemCommands`.
+
+        """
+        return cast("SystemCommands", self._load_commands("system"))
+
+    @functools.cached_property
+    def valve(self) -> ValveCommands:
+        """Return the valve commands (loaded on first use).
+
+        Returns
+        -------
+            An instance of :class:`~aioguardian.commands.valve.ValveCommands`.
+
+        """
+        return cast("ValveCommands", self._load_commands("valve"))
+
+    @functools.cached_property
+    def wifi(self) -> WiFiCommands:
+        """Return the WiFi commands (loaded on first use).
+
+        Returns
+        -------
+            An instance of :class:`~aioguardian.commands.wifi.WiFiCommands`.
+
+        """
+        return cast("WiFiCommands", self._load_commands("wifi"))
+
+    @property
+    def health(self) -> HealthSupervisor | None:
+        """Return the supervisor of this client's connection health (if any).
+
+        Returns
+        -------
+            A health supervisor.
+
+        """
+        return self._health
+
+    @property
+    def metrics(self) -> MetricsRecorder | None:
+        """Return the recorder of this client's request metrics (if any).
+
+        Returns
+        -------
+            A metrics recorder.
 
-        self.iot = IOTCommands(self._execute_command)
-        self.sensor = SensorCommands(self._execute_command)
-        self.system = SystemCommands(self._execute_command)
-        self.valve = ValveCommands(self._execute_command)
-        self.wifi = WiFiCommands(self._execute_command)
+        """
+        return self._metrics
 
     async def __aenter__(self) -> Self:
         """Define an entry point into this object via a context manager.
@@ -98,8 +350,28 @@ class Client:
         """
         self.disconnect()
 
+    def _load_commands(self, group: str) -> Any:  # noqa: ANN401
+        """Create the command object for a command group.
+
+        Args:
+        ----
+            group: The name of the command group (e.g., ``"valve"``).
+
+        Returns:
+        -------
+            The command object.
+
+        """
+        return get_command_class(group)(self._execute_command)
+
     async def _execute_command(
-        self, command: Command, *, params: dict | None = None, silent: bool = True
+        self,
+        command: Command,
+        *,
+        params: dict | None = None,
+        silent: bool = True,
+        use_cache: bool = True,
+        retry_policy: RetryPolicy | None = None,
     ) -> dict[str, Any]:
         """Make a request against the Guardian device and return the response.
 
@@ -108,6 +380,9 @@ class Client:
             command: The command to execute.
             params: Any parameters to send along with the command.
             silent: If ``True``, silence "beep" tones associated with this command.
+            use_cache: If ``False``, always ask the device (even when a cached response
+                exists).
+            retry_policy: A retry policy to use instead of the client's.
 
         Returns:
         -------
@@ -116,40 +391,566 @@ class Client:
         Raises:
         ------
             SocketError: Raised on an issue with the UDP socket.
+            CircuitOpenError: Raised (without sending anything) while the device is
+                unreachable.
 
         """
+        if not self._ready.is_set():
+            # Commands sent while the device restarts would be lost, so they wait until
+            # it's back:
+            await self._ready.wait()
+
         if not self._stream:
             msg = "You aren't connected to the device yet"
             raise SocketError(msg)
 
-        _params = params or {}
-        payload = {"command": command.value, "silent": silent, **_params}
+        if (
+            use_cache
+            and self._cache is not None
+            and (cached := self._cache.get(command, params)) is not None
+        ):
+            return cached
 
-        retry = 0
+        if self._health is not None:
+            self._health.check()
 
-        while retry < self._command_retries:
-            try:
-                async with self._lock, asyncio.timeout(self._request_timeout):
-                    await self._stream.send(json.dumps(payload).encode())
-                    data, remote_addr = await self._stream.recv()
+        if command not in READ_ONLY_COMMANDS:
+            return await self._request(
+                self._stream, command, params, silent, retry_policy=retry_policy
+            )
+
+        # Identical read-only requests that arrive while one is already in flight share
+        # its response:
+        stream = self._stream
+        return await self._coalescer.run(
+            (get_request_key(command, params), silent),
+            lambda: self._request(
+                stream, command, params, silent, retry_policy=retry_policy
+            ),
+        )
+
+    async def _execute_with_retries(
+        self,
+        stream: DeviceStream,
+        command: Command,
+        data: bytes,
+        *,
+        expected_uid: str | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ) -> dict[str, Any]:
+        """Send a request, retrying it according to the command's retry policy.
+
+        Args:
+        ----
+            stream: The datagram stream to communicate over.
+            command: The command being executed.
+            data: The encoded request payload.
+            expected_uid: The UID of the paired sensor the request is about (if any).
+            retry_policy: A retry policy to use instead of the client's.
+
+        Returns:
+        -------
+            An API response payload.
+
+        Raises:
+        ------
+            SocketError: Raised when every attempt times out.
+
+        """
+        loop = asyncio.get_running_loop()
+        metrics = self._metrics
+        policy = (retry_policy or self._retry_policy).for_command(command)
+        deadline = None if policy.deadline is None else loop.time() + policy.deadline
+        rtt_estimator = self._get_rtt_estimator(command)
+
+        for attempt in range(policy.attempts):
+            if attempt:
+                delay = policy.backoff(attempt - 1)
+                if deadline is not None and loop.time() + delay >= deadline:
                     break
-            except TimeoutError:
                 LOGGER.info("%s command timed out; trying again", command.name)
-                retry += 1
-                await asyncio.sleep(1)
+                if metrics is not None:
+                    metrics.record_retry(command)
+                await asyncio.sleep(delay)
+
+            timeout = self._get_attempt_timeout(command, policy)
+            if deadline is not None:
+                timeout = min(timeout, deadline - loop.time())
+
+            try:
+                decoded_data, rtt = await self._send_attempt(
+                    stream, command, data, timeout, expected_uid=expected_uid
+                )
+            except TimeoutError:
+                rtt_estimator.record_timeout()
+                self._late_responses[command.value] = (
+                    self._late_responses.get(command.value, 0) + 1
+                )
+                if metrics is not None:
+                    metrics.record_timeout(command)
+                continue
+
+            self._late_responses.pop(command.value, None)
+            if metrics is not None:
+                metrics.record_rtt(command, rtt)
+            # Per Karn's algorithm, only round trips that weren't retried are used to
+            # estimate the device's RTT:
+            if attempt == 0:
+                rtt_estimator.record_sample(rtt)
+            return decoded_data
+
+        msg = f"{command.name} command timed out"
+        raise SocketError(msg)
+
+    async def _request(
+        self,
+        stream: DeviceStream,
+        command: Command,
+        params: dict[str, Any] | None,
+        silent: bool,  # noqa: FBT001
+        *,
+        retry_policy: RetryPolicy | None = None,
+    ) -> dict[str, Any]:
+        """Send a request to the device and process its response.
+
+        Args:
+        ----
+            stream: The datagram stream to communicate over.
+            command: The command to execute.
+            params: Any parameters to send along with the command.
+            silent: If ``True``, silence "beep" tones associated with this command.
+            retry_policy: A retry policy to use instead of the client's.
+
+        Returns:
+        -------
+            An API response payload.
+
+        """
+        if params:
+            data = self._codec.dumps(
+                {"command": command.value, "silent": silent, **params}
+            )
         else:
-            msg = f"{command.name} command timed out"
-            raise SocketError(msg)
+            # Most commands have no parameters, so their requests are pre-serialized:
+            data = command.frame(silent)
 
-        decoded_data = json.loads(data.decode())
-        LOGGER.debug("Received data from %s: %s", remote_addr, decoded_data)
+        if self._metrics is not None:
+            self._metrics.record_request(command)
+        started_at = asyncio.get_running_loop().time()
 
+        try:
+            decoded_data = await self._execute_with_retries(
+                stream,
+                command,
+                data,
+                # Requests about a paired sensor are answered with its UID, which tells
+                # a late answer to a request about another sensor apart:
+                expected_uid=params.get("uid") if params else None,
+                retry_policy=retry_policy,
+            )
+        except SocketError:
+            if self._health is not None:
+                self._health.record_failure()
+            raise
+
+        if self._health is not None:
+            self._health.record_success()
+        if self._metrics is not None:
+            self._metrics.record_latency(
+                COMMAND_PRIORITIES[command],
+                asyncio.get_running_loop().time() - started_at,
+            )
+
+        if self._metrics is not None and decoded_data.get("status") != "ok":
+            self._metrics.record_error(command, decoded_data.get("error_code"))
         _raise_on_command_error(command, decoded_data)
 
-        return cast(dict[str, Any], decoded_data)
+        if self._cache is not None:
+            self._cache.record(command, params, decoded_data)
 
-    async def connect(self) -> None:
-        """Connect to the Guardian device.
+        if command in RESTART_COMMANDS:
+            self._begin_restart()
+
+        return decoded_data
+
+    async def _await_restart(self) -> None:
+        """Probe a restarting device until it's back, then release held commands."""
+        loop = asyncio.get_running_loop()
+        went_offline = False
+
+        try:
+            async with asyncio.timeout(RESTART_TIMEOUT):
+                while True:
+                    await asyncio.sleep(RESTART_PROBE_INTERVAL)
+                    probed_at = loop.time()
+                    answered = await self._ping_once()
+                    # The device is back once it answers after having gone offline (or
+                    # long enough after the restart that it can't still be pending):
+                    elapsed = probed_at - self._restart_acknowledged_at
+                    if answered and (went_offline or elapsed >= RESTART_GRACE_PERIOD):
+                        break
+                    went_offline = went_offline or not answered
+        except TimeoutError:
+            LOGGER.warning(
+                "Device didn't finish restarting within %s seconds", RESTART_TIMEOUT
+            )
+        else:
+            LOGGER.debug("Device finished restarting")
+
+        self._restart_task = None
+        self._ready.set()
+
+    def _begin_restart(self) -> None:
+        """Hold commands until the device (which is about to restart) is back."""
+        LOGGER.debug("Holding commands until the device finishes restarting")
+        self._ready.clear()
+        self._restart_acknowledged_at = asyncio.get_running_loop().time()
+        if self._restart_task is None:
+            self._restart_task = asyncio.create_task(self._await_restart())
+
+    def _discard_response(self, reason: str, data: bytes) -> None:
+        """Discard a response that doesn't answer any outstanding request.
+
+        Args:
+        ----
+            reason: Why the response is discarded (``"invalid"``, ``"stale"``, or
+                ``"unsolicited"``).
+            data: The raw response datagram.
+
+        """
+        LOGGER.debug("Discarding %s response: %r", reason, data)
+        if self._metrics is not None:
+            self._metrics.record_discarded(reason)
+
+    def _fail_pending(self, err: Exception) -> None:
+        """Fail every outstanding request.
+
+        Args:
+        ----
+            err: The error to fail the requests with.
+
+        """
+        # (Requests that were cancelled may not have cleaned up after themselves yet.)
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(err)
+        self._pending.clear()
+
+    def _get_attempt_timeout(self, command: Command, policy: RetryPolicy) -> float:
+        """Return the timeout for the next attempt at a command.
+
+        Args:
+        ----
+            command: The command being executed.
+            policy: The command's retry policy.
+
+        Returns:
+        -------
+            A timeout in seconds.
+
+        """
+        if policy.timeout is not None:
+            return policy.timeout
+        if command in READ_ONLY_COMMANDS:
+            return self._get_rtt_estimator(command).timeout
+        # Slow or state-changing commands (e.g., a WiFi scan or a firmware upgrade) get
+        # the full request timeout, since retrying them early does more harm than
+        # waiting:
+        return self._request_timeout
+
+    def _get_rtt_estimator(self, command: Command) -> RttEstimator:
+        """Return the estimator of a command's round-trip time (creating it if needed).
+
+        Args:
+        ----
+            command: The command.
+
+        Returns:
+        -------
+            An RTT estimator.
+
+        """
+        if (rtt_estimator := self._rtts.get(command)) is None:
+            rtt_estimator = self._rtts[command] = RttEstimator(
+                initial_timeout=self._request_timeout,
+                min_timeout=self._retry_policy.for_command(command).min_timeout,
+                max_timeout=self._request_timeout,
+            )
+        return rtt_estimator
+
+    def _handle_response(self, data: bytes, remote_addr: tuple[str, int]) -> None:
+        """Route a response from the device to the request waiting for it.
+
+        Args:
+        ----
+            data: The raw response datagram.
+            remote_addr: The address the datagram came from.
+
+        """
+        try:
+            decoded_data = self._codec.loads(data)
+        except Exception:  # noqa: BLE001
+            # Whatever the codec raises, a datagram we can't decode is just dropped:
+            self._discard_response("invalid", data)
+            return
+
+        # The same goes for one that decodes to something other than a response:
+        if not isinstance(decoded_data, dict) or not isinstance(
+            command_code := decoded_data.get("command"), int
+        ):
+            self._discard_response("invalid", data)
+            return
+
+        # This is the hottest path in the library, so when debug logging is off, it
+        # costs a single (cached) level check:
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            self._log_received(data, decoded_data, remote_addr)
+
+        waiter = self._pending.get(command_code)
+        if waiter is None or waiter.done():
+            # Duplicates, responses to requests that gave up, etc.:
+            self._discard_response("unsolicited", data)
+            return
+
+        if self._is_other_sensor(command_code, decoded_data):
+            # A late answer to an earlier request about another paired sensor:
+            if self._late_responses.get(command_code):
+                self._late_responses[command_code] -= 1
+            self._discard_response("stale", data)
+            return
+
+        if self._late_responses.get(command_code) and self._is_too_soon(command_code):
+            # After an attempt times out, its response may still arrive while a retry
+            # is outstanding; one that arrives faster than the device could possibly
+            # have answered the retry must be the late one:
+            self._late_responses[command_code] -= 1
+            self._discard_response("stale", data)
+            return
+
+        del self._pending[command_code]
+        waiter.set_result(decoded_data)
+
+    def _is_other_sensor(self, command_code: int, decoded_data: dict[str, Any]) -> bool:
+        """Return whether a response is about a different paired sensor than requested.
+
+        Args:
+        ----
+            command_code: The command code of the response.
+            decoded_data: The decoded response.
+
+        Returns:
+        -------
+            Whether the response is about another sensor.
+
+        """
+        if (expected_uid := self._expected_uids.get(command_code)) is None:
+            return False
+        if decoded_data.get("status") != "ok" or not isinstance(
+            response_data := decoded_data.get("data"), dict
+        ):
+            return False
+        return bool(response_data.get("uid", expected_uid) != expected_uid)
+
+    def _is_too_soon(self, command_code: int) -> bool:
+        """Return whether a response arrived too soon to answer the latest request.
+
+        Args:
+        ----
+            command_code: The command code of the response.
+
+        Returns:
+        -------
+            Whether the response is too soon.
+
+        """
+        if (min_rtt := self._rtts[Command(command_code)].min_rtt) is None:
+            return False
+        elapsed = asyncio.get_running_loop().time() - self._sent_at[command_code]
+        return elapsed < min_rtt * STALE_RESPONSE_RTT_FRACTION
+
+    def _log_received(
+        self, data: bytes, decoded_data: dict[str, Any], remote_addr: tuple[str, int]
+    ) -> None:
+        """Log a received datagram (if it is sampled).
+
+        Args:
+        ----
+            data: The raw datagram.
+            decoded_data: The decoded response.
+            remote_addr: The address the datagram came from.
+
+        """
+        self._received_count += 1
+        if (self._received_count - 1) % self._debug_logging.sample_every:
+            return
+
+        if self._debug_logging.raw:
+            LOGGER.debug("Received data from %s: %r", remote_addr, data)
+        else:
+            LOGGER.debug("Received data from %s: %s", remote_addr, decoded_data)
+
+    async def _probe(self) -> None:
+        """Ping the device on behalf of the health supervisor (even if it's unhealthy).
+
+        Raises
+        ------
+            SocketError: Raised on an issue with the UDP socket.
+
+        """
+        # A restarting device isn't expected to answer:
+        await self._ready.wait()
+        if not self._stream:
+            msg = "You aren't connected to the device"
+            raise SocketError(msg)
+        await self._request(self._stream, Command.SYSTEM_PING, None, True)  # noqa: FBT003
+
+    async def _ping_once(self) -> bool:
+        """Ping the device (once, bypassing held commands and the health supervisor).
+
+        Returns
+        -------
+            Whether the device answered.
+
+        """
+        if not self._stream:
+            return False
+        try:
+            await self._send_attempt(
+                self._stream,
+                Command.SYSTEM_PING,
+                Command.SYSTEM_PING.frame(True),  # noqa: FBT003
+                self._get_attempt_timeout(
+                    Command.SYSTEM_PING,
+                    self._retry_policy.for_command(Command.SYSTEM_PING),
+                ),
+            )
+        except (GuardianError, TimeoutError):
+            return False
+        return True
+
+    async def _read_responses(self, stream: asyncio_dgram.aio.DatagramClient) -> None:
+        """Read responses from the device's own socket.
+
+        The reader only runs while at least one request is outstanding; it exits once
+        every pending request has been answered. (Clients that use a shared endpoint
+        have responses pushed to them instead.)
+
+        Args:
+        ----
+            stream: The datagram stream to read from.
+
+        """
+        while self._pending:
+            try:
+                data, remote_addr = await stream.recv()
+            except Exception as err:  # noqa: BLE001
+                # Any failure is surfaced to every request that is currently waiting
+                # (only timeouts are retried):
+                self._fail_pending(_wrap_socket_error(err, "receive from"))
+                return
+
+            self._handle_response(data, remote_addr)
+
+    async def _send_attempt(
+        self,
+        stream: DeviceStream,
+        command: Command,
+        data: bytes,
+        attempt_timeout: float,
+        *,
+        expected_uid: str | None = None,
+    ) -> tuple[dict[str, Any], float]:
+        """Make a single attempt at a request, once the request may be sent.
+
+        Args:
+        ----
+            stream: The datagram stream to communicate over.
+            command: The command being executed.
+            data: The encoded request payload.
+            attempt_timeout: The number of seconds to wait for the response.
+            expected_uid: The UID of the paired sensor the request is about (if any).
+
+        Returns:
+        -------
+            An API response payload and the round-trip time of the attempt.
+
+        """
+        lock = self._command_locks.setdefault(command, asyncio.Lock())
+        loop = asyncio.get_running_loop()
+
+        waiting_since = loop.time()
+        async with lock:
+            # Waiting for the scheduler only once the command's lock is held keeps
+            # requests that can't be sent yet anyway from taking up a place in flight:
+            await self._scheduler.acquire(COMMAND_PRIORITIES[command])
+            try:
+                sent_at = loop.time()
+                if self._metrics is not None:
+                    self._metrics.record_lock_wait(command, sent_at - waiting_since)
+                async with asyncio.timeout(attempt_timeout):
+                    decoded_data = await self._send_and_receive(
+                        stream, command, data, expected_uid
+                    )
+            finally:
+                self._scheduler.release()
+            return decoded_data, loop.time() - sent_at
+
+    async def _send_and_receive(
+        self,
+        stream: DeviceStream,
+        command: Command,
+        data: bytes,
+        expected_uid: str | None,
+    ) -> dict[str, Any]:
+        """Send a single request and wait for the response that answers it.
+
+        Args:
+        ----
+            stream: The datagram stream to communicate over.
+            command: The command being executed.
+            data: The encoded request payload.
+            expected_uid: The UID of the paired sensor the request is about (if any).
+
+        Returns:
+        -------
+            An API response payload.
+
+        """
+        future: asyncio.Future[dict[str, Any]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._pending[command.value] = future
+        self._expected_uids[command.value] = expected_uid
+        self._sent_at[command.value] = asyncio.get_running_loop().time()
+
+        try:
+            try:
+                await stream.send(data)
+            except Exception as err:
+                raise _wrap_socket_error(err, "send to") from err
+            if not self._endpoint and (
+                self._reader_task is None or self._reader_task.done()
+            ):
+                self._reader_task = asyncio.create_task(self._read_responses(stream))
+            return await future
+        finally:
+            if self._pending.get(command.value) is future:
+                self._pending.pop(command.value)
+
+    def _close_stream(self) -> None:
+        """Close the datagram stream (failing any outstanding requests)."""
+        if self._reader_task:
+            self._reader_task.cancel()
+            self._reader_task = None
+
+        self._fail_pending(SocketError("The connection was closed"))
+
+        if self._stream:
+            self._stream.close()
+            self._stream = None
+
+    async def _open_stream(self) -> None:
+        """Open the datagram stream.
 
         Raises
         ------
@@ -158,19 +959,50 @@ class Client:
         """
         try:
             async with asyncio.timeout(self._request_timeout):
-                self._stream = await asyncio_dgram.connect((self._ip, self._port))
+                if self._endpoint:
+                    self._stream = await self._endpoint.register(
+                        self._ip,
+                        self._port,
+                        self._handle_response,
+                        on_lost=self._fail_pending,
+                    )
+                else:
+                    import asyncio_dgram  # pylint: disable=import-outside-toplevel
+
+                    self._stream = await asyncio_dgram.connect((self._ip, self._port))
         except TimeoutError as err:
             msg = "Connection to device timed out"
             raise SocketError(msg) from err
+        except OSError as err:
+            # (e.g., the device's hostname can't be resolved)
+            msg = f"Unable to connect to the device: {err}"
+            raise SocketError(msg) from err
+
+    async def connect(self) -> None:
+        """Connect to the Guardian device."""
+        await self._open_stream()
+        if self._health is not None:
+            self._health.start()
 
     def disconnect(self) -> None:
         """Close the connection."""
-        if self._stream:
-            self._stream.close()
-            self._stream = None
+        if self._health is not None:
+            self._health.stop()
+        if self._restart_task:
+            self._restart_task.cancel()
+            self._restart_task = None
+        # Release any held commands (which then fail, since we're disconnected):
+        self._ready.set()
+        self._close_stream()
 
     async def execute_raw_command(
-        self, command_code: int, *, params: dict | None = None, silent: bool = True
+        self,
+        command_code: int,
+        *,
+        params: dict | None = None,
+        silent: bool = True,
+        use_cache: bool = True,
+        retry_policy: RetryPolicy | None = None,
     ) -> dict[str, Any]:
         """Execute a command via its integer-based command code.
 
@@ -179,6 +1011,10 @@ class Client:
             command_code: The command code to execute.
             params: Any parameters to send along with the command.
             silent: If ``True``, silence "beep" tones associated with this command.
+            use_cache: If ``False``, always ask the device (even when a cached response
+                exists).
+            retry_policy: A retry policy to use instead of the client's (e.g., to give
+                an urgent command a short timeout).
 
         Returns:
         -------
@@ -186,4 +1022,62 @@ class Client:
 
         """
         command = get_command_from_code(command_code)
-        return await self._execute_command(command, params=params, silent=silent)
+        return await self._execute_command(
+            command,
+            params=params,
+            silent=silent,
+            use_cache=use_cache,
+            retry_policy=retry_policy,
+        )
+
+    async def reconnect(self) -> None:
+        """Recreate the connection to the device.
+
+        Outstanding requests fail; the device's address is resolved again.
+        """
+        self._close_stream()
+        await self._open_stream()
+
+    async def watch(
+        self,
+        *commands: Command,
+        max_queue_size: int | None = None,
+        overflow: Overflow | None = None,
+    ) -> AsyncGenerator[PollUpdate, None]:
+        """Iterate over changes in the device's state.
+
+        Every watcher of a client shares a single polling loop, which only polls the
+        commands that are being watched.
+
+        Args:
+        ----
+            *commands: The commands to watch (any of ``SENSOR_PAIRED_SENSOR_STATUS``,
+                ``SYSTEM_ONBOARD_SENSOR_STATUS``, ``VALVE_STATUS``, and
+                ``WIFI_STATUS``; all of them if omitted).
+            max_queue_size: The maximum number of updates to hold for this watcher.
+            overflow: What to do when this watcher falls behind and its queue is full
+                (coalesce updates by default).
+
+        Yields:
+        ------
+            Updates, in the order they happened.
+
+        """
+        if self._poller is None:
+            # pylint: disable-next=import-outside-toplevel
+            from aioguardian.poller import Poller
+
+            self._poller = Poller(self, subscribed_only=True)
+
+        kwargs: dict[str, Any] = {}
+        if max_queue_size is not None:
+            kwargs["max_queue_size"] = max_queue_size
+        if overflow is not None:
+            kwargs["overflow"] = overflow
+
+        # Close the poller's iterator right away so that its watcher is released:
+        async with contextlib.aclosing(
+            self._poller.watch(*commands, **kwargs)
+        ) as updates:
+            async for update in updates:
+                yield update
@@ -2,22 +2,73 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
-from typing import Any
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+import functools
+import time
+from typing import TYPE_CHECKING, Any, cast
 
-import voluptuous as vol
-
-from aioguardian.errors import CommandError
+from aioguardian.errors import GuardianError
 from aioguardian.helpers.command import Command
-import aioguardian.helpers.config_validation as cv
+from aioguardian.helpers.concurrency import as_completed_bounded
+from aioguardian.helpers.validation import ParamValidator, is_uid
+from aioguardian.models import PairedSensorStatus
+
+if TYPE_CHECKING:
+    import voluptuous as vol
+
+DEFAULT_MAX_CONCURRENCY = 4
+# The number of seconds the UIDs of the paired sensors are remembered for (sensors are
+# rarely paired or unpaired, so there's no need to look them up for every batch):
+PAIRED_UIDS_TTL = 60.0
 
 PARAM_UID = "uid"
 
-PAIRED_SENSOR_UID_SCHEMA: vol.Schema = vol.Schema(
-    {vol.Required(PARAM_UID): vol.All(cv.alphanumeric, vol.Length(max=12))}
+
+def _build_paired_sensor_uid_schema() -> vol.Schema:
+    """Build the schema for the parameters of commands that target a paired sensor.
+
+    Returns
+    -------
+        A voluptuous schema.
+
+    """
+    import voluptuous as vol  # pylint: disable=import-outside-toplevel
+
+    import aioguardian.helpers.config_validation as cv  # pylint: disable=import-outside-toplevel
+
+    return vol.Schema(
+        {vol.Required(PARAM_UID): vol.All(cv.alphanumeric, vol.Length(max=12))}
+    )
+
+
+PAIRED_SENSOR_UID_VALIDATOR = ParamValidator(
+    {PARAM_UID: is_uid}, _build_paired_sensor_uid_schema, required=[PARAM_UID]
 )
 
 
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Return the voluptuous schema (built lazily) for backward compatibility.
+
+    Args:
+    ----
+        name: The name of the attribute.
+
+    Returns:
+    -------
+        The attribute.
+
+    Raises:
+    ------
+        AttributeError: Raised when the module has no such attribute.
+
+    """
+    if name == "PAIRED_SENSOR_UID_SCHEMA":
+        return PAIRED_SENSOR_UID_VALIDATOR.schema
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
 class SensorCommands:
     """Define an object to manage sensor commands.
 
@@ -25,6 +76,9 @@ class SensorCommands:
     automatically be added to the :meth:`Client <aioguardian.Client>` (as
     ``client.sensor``).
 
+    The UIDs of the paired sensors are remembered for ``PAIRED_UIDS_TTL`` seconds
+    (forgetting them as soon as a sensor is paired or unpaired through this object).
+
     Args:
     ----
         execute_command: The execute_command method from the Client object.
@@ -42,6 +96,111 @@ class SensorCommands:
 
         """
         self._execute_command = execute_command
+        self._paired_uids: list[str] | None = None
+        self._paired_uids_expire_at = 0.0
+
+    async def _get_paired_uids(self, *, silent: bool) -> list[str]:
+        """Return the UIDs of the paired sensors (retrieving them if needed).
+
+        Args:
+        ----
+            silent: Whether the valve controller should beep upon successful command.
+
+        Returns:
+        -------
+            A list of UIDs.
+
+        """
+        if self._paired_uids is None or time.monotonic() >= self._paired_uids_expire_at:
+            await self.pair_dump(silent=silent)
+        return cast("list[str]", self._paired_uids)
+
+    async def all_paired_sensor_statuses(
+        self,
+        *,
+        uids: Iterable[str] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        silent: bool = True,
+    ) -> dict[str, dict[str, Any] | GuardianError]:
+        """Get the status of every paired sensor.
+
+        If a particular sensor's status can't be retrieved, its entry contains the error
+        rather than the response.
+
+        Args:
+        ----
+            uids: The UIDs of the sensors to query (if not provided, the UIDs are
+                retrieved via :meth:`pair_dump`, unless they were retrieved recently).
+            max_concurrency: The maximum number of status requests allowed in flight
+                at once (the client still sends a device one status request at a time).
+            silent: Whether the valve controller should beep upon successful command.
+
+        Returns:
+        -------
+            A dictionary of sensor UIDs to API response payloads (or errors).
+
+        """
+        return {
+            uid: result
+            async for uid, result in self.iter_paired_sensor_statuses(
+                uids=uids, max_concurrency=max_concurrency, silent=silent
+            )
+        }
+
+    async def get_paired_sensor_status(
+        self, uid: str, *, silent: bool = True
+    ) -> PairedSensorStatus:
+        """Get the status of a paired sensor as a typed model.
+
+        Args:
+        ----
+            uid: A UID of a Guardian paired sensor.
+            silent: Whether the valve controller should beep upon successful command.
+
+        Returns:
+        -------
+            The status of the paired sensor.
+
+        """
+        data = await self.paired_sensor_status(uid, silent=silent)
+        return PairedSensorStatus.from_payload(data["data"])
+
+    async def iter_paired_sensor_statuses(
+        self,
+        *,
+        uids: Iterable[str] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        silent: bool = True,
+    ) -> AsyncIterator[tuple[str, dict[str, Any] | GuardianError]]:
+        """Get the status of every paired sensor, yielding each one as it arrives.
+
+        If a particular sensor's status can't be retrieved, the error is yielded in
+        place of the response.
+
+        Args:
+        ----
+            uids: The UIDs of the sensors to query (if not provided, the UIDs are
+                retrieved via :meth:`pair_dump`, unless they were retrieved recently).
+            max_concurrency: The maximum number of status requests allowed in flight
+                at once (the client still sends a device one status request at a time).
+            silent: Whether the valve controller should beep upon successful command.
+
+        Yields:
+        ------
+            Tuples of sensor UID and API response payload (or error).
+
+        """
+        if uids is None:
+            uids = await self._get_paired_uids(silent=silent)
+
+        async for uid, result in as_completed_bounded(
+            {
+                uid: functools.partial(self.paired_sensor_status, uid, silent=silent)
+                for uid in uids
+            },
+            asyncio.Semaphore(max_concurrency),
+        ):
+            yield uid, result
 
     async def pair_dump(self, *, silent: bool = True) -> dict[str, Any]:
         """Dump information on all paired sensors.
@@ -55,7 +214,10 @@ class SensorCommands:
             An API response payload.
 
         """
-        return await self._execute_command(Command.SENSOR_PAIR_DUMP, silent=silent)
+        data = await self._execute_command(Command.SENSOR_PAIR_DUMP, silent=silent)
+        self._paired_uids = data["data"]["paired_uids"]
+        self._paired_uids_expire_at = time.monotonic() + PAIRED_UIDS_TTL
+        return data
 
     async def pair_sensor(self, uid: str, *, silent: bool = True) -> dict[str, Any]:
         """Pair a new sensor to the device.
@@ -75,16 +237,16 @@ class SensorCommands:
 
         """
         params = {PARAM_UID: uid}
+        PAIRED_SENSOR_UID_VALIDATOR(params)
 
         try:
-            PAIRED_SENSOR_UID_SCHEMA(params)
-        except vol.Invalid as err:
-            msg = f"Invalid parameters provided: {err}"
-            raise CommandError(msg) from err
-
-        return await self._execute_command(
-            Command.SENSOR_PAIR_SENSOR, params=params, silent=silent
-        )
+            return await self._execute_command(
+                Command.SENSOR_PAIR_SENSOR, params=params, silent=silent
+            )
+        finally:
+            # Whether or not the device acknowledged it, the paired sensors may have
+            # changed:
+            self._paired_uids = None
 
     async def paired_sensor_status(
         self, uid: str, *, silent: bool = True
@@ -106,12 +268,7 @@ class SensorCommands:
 
         """
         params = {PARAM_UID: uid}
-
-        try:
-            PAIRED_SENSOR_UID_SCHEMA(params)
-        except vol.Invalid as err:
-            msg = f"Invalid parameters provided: {err}"
-            raise CommandError(msg) from err
+        PAIRED_SENSOR_UID_VALIDATOR(params)
 
         return await self._execute_command(
             Command.SENSOR_PAIRED_SENSOR_STATUS, params=params, silent=silent
@@ -135,13 +292,13 @@ class SensorCommands:
 
         """
         params = {PARAM_UID: uid}
+        PAIRED_SENSOR_UID_VALIDATOR(params)
 
         try:
-            PAIRED_SENSOR_UID_SCHEMA(params)
-        except vol.Invalid as err:
-            msg = f"Invalid parameters provided: {err}"
-            raise CommandError(msg) from err
-
-        return await self._execute_command(
-            Command.SENSOR_UNPAIR_SENSOR, params=params, silent=silent
-        )
+            return await self._execute_command(
+                Command.SENSOR_UNPAIR_SENSOR, params=params, silent=silent
+            )
+        finally:
+            # Whether or not the device acknowledged it, the paired sensors may have
+            # changed:
+            self._paired_uids = None
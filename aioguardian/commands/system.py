@@ -2,29 +2,74 @@
 
 from __future__ import annotations
 
-import asyncio
 from collections.abc import Awaitable, Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import voluptuous as vol
-
-from aioguardian.errors import CommandError
 from aioguardian.helpers.command import Command
-import aioguardian.helpers.config_validation as cv
+from aioguardian.helpers.validation import ParamValidator, is_int, is_str, is_url
+from aioguardian.models import Diagnostics, OnboardSensorStatus
+
+if TYPE_CHECKING:
+    import voluptuous as vol
 
 PARAM_FILENAME = "filename"
 PARAM_PORT = "port"
 PARAM_URL = "url"
 
-UPGRADE_FIRMWARE_PARAM_SCHEMA = vol.Schema(
+
+def _build_upgrade_firmware_param_schema() -> vol.Schema:
+    """Build the schema for the parameters of the firmware upgrade command.
+
+    Returns
+    -------
+        A voluptuous schema.
+
+    """
+    import voluptuous as vol  # pylint: disable=import-outside-toplevel
+
+    import aioguardian.helpers.config_validation as cv  # pylint: disable=import-outside-toplevel
+
+    return vol.Schema(
+        {
+            vol.Optional(PARAM_URL): vol.All(cv.url, vol.Length(max=256)),
+            vol.Optional(PARAM_PORT): int,
+            vol.Optional(PARAM_FILENAME): vol.All(str, vol.Length(max=48)),
+        }
+    )
+
+
+UPGRADE_FIRMWARE_PARAM_VALIDATOR = ParamValidator(
     {
-        vol.Optional(PARAM_URL): vol.All(cv.url, vol.Length(max=256)),
-        vol.Optional(PARAM_PORT): int,
-        vol.Optional(PARAM_FILENAME): vol.All(str, vol.Length(max=48)),
-    }
+        PARAM_URL: is_url(max_length=256),
+        PARAM_PORT: is_int,
+        PARAM_FILENAME: is_str(max_length=48),
+    },
+    _build_upgrade_firmware_param_schema,
 )
 
 
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Return the voluptuous schema (built lazily) for backward compatibility.
+
+    Args:
+    ----
+        name: The name of the attribute.
+
+    Returns:
+    -------
+        The attribute.
+
+    Raises:
+    ------
+        AttributeError: Raised when the module has no such attribute.
+
+    """
+    if name == "UPGRADE_FIRMWARE_PARAM_SCHEMA":
+        return UPGRADE_FIRMWARE_PARAM_VALIDATOR.schema
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
 class SystemCommands:
     """Define an object to manage system commands.
 
@@ -67,6 +112,9 @@ class SystemCommands:
     async def factory_reset(self, *, silent: bool = True) -> dict[str, Any]:
         """Perform a factory reset on the device.
 
+        The device restarts shortly after acknowledging the command; the client holds
+        any further commands until it's back.
+
         Args:
         ----
             silent: Whether the valve controller should beep upon successful command.
@@ -78,6 +126,38 @@ class SystemCommands:
         """
         return await self._execute_command(Command.SYSTEM_FACTORY_RESET, silent=silent)
 
+    async def get_diagnostics(self, *, silent: bool = True) -> Diagnostics:
+        """Retrieve diagnostics info as a typed model.
+
+        Args:
+        ----
+            silent: Whether the valve controller should beep upon successful command.
+
+        Returns:
+        -------
+            The diagnostics info.
+
+        """
+        data = await self.diagnostics(silent=silent)
+        return Diagnostics.from_payload(data["data"])
+
+    async def get_onboard_sensor_status(
+        self, *, silent: bool = True
+    ) -> OnboardSensorStatus:
+        """Retrieve the status of the onboard sensors as a typed model.
+
+        Args:
+        ----
+            silent: Whether the valve controller should beep upon successful command.
+
+        Returns:
+        -------
+            The status of the onboard sensors.
+
+        """
+        data = await self.onboard_sensor_status(silent=silent)
+        return OnboardSensorStatus.from_payload(data["data"])
+
     async def onboard_sensor_status(self, *, silent: bool = True) -> dict[str, Any]:
         """Retrieve status of the valve controller's onboard sensors.
 
@@ -111,6 +191,9 @@ class SystemCommands:
     async def reboot(self, *, silent: bool = True) -> dict[str, Any]:
         """Reboot the device.
 
+        The device restarts shortly after acknowledging the command; the client holds
+        any further commands until it's back.
+
         Args:
         ----
             silent: Whether the valve controller should beep upon successful command.
@@ -120,15 +203,7 @@ class SystemCommands:
             An API response payload.
 
         """
-        data = await self._execute_command(Command.SYSTEM_REBOOT, silent=silent)
-
-        # The Guardian API docs indicate that the reboot will occur "3 seconds after
-        # command is received." In order to guard against errors from subsequent
-        # commands while the reboot is occurring, we sleep for 3 seconds before
-        # returning the response:
-        await asyncio.sleep(3)
-
-        return data
+        return await self._execute_command(Command.SYSTEM_REBOOT, silent=silent)
 
     async def upgrade_firmware(
         self,
@@ -140,6 +215,9 @@ class SystemCommands:
     ) -> dict[str, Any]:
         """Upgrade the firmware on the device.
 
+        The device restarts once the upgrade is installed; the client holds any
+        further commands until it's back.
+
         Args:
         ----
             url: A Guardian-provided URL that hosts firmware files.
@@ -164,11 +242,7 @@ class SystemCommands:
         if filename:
             params["filename"] = filename
 
-        try:
-            UPGRADE_FIRMWARE_PARAM_SCHEMA(params)
-        except vol.Invalid as err:
-            msg = f"Invalid parameters provided: {err}"
-            raise CommandError(msg) from err
+        UPGRADE_FIRMWARE_PARAM_VALIDATOR(params)
 
         return await self._execute_command(
             Command.SYSTEM_UPGRADE_FIRMWARE, params=params, silent=silent
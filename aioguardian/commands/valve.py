@@ -7,22 +7,15 @@ from typing import Any
 
 from aioguardian.const import LOGGER
 from aioguardian.helpers.command import Command
+from aioguardian.models import ValveState, ValveStatus
 
-VALVE_STATE_MAPPING = {
-    0: "default",
-    1: "start_opening",
-    2: "opening",
-    3: "finish_opening",
-    4: "opened",
-    5: "start_closing",
-    6: "closing",
-    7: "finish_closing",
-    8: "closed",
-    9: "start_halt",
-    10: "stalled",
-    11: "free_spin",
-    12: "halted",
-}
+VALVE_STATE_MAPPING = {state.value: state.name.lower() for state in ValveState}
+
+# The states the valve passes through while it is moving (every other state is one the
+# valve rests in):
+VALVE_TRANSITIONAL_STATES = frozenset(
+    state.name.lower() for state in ValveState if state.transitional
+)
 
 
 class ValveCommands:
@@ -60,6 +53,21 @@ class ValveCommands:
         """
         return await self._execute_command(Command.VALVE_CLOSE)
 
+    async def get_status(self, *, silent: bool = True) -> ValveStatus:
+        """Retrieve status of the valve as a typed model.
+
+        Args:
+        ----
+            silent: Whether the valve controller should beep upon successful command.
+
+        Returns:
+        -------
+            The status of the valve.
+
+        """
+        data = await self._execute_command(Command.VALVE_STATUS, silent=silent)
+        return ValveStatus.from_payload(data["data"])
+
     async def halt(self) -> dict[str, Any]:
         """Halt the valve.
 
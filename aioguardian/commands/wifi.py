@@ -3,24 +3,66 @@
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import voluptuous as vol
-
-from aioguardian.errors import CommandError
 from aioguardian.helpers.command import Command
+from aioguardian.helpers.validation import ParamValidator, is_str
+from aioguardian.models import WiFiScanRecord
+
+if TYPE_CHECKING:
+    import voluptuous as vol
 
 PARAM_PASSWORD = "password"  # noqa: S105, # nosec
 PARAM_SSID = "ssid"
 
-WIFI_CONFIGURE_PARAM_SCHEMA = vol.Schema(
-    {
-        vol.Required(PARAM_SSID): vol.All(str, vol.Length(max=36)),
-        vol.Required(PARAM_PASSWORD): vol.All(str, vol.Length(max=64)),
-    }
+
+def _build_wifi_configure_param_schema() -> vol.Schema:
+    """Build the schema for the parameters of the WiFi configuration command.
+
+    Returns
+    -------
+        A voluptuous schema.
+
+    """
+    import voluptuous as vol  # pylint: disable=import-outside-toplevel
+
+    return vol.Schema(
+        {
+            vol.Required(PARAM_SSID): vol.All(str, vol.Length(max=36)),
+            vol.Required(PARAM_PASSWORD): vol.All(str, vol.Length(max=64)),
+        }
+    )
+
+
+WIFI_CONFIGURE_PARAM_VALIDATOR = ParamValidator(
+    {PARAM_SSID: is_str(max_length=36), PARAM_PASSWORD: is_str(max_length=64)},
+    _build_wifi_configure_param_schema,
+    required=[PARAM_SSID, PARAM_PASSWORD],
 )
 
 
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Return the voluptuous schema (built lazily) for backward compatibility.
+
+    Args:
+    ----
+        name: The name of the attribute.
+
+    Returns:
+    -------
+        The attribute.
+
+    Raises:
+    ------
+        AttributeError: Raised when the module has no such attribute.
+
+    """
+    if name == "WIFI_CONFIGURE_PARAM_SCHEMA":
+        return WIFI_CONFIGURE_PARAM_VALIDATOR.schema
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
 class WiFiCommands:
     """Define an object to manage WiFi commands.
 
@@ -68,11 +110,7 @@ class WiFiCommands:
         """
         params = {PARAM_SSID: ssid, PARAM_PASSWORD: password}
 
-        try:
-            WIFI_CONFIGURE_PARAM_SCHEMA(params)
-        except vol.Invalid as err:
-            msg = f"Invalid parameters provided: {err}"
-            raise CommandError(msg) from err
+        WIFI_CONFIGURE_PARAM_VALIDATOR(params)
 
         return await self._execute_command(
             Command.WIFI_CONFIGURE, params=params, silent=silent
@@ -106,6 +144,23 @@ class WiFiCommands:
         """
         return await self._execute_command(Command.WIFI_ENABLE_AP, silent=silent)
 
+    async def get_scan_records(self, *, silent: bool = True) -> list[WiFiScanRecord]:
+        """List previously scanned nearby SSIDs as typed models.
+
+        Args:
+        ----
+            silent: Whether the valve controller should beep upon successful command.
+
+        Returns:
+        -------
+            The nearby SSIDs.
+
+        """
+        data = await self.list(silent=silent)
+        return [
+            WiFiScanRecord.from_payload(record) for record in data["data"]["records"]
+        ]
+
     async def list(self, *, silent: bool = True) -> dict[str, Any]:
         """List previously scanned nearby SSIDs.
 
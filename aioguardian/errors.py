@@ -25,10 +25,22 @@ class CommandError(GuardianError):
     """Define an error related to commands (invalid commands, invalid params, etc.)."""
 
 
+class PreemptedError(GuardianError):
+    """Define an error for a waiting request cancelled in favor of a more urgent one."""
+
+
+class RolloutError(GuardianError):
+    """Define an error related to firmware rollouts (failed upgrades, halts, etc.)."""
+
+
 class SocketError(GuardianError):
     """Define an error related to UDP socket issues."""
 
 
+class CircuitOpenError(SocketError):
+    """Define an error raised (without sending anything) for an unreachable device."""
+
+
 def _raise_on_command_error(command: Command, data: dict[str, Any]) -> None:
     """Examine a data response and raise errors appropriately.
 
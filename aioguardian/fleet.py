@@ -0,0 +1,294 @@
+"""Define an object to interact with many Guardian devices at once."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+import functools
+from types import TracebackType
+from typing import Any
+
+from typing_extensions import Self  # noqa: UP035
+
+from aioguardian.client import (
+    DEFAULT_COMMAND_RETRIES,
+    DEFAULT_PORT,
+    DEFAULT_REQUEST_TIMEOUT,
+    Client,
+    get_command_class,
+)
+from aioguardian.const import LOGGER
+from aioguardian.errors import GuardianError
+from aioguardian.health import HealthPolicy
+from aioguardian.helpers.concurrency import as_completed_bounded
+from aioguardian.helpers.datagram import DatagramEndpoint
+from aioguardian.helpers.metrics import MetricsRecorder
+from aioguardian.helpers.retry import RetryPolicy
+
+DEFAULT_MAX_CONCURRENCY: int = 64
+
+FleetResult = dict[str, Any] | GuardianError
+
+
+class FleetCommands:  # pylint: disable=too-few-public-methods
+    """Define an object that runs a group of commands against every device in a fleet.
+
+    Note that this class shouldn't be instantiated directly; an instance of it will
+    automatically be added to the :meth:`Fleet <aioguardian.Fleet>` for each command
+    group (e.g., ``fleet.valve``). Any method of the matching command class can be
+    called on it; the result is a dictionary of IP addresses to responses.
+
+    Args:
+    ----
+        fleet: The fleet to run commands against.
+        group: The name of the command group (e.g., ``"valve"``).
+
+    """
+
+    def __init__(self, fleet: Fleet, group: str) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            fleet: The fleet to run commands against.
+            group: The name of the command group (e.g., ``"valve"``).
+
+        """
+        self._fleet = fleet
+        self._group = group
+
+    def __getattr__(
+        self, name: str
+    ) -> Callable[..., Awaitable[dict[str, FleetResult]]]:
+        """Return a coroutine function that runs a command across the fleet.
+
+        Args:
+        ----
+            name: The name of the command method.
+
+        Returns:
+        -------
+            A coroutine function with the same arguments as the command method.
+
+        Raises:
+        ------
+            AttributeError: Raised when the command group has no such command.
+
+        """
+        command_class = get_command_class(self._group)
+        if name.startswith("_") or not hasattr(command_class, name):
+            msg = f"{command_class.__name__} has no command named {name}"
+            raise AttributeError(msg)
+
+        async def execute(*args: object, **kwargs: object) -> dict[str, FleetResult]:
+            """Run the command against every device.
+
+            Args:
+            ----
+                *args: Positional arguments for the command.
+                **kwargs: Keyword arguments for the command.
+
+            Returns:
+            -------
+                A dictionary of IP addresses to responses.
+
+            """
+            return await self._fleet.execute(
+                lambda client: getattr(getattr(client, self._group), name)(
+                    *args, **kwargs
+                )
+            )
+
+        return execute
+
+
+class Fleet:
+    """Define an object that can send commands to many Guardian devices at once.
+
+    Every device shares a single UDP socket, and the number of commands in flight
+    across the whole fleet is capped.
+
+    Args:
+    ----
+        ip_addresses: The IP addresses or hostnames of Guardian valve controllers.
+        port: The port to connect to.
+        request_timeout: The number of seconds to wait before timing out a request.
+        command_retries: The number of retries to use on a failed command.
+        max_concurrency: The maximum number of devices to talk to at the same time.
+        retry_policy: An optional policy for retrying timed out commands (overrides
+            ``command_retries``).
+        metrics_factory: An optional callable that returns a recorder of request
+            metrics for a device (given its IP address).
+        health: An optional policy for supervising the health of each device's
+            connection.
+
+    """
+
+    def __init__(
+        self,
+        ip_addresses: Iterable[str],
+        *,
+        port: int = DEFAULT_PORT,
+        request_timeout: int = DEFAULT_REQUEST_TIMEOUT,
+        command_retries: int = DEFAULT_COMMAND_RETRIES,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        retry_policy: RetryPolicy | None = None,
+        metrics_factory: Callable[[str], MetricsRecorder] | None = None,
+        health: HealthPolicy | None = None,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            ip_addresses: The IP addresses or hostnames of Guardian valve controllers.
+            port: The port to connect to.
+            request_timeout: The number of seconds to wait before timing out a request.
+            command_retries: The number of retries to use on a failed command.
+            max_concurrency: The maximum number of devices to talk to at the same
+                time.
+            retry_policy: An optional policy for retrying timed out commands
+                (overrides ``command_retries``).
+            metrics_factory: An optional callable that returns a recorder of request
+                metrics for a device (given its IP address).
+            health: An optional policy for supervising the health of each device's
+                connection.
+
+        """
+        self._endpoint = DatagramEndpoint()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        self.connect_errors: dict[str, GuardianError] = {}
+        self.clients: dict[str, Client] = {
+            ip_address: Client(
+                ip_address,
+                port=port,
+                request_timeout=request_timeout,
+                command_retries=command_retries,
+                endpoint=self._endpoint,
+                retry_policy=retry_policy,
+                metrics=metrics_factory(ip_address) if metrics_factory else None,
+                health=health,
+            )
+            for ip_address in ip_addresses
+        }
+
+        self.iot = FleetCommands(self, "iot")
+        self.sensor = FleetCommands(self, "sensor")
+        self.system = FleetCommands(self, "system")
+        self.valve = FleetCommands(self, "valve")
+        self.wifi = FleetCommands(self, "wifi")
+
+    async def __aenter__(self) -> Self:
+        """Define an entry point into this object via a context manager.
+
+        Returns
+        -------
+            A connected fleet.
+
+        """
+        await self.connect()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Define an exit point out of this object via a context manager.
+
+        Args:
+        ----
+            exc_type: An optional exception if one caused the context manager to close.
+            exc_val: The value of the optional exception
+            exc_tb: The traceback of the optional exception
+
+        """
+        self.disconnect()
+
+    async def as_completed(
+        self, func: Callable[[Client], Awaitable[dict[str, Any]]]
+    ) -> AsyncIterator[tuple[str, FleetResult]]:
+        """Run a coroutine function against every device, yielding results as they land.
+
+        Errors raised by an individual device (e.g., a timeout) are yielded in place of
+        that device's response rather than raised.
+
+        Args:
+        ----
+            func: A coroutine function that accepts a client and returns a response.
+
+        Yields:
+        ------
+            Tuples of IP address and response (or error).
+
+        """
+        async for ip_address, result in as_completed_bounded(
+            {
+                ip_address: functools.partial(func, client)
+                for ip_address, client in self.clients.items()
+            },
+            self._semaphore,
+        ):
+            yield ip_address, result
+
+    async def connect(self) -> dict[str, GuardianError]:
+        """Open the shared socket and register every device with it.
+
+        A device that can't be connected to (e.g., its hostname can't be resolved)
+        doesn't stop the rest from connecting; commands sent to it fail like those to
+        any other unreachable device.
+
+        Returns
+        -------
+            A dictionary of IP addresses to errors for the devices that couldn't be
+            connected to (also available as ``connect_errors``).
+
+        """
+        await self._endpoint.open()
+
+        results = await asyncio.gather(
+            *(client.connect() for client in self.clients.values()),
+            return_exceptions=True,
+        )
+
+        self.connect_errors = {}
+        for ip_address, result in zip(self.clients, results, strict=True):
+            if result is None:
+                continue
+            if not isinstance(result, GuardianError):
+                # Anything else is a bug rather than an unreachable device, so nothing
+                # is left half-open:
+                self.disconnect()
+                raise result
+            LOGGER.warning("Unable to connect to %s: %s", ip_address, result)
+            self.connect_errors[ip_address] = result
+
+        return self.connect_errors
+
+    def disconnect(self) -> None:
+        """Close the shared socket."""
+        for client in self.clients.values():
+            client.disconnect()
+        self._endpoint.close()
+
+    async def execute(
+        self, func: Callable[[Client], Awaitable[dict[str, Any]]]
+    ) -> dict[str, FleetResult]:
+        """Run a coroutine function against every device.
+
+        Errors raised by an individual device (e.g., a timeout) are returned in place of
+        that device's response rather than raised.
+
+        Args:
+        ----
+            func: A coroutine function that accepts a client and returns a response.
+
+        Returns:
+        -------
+            A dictionary of IP addresses to responses (or errors).
+
+        """
+        return {
+            ip_address: result async for ip_address, result in self.as_completed(func)
+        }
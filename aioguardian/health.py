@@ -0,0 +1,169 @@
+"""Define an object to supervise the health of a connection to a Guardian device."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import contextlib
+from dataclasses import dataclass
+from enum import StrEnum
+
+from aioguardian.const import LOGGER
+from aioguardian.errors import CircuitOpenError, GuardianError
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_IDLE_PING_INTERVAL = 60.0
+DEFAULT_PROBE_INTERVAL = 30.0
+
+
+class HealthState(StrEnum):
+    """Define the health of a connection to a device."""
+
+    # The last request got a response:
+    HEALTHY = "healthy"
+    # Recent requests have failed, but not enough of them to give up on the device:
+    DEGRADED = "degraded"
+    # Enough requests have failed in a row that requests fail fast (without being
+    # sent) until a background probe gets a response:
+    OPEN = "open"
+
+
+@dataclass(frozen=True, kw_only=True)
+class HealthPolicy:
+    """Define how the health of a connection is supervised.
+
+    Attributes
+    ----------
+        failure_threshold: The number of requests that must fail in a row to open the
+            circuit.
+        idle_ping_interval: The number of seconds without any requests after which
+            the device is pinged.
+        probe_interval: The number of seconds between attempts to reach the device
+            while the circuit is open (each of which recreates the connection first).
+
+    """
+
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD
+    idle_ping_interval: float = DEFAULT_IDLE_PING_INTERVAL
+    probe_interval: float = DEFAULT_PROBE_INTERVAL
+
+
+class HealthSupervisor:
+    """Define an object that tracks the health of a connection and keeps it alive.
+
+    Note that this class shouldn't be instantiated directly; pass a
+    :class:`HealthPolicy` to :meth:`Client <aioguardian.Client>` as ``health`` and
+    read the supervisor from ``client.health``.
+
+    Args:
+    ----
+        policy: The health policy.
+        ping: A coroutine function that pings the device (regardless of its health).
+        reconnect: A coroutine function that recreates the connection to the device.
+
+    """
+
+    def __init__(
+        self,
+        policy: HealthPolicy,
+        ping: Callable[[], Awaitable[object]],
+        reconnect: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            policy: The health policy.
+            ping: A coroutine function that pings the device (regardless of its
+                health).
+            reconnect: A coroutine function that recreates the connection to the
+                device.
+
+        """
+        self._last_activity = 0.0
+        self._ping = ping
+        self._policy = policy
+        self._reconnect = reconnect
+        self._task: asyncio.Task | None = None
+        self.consecutive_failures = 0
+
+    @property
+    def state(self) -> HealthState:
+        """Return the health of the connection.
+
+        Returns
+        -------
+            The health state.
+
+        """
+        if not self.consecutive_failures:
+            return HealthState.HEALTHY
+        if self.consecutive_failures < self._policy.failure_threshold:
+            return HealthState.DEGRADED
+        return HealthState.OPEN
+
+    async def _run(self) -> None:
+        """Ping the device while idle and probe it while the circuit is open."""
+        loop = asyncio.get_running_loop()
+        self._last_activity = loop.time()
+
+        while True:
+            if self.state == HealthState.OPEN:
+                interval = self._policy.probe_interval
+            else:
+                interval = self._policy.idle_ping_interval
+            if (delay := self._last_activity + interval - loop.time()) > 0:
+                await asyncio.sleep(delay)
+                # Requests may have happened (or the circuit may have opened) while we
+                # slept, so check again:
+                continue
+
+            # The outcome is recorded by the request itself:
+            with contextlib.suppress(GuardianError):
+                if self.state == HealthState.OPEN:
+                    LOGGER.debug("Recreating the connection before probing the device")
+                    await self._reconnect()
+                await self._ping()
+            # Even if the ping didn't record anything (e.g., the client was
+            # disconnected), wait a full interval before the next one:
+            self._last_activity = max(self._last_activity, loop.time())
+
+    def check(self) -> None:
+        """Raise if the circuit is open.
+
+        Raises
+        ------
+            CircuitOpenError: Raised when the circuit is open.
+
+        """
+        if self.consecutive_failures >= self._policy.failure_threshold:
+            msg = (
+                f"The device is unreachable ({self.consecutive_failures} failed "
+                "requests in a row)"
+            )
+            raise CircuitOpenError(msg)
+
+    def record_failure(self) -> None:
+        """Record a request that got no response."""
+        self.consecutive_failures += 1
+        self._last_activity = asyncio.get_running_loop().time()
+        if self.consecutive_failures == self._policy.failure_threshold:
+            LOGGER.warning("Device is unreachable; failing requests until it responds")
+
+    def record_success(self) -> None:
+        """Record a request that got a response."""
+        if self.consecutive_failures >= self._policy.failure_threshold:
+            LOGGER.info("Device is reachable again")
+        self.consecutive_failures = 0
+        self._last_activity = asyncio.get_running_loop().time()
+
+    def start(self) -> None:
+        """Start supervising (if not already doing so)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop supervising."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
@@ -0,0 +1,181 @@
+"""Define response cache helpers."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Mapping
+import copy
+import time
+from typing import Any
+
+from aioguardian.helpers.command import (
+    READ_ONLY_COMMANDS,
+    Command,
+    RequestKey,
+    get_request_key,
+)
+
+DEFAULT_MAX_ENTRIES: int = 128
+
+DEFAULT_CACHE_TTLS: dict[Command, float] = {
+    Command.SENSOR_PAIR_DUMP: 60.0,
+    Command.SENSOR_PAIRED_SENSOR_STATUS: 5.0,
+    Command.SYSTEM_DIAGNOSTICS: 300.0,
+    Command.SYSTEM_ONBOARD_SENSOR_STATUS: 5.0,
+    Command.VALVE_STATUS: 1.0,
+    Command.WIFI_LIST: 60.0,
+    Command.WIFI_STATUS: 10.0,
+}
+
+# The cached commands whose responses are made stale by a particular mutating command
+# (mutating commands that aren't listed here invalidate the entire cache):
+INVALIDATIONS: dict[Command, frozenset[Command]] = {
+    Command.IOT_PUBLISH_STATE: frozenset(),
+    Command.SENSOR_PAIR_SENSOR: frozenset(
+        {Command.SENSOR_PAIR_DUMP, Command.SENSOR_PAIRED_SENSOR_STATUS}
+    ),
+    Command.SENSOR_UNPAIR_SENSOR: frozenset(
+        {Command.SENSOR_PAIR_DUMP, Command.SENSOR_PAIRED_SENSOR_STATUS}
+    ),
+    Command.VALVE_CLOSE: frozenset({Command.VALVE_STATUS}),
+    Command.VALVE_HALT: frozenset({Command.VALVE_STATUS}),
+    Command.VALVE_OPEN: frozenset({Command.VALVE_STATUS}),
+    Command.VALVE_RESET: frozenset({Command.VALVE_STATUS}),
+    Command.WIFI_CONFIGURE: frozenset({Command.WIFI_LIST, Command.WIFI_STATUS}),
+    Command.WIFI_DISABLE_AP: frozenset({Command.WIFI_STATUS}),
+    Command.WIFI_ENABLE_AP: frozenset({Command.WIFI_STATUS}),
+    Command.WIFI_RESET: frozenset({Command.WIFI_LIST, Command.WIFI_STATUS}),
+    Command.WIFI_SCAN: frozenset({Command.WIFI_LIST}),
+}
+
+
+class ResponseCache:
+    """Define a cache of responses to read-only commands.
+
+    Entries expire after a per-command TTL, the least recently used entry is evicted
+    once the cache is full, and entries are invalidated when a command that changes
+    their underlying state succeeds.
+
+    Args:
+    ----
+        ttls: A mapping of commands to the number of seconds their responses are cached
+            (commands that aren't listed aren't cached).
+        max_entries: The maximum number of responses to cache.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        ttls: Mapping[Command, float] | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            ttls: A mapping of commands to the number of seconds their responses are
+                cached (commands that aren't listed aren't cached).
+            max_entries: The maximum number of responses to cache.
+
+        """
+        self._entries: OrderedDict[RequestKey, tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._max_entries = max_entries
+        self._ttls = {
+            command: ttl
+            for command, ttl in (DEFAULT_CACHE_TTLS if ttls is None else ttls).items()
+            if command in READ_ONLY_COMMANDS
+        }
+
+    def __len__(self) -> int:
+        """Return the number of cached responses.
+
+        Returns
+        -------
+            The number of cached responses.
+
+        """
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        self._entries.clear()
+
+    def get(
+        self, command: Command, params: dict[str, Any] | None = None
+    ) -> dict[str, Any] | None:
+        """Return a cached response (if one exists and hasn't expired).
+
+        Args:
+        ----
+            command: The command.
+            params: The parameters sent along with the command.
+
+        Returns:
+        -------
+            A copy of the cached API response payload (or ``None``).
+
+        """
+        if command not in self._ttls:
+            return None
+
+        key = get_request_key(command, params)
+        if (entry := self._entries.get(key)) is None:
+            return None
+
+        expires_at, payload = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        # Callers are free to modify the payloads they get back, so each one gets its
+        # own copy:
+        return copy.deepcopy(payload)
+
+    def invalidate(self, *commands: Command) -> None:
+        """Remove every cached response for particular commands.
+
+        Args:
+        ----
+            *commands: The commands to invalidate.
+
+        """
+        for key in [key for key in self._entries if key[0] in commands]:
+            del self._entries[key]
+
+    def record(
+        self,
+        command: Command,
+        params: dict[str, Any] | None,
+        payload: dict[str, Any],
+    ) -> None:
+        """Record the successful response to a command.
+
+        Responses to cacheable commands are stored; responses to mutating commands
+        invalidate whatever they make stale.
+
+        Args:
+        ----
+            command: The command.
+            params: The parameters sent along with the command.
+            payload: The API response payload.
+
+        """
+        if command in READ_ONLY_COMMANDS:
+            if (ttl := self._ttls.get(command)) is None:
+                return
+            key = get_request_key(command, params)
+            self._entries[key] = (time.monotonic() + ttl, copy.deepcopy(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            return
+
+        if (stale_commands := INVALIDATIONS.get(command)) is None:
+            self.clear()
+            return
+
+        self.invalidate(*stale_commands)
@@ -0,0 +1,87 @@
+"""Define request coalescing helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+import copy
+from typing import Any
+
+
+class _Call:  # pylint: disable=too-few-public-methods
+    """Define a request that is in flight."""
+
+    __slots__ = ("followers", "future")
+
+    def __init__(self, future: asyncio.Future[dict[str, Any]]) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            future: The future that resolves to the request's response.
+
+        """
+        self.followers = 0
+        self.future = future
+
+
+class RequestCoalescer:  # pylint: disable=too-few-public-methods
+    """Define an object that collapses identical in-flight requests into one.
+
+    While a request for a particular key is in flight, anyone else who asks for the same
+    key shares its outcome rather than making a request of their own.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._calls: dict[Hashable, _Call] = {}
+
+    async def run(
+        self, key: Hashable, func: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> dict[str, Any]:
+        """Run a request (or join the identical request that is already in flight).
+
+        Args:
+        ----
+            key: A key that identifies the request.
+            func: A coroutine function that makes the request.
+
+        Returns:
+        -------
+            An API response payload.
+
+        """
+        while (call := self._calls.get(key)) is not None:
+            call.followers += 1
+            try:
+                result = await asyncio.shield(call.future)
+            except asyncio.CancelledError:
+                # If the request we joined was cancelled (rather than us), make the
+                # request again:
+                if call.future.cancelled():
+                    continue
+                call.followers -= 1
+                raise
+            return copy.deepcopy(result)
+
+        call = self._calls[key] = _Call(asyncio.get_running_loop().create_future())
+
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            call.future.cancel()
+            raise
+        except Exception as err:
+            if call.followers:
+                call.future.set_exception(err)
+            raise
+        finally:
+            del self._calls[key]
+
+        if not call.followers:
+            return result
+
+        # Callers are free to modify the payloads they get back, so each one gets its
+        # own copy:
+        call.future.set_result(result)
+        return copy.deepcopy(result)
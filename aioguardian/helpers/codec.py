@@ -0,0 +1,185 @@
+"""Define JSON codec helpers."""
+
+from __future__ import annotations
+
+import functools
+import json
+from typing import Any, Protocol
+
+
+class JsonCodec(Protocol):
+    """Define the interface a client uses to encode requests and decode responses."""
+
+    name: str
+
+    def dumps(self, obj: Any) -> bytes:  # noqa: ANN401
+        """Encode an object as JSON.
+
+        Args:
+        ----
+            obj: The object to encode.
+
+        Returns:
+        -------
+            The encoded JSON.
+
+        """
+
+    def loads(self, data: bytes) -> Any:  # noqa: ANN401
+        """Decode JSON.
+
+        Args:
+        ----
+            data: The encoded JSON.
+
+        Returns:
+        -------
+            The decoded object.
+
+        """
+
+
+class MsgspecCodec:
+    """Define a JSON codec that uses ``msgspec``.
+
+    Raises ``ImportError`` on instantiation if ``msgspec`` isn't installed.
+    """
+
+    __slots__ = ("_decoder", "_encoder")
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Initialize."""
+        import msgspec  # type: ignore[import-not-found,unused-ignore]  # pylint: disable=import-outside-toplevel
+
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def dumps(self, obj: Any) -> bytes:  # noqa: ANN401
+        """Encode an object as JSON.
+
+        Args:
+        ----
+            obj: The object to encode.
+
+        Returns:
+        -------
+            The encoded JSON.
+
+        """
+        return self._encoder.encode(obj)  # type: ignore[no-any-return]
+
+    def loads(self, data: bytes) -> Any:  # noqa: ANN401
+        """Decode JSON.
+
+        Args:
+        ----
+            data: The encoded JSON.
+
+        Returns:
+        -------
+            The decoded object.
+
+        """
+        return self._decoder.decode(data)
+
+
+class OrjsonCodec:
+    """Define a JSON codec that uses ``orjson``.
+
+    Raises ``ImportError`` on instantiation if ``orjson`` isn't installed.
+    """
+
+    __slots__ = ("_orjson",)
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Initialize."""
+        import orjson  # pylint: disable=import-outside-toplevel
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:  # noqa: ANN401
+        """Encode an object as JSON.
+
+        Args:
+        ----
+            obj: The object to encode.
+
+        Returns:
+        -------
+            The encoded JSON.
+
+        """
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:  # noqa: ANN401
+        """Decode JSON.
+
+        Args:
+        ----
+            data: The encoded JSON.
+
+        Returns:
+        -------
+            The decoded object.
+
+        """
+        return self._orjson.loads(data)
+
+
+class StdlibCodec:
+    """Define a JSON codec that uses the standard library."""
+
+    __slots__ = ()
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:  # noqa: ANN401
+        """Encode an object as JSON.
+
+        Args:
+        ----
+            obj: The object to encode.
+
+        Returns:
+        -------
+            The encoded JSON.
+
+        """
+        return json.dumps(obj).encode()
+
+    def loads(self, data: bytes) -> Any:  # noqa: ANN401
+        """Decode JSON.
+
+        Args:
+        ----
+            data: The encoded JSON.
+
+        Returns:
+        -------
+            The decoded object.
+
+        """
+        return json.loads(data)
+
+
+@functools.cache
+def get_default_codec() -> JsonCodec:
+    """Return the fastest JSON codec that is installed.
+
+    ``orjson`` is preferred, then ``msgspec``; the standard library is the fallback.
+
+    Returns
+    -------
+        A JSON codec.
+
+    """
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+    return StdlibCodec()
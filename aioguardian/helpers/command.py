@@ -1,6 +1,10 @@
 """Define command helpers."""
 
+from __future__ import annotations
+
 from enum import Enum
+import json
+from typing import Any
 
 from aioguardian.errors import CommandError
 
@@ -32,6 +36,56 @@ class Command(Enum):
     WIFI_SCAN = 37
     WIFI_STATUS = 32
 
+    def frame(self, silent: bool) -> bytes:  # noqa: FBT001
+        """Return the encoded request for this command when it has no parameters.
+
+        Frames are serialized once, when the module is loaded, so parameterless
+        requests skip building and encoding a payload altogether.
+
+        Args:
+        ----
+            silent: If ``True``, silence "beep" tones associated with this command.
+
+        Returns:
+        -------
+            The encoded request payload.
+
+        """
+        return _FRAMES[(self, silent)]
+
+
+_FRAMES: dict[tuple[Command, bool], bytes] = {
+    (command, silent): json.dumps({"command": command.value, "silent": silent}).encode()
+    for command in Command
+    for silent in (False, True)
+}
+
+# Commands that only read device state (and can therefore be safely cached, coalesced,
+# etc.):
+READ_ONLY_COMMANDS = frozenset(
+    {
+        Command.SENSOR_PAIR_DUMP,
+        Command.SENSOR_PAIRED_SENSOR_STATUS,
+        Command.SYSTEM_DIAGNOSTICS,
+        Command.SYSTEM_ONBOARD_SENSOR_STATUS,
+        Command.SYSTEM_PING,
+        Command.VALVE_STATUS,
+        Command.WIFI_LIST,
+        Command.WIFI_STATUS,
+    }
+)
+
+# Commands after which the device restarts (and is unreachable for a little while):
+RESTART_COMMANDS = frozenset(
+    {
+        Command.SYSTEM_FACTORY_RESET,
+        Command.SYSTEM_REBOOT,
+        Command.SYSTEM_UPGRADE_FIRMWARE,
+    }
+)
+
+RequestKey = tuple[Command, tuple[tuple[str, Any], ...]]
+
 
 def get_command_from_name(command_name: str) -> Command:
     """Return the command for a particular name.
@@ -79,3 +133,19 @@ def get_command_from_code(command_code: int) -> Command:
         msg = f"Unknown command code: {command_code}"
         raise CommandError(msg) from err
     return command
+
+
+def get_request_key(command: Command, params: dict[str, Any] | None) -> RequestKey:
+    """Return a hashable key that identifies a command and its parameters.
+
+    Args:
+    ----
+        command: The command.
+        params: The parameters sent along with the command.
+
+    Returns:
+    -------
+        A hashable key.
+
+    """
+    return command, tuple(sorted(params.items())) if params else ()
@@ -0,0 +1,63 @@
+"""Define concurrency helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Mapping
+from typing import Any, TypeVar
+
+from aioguardian.errors import GuardianError
+
+_KeyT = TypeVar("_KeyT", bound=Hashable)
+
+
+async def as_completed_bounded(
+    funcs: Mapping[_KeyT, Callable[[], Awaitable[dict[str, Any]]]],
+    semaphore: asyncio.Semaphore,
+) -> AsyncIterator[tuple[_KeyT, dict[str, Any] | GuardianError]]:
+    """Run coroutine functions with bounded concurrency, yielding results as they land.
+
+    Errors raised by an individual coroutine function are yielded in place of its result
+    rather than raised. If the caller stops iterating early, any coroutine functions
+    that haven't finished are cancelled.
+
+    Args:
+    ----
+        funcs: A mapping of keys to coroutine functions.
+        semaphore: A semaphore that caps how many coroutine functions run at once.
+
+    Yields:
+    ------
+        Tuples of key and result (or error).
+
+    """
+
+    async def run(
+        key: _KeyT, func: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> tuple[_KeyT, dict[str, Any] | GuardianError]:
+        """Run a single coroutine function.
+
+        Args:
+        ----
+            key: The key of the coroutine function.
+            func: The coroutine function.
+
+        Returns:
+        -------
+            A tuple of key and result (or error).
+
+        """
+        async with semaphore:
+            try:
+                return key, await func()
+            except GuardianError as err:
+                return key, err
+
+    tasks = [asyncio.create_task(run(key, func)) for key, func in funcs.items()]
+
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+    finally:
+        for task in tasks:
+            task.cancel()
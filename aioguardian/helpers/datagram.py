@@ -0,0 +1,221 @@
+"""Define datagram helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import socket
+from typing import Protocol
+
+from aioguardian.const import LOGGER
+from aioguardian.errors import SocketError
+
+DatagramHandler = Callable[[bytes, tuple[str, int]], None]
+LostHandler = Callable[[SocketError], None]
+
+
+class DeviceStream(Protocol):
+    """Define the interface a client uses to send datagrams to a device."""
+
+    async def send(self, data: bytes) -> None:
+        """Send a datagram to the device.
+
+        Args:
+        ----
+            data: The datagram to send.
+
+        """
+
+    def close(self) -> None:
+        """Close the stream."""
+
+
+class DatagramEndpoint(asyncio.DatagramProtocol):
+    """Define a single UDP socket that many clients can share.
+
+    Clients register with the endpoint (by passing it to
+    :meth:`Client <aioguardian.Client>` as ``endpoint``); every datagram that arrives is
+    handed straight to the client registered for the address it came from, so each
+    device costs a dictionary entry rather than a socket of its own.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._handlers: dict[tuple[str, int], DatagramHandler] = {}
+        self._lost_handlers: dict[tuple[str, int], LostHandler] = {}
+        self._transport: asyncio.DatagramTransport | None = None
+
+    def _notify_lost(self, err: SocketError) -> None:
+        """Tell every registered device that the socket is gone.
+
+        Args:
+        ----
+            err: The error to fail the devices' outstanding requests with.
+
+        """
+        for on_lost in list(self._lost_handlers.values()):
+            on_lost(err)
+
+    def close(self) -> None:
+        """Close the endpoint (failing the outstanding requests of every device)."""
+        if self._transport:
+            self._transport.close()
+            self._transport = None
+
+        self._notify_lost(SocketError("The shared endpoint was closed"))
+        self._handlers.clear()
+        self._lost_handlers.clear()
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Respond to the socket being closed.
+
+        Args:
+        ----
+            exc: The exception that caused the socket to close (if any).
+
+        """
+        if exc:
+            LOGGER.debug("The shared datagram endpoint was lost: %s", exc)
+        self._transport = None
+        self._notify_lost(SocketError("The shared endpoint was lost"))
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Respond to the socket being opened.
+
+        Args:
+        ----
+            transport: The datagram transport for the socket.
+
+        """
+        self._transport = transport  # type: ignore[assignment]
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Route a datagram to the client registered for its address.
+
+        Args:
+        ----
+            data: The datagram.
+            addr: The address the datagram came from.
+
+        """
+        if (handler := self._handlers.get(addr[:2])) is None:
+            LOGGER.debug("Discarding datagram from unknown device: %s", addr)
+            return
+        handler(data, addr)
+
+    def error_received(self, exc: Exception) -> None:
+        """Respond to an error on the socket.
+
+        Args:
+        ----
+            exc: The error.
+
+        """
+        LOGGER.debug("Error on the shared datagram endpoint: %s", exc)
+
+    async def open(self, local_addr: tuple[str, int] = ("0.0.0.0", 0)) -> None:  # noqa: S104
+        """Open the endpoint's socket.
+
+        Args:
+        ----
+            local_addr: The local address to bind to.
+
+        """
+        await asyncio.get_running_loop().create_datagram_endpoint(
+            lambda: self, local_addr=local_addr
+        )
+
+    async def register(
+        self,
+        host: str,
+        port: int,
+        handler: DatagramHandler,
+        *,
+        on_lost: LostHandler | None = None,
+    ) -> DeviceStream:
+        """Register a device with the endpoint.
+
+        Args:
+        ----
+            host: The IP address or hostname of the device.
+            port: The port of the device.
+            handler: A callback to run with each datagram the device sends.
+            on_lost: An optional callback to run (with an error) if the endpoint is
+                closed or its socket is lost while the device is registered.
+
+        Returns:
+        -------
+            A stream that sends datagrams to the device.
+
+        """
+        addr_info = await asyncio.get_running_loop().getaddrinfo(
+            host, port, family=socket.AF_INET, type=socket.SOCK_DGRAM
+        )
+        remote_addr = addr_info[0][4][:2]
+        self._handlers[remote_addr] = handler
+        if on_lost is not None:
+            self._lost_handlers[remote_addr] = on_lost
+        return _EndpointStream(self, remote_addr)
+
+    def sendto(self, data: bytes, remote_addr: tuple[str, int]) -> None:
+        """Send a datagram to an address.
+
+        Args:
+        ----
+            data: The datagram to send.
+            remote_addr: The address to send to.
+
+        Raises:
+        ------
+            SocketError: Raised when the endpoint isn't open.
+
+        """
+        if not self._transport:
+            msg = "The shared endpoint isn't open"
+            raise SocketError(msg)
+        self._transport.sendto(data, remote_addr)
+
+    def unregister(self, remote_addr: tuple[str, int]) -> None:
+        """Unregister a device from the endpoint.
+
+        Args:
+        ----
+            remote_addr: The resolved address of the device.
+
+        """
+        self._handlers.pop(remote_addr, None)
+        self._lost_handlers.pop(remote_addr, None)
+
+
+class _EndpointStream:
+    """Define a view of a shared endpoint for a single device."""
+
+    __slots__ = ("_endpoint", "_remote_addr")
+
+    def __init__(
+        self, endpoint: DatagramEndpoint, remote_addr: tuple[str, int]
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            endpoint: The shared endpoint.
+            remote_addr: The resolved address of the device.
+
+        """
+        self._endpoint = endpoint
+        self._remote_addr = remote_addr
+
+    async def send(self, data: bytes) -> None:
+        """Send a datagram to the device.
+
+        Args:
+        ----
+            data: The datagram to send.
+
+        """
+        self._endpoint.sendto(data, self._remote_addr)
+
+    def close(self) -> None:
+        """Close the stream."""
+        self._endpoint.unregister(self._remote_addr)
@@ -0,0 +1,20 @@
+"""Define debug logging helpers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, kw_only=True)
+class DebugLogging:
+    """Define how a client logs the datagrams it receives (at the ``DEBUG`` level).
+
+    Attributes
+    ----------
+        sample_every: Log only one of every this many received datagrams.
+        raw: Log the raw datagrams rather than the decoded responses.
+
+    """
+
+    sample_every: int = 1
+    raw: bool = False
@@ -0,0 +1,341 @@
+"""Define metrics helpers."""
+
+from __future__ import annotations
+
+import bisect
+from collections import Counter
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Protocol
+
+from aioguardian.errors import ERROR_CODE_MAPPING
+from aioguardian.helpers.command import Command
+
+if TYPE_CHECKING:
+    from aioguardian.helpers.scheduler import Priority
+
+# Bucket upper bounds (in seconds) that suit both loopback and WiFi round trips:
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class MetricsRecorder(Protocol):
+    """Define the interface a client reports metrics through.
+
+    Implement this to feed an existing metrics system (e.g., Prometheus or
+    OpenTelemetry); :class:`ClientMetrics` is a self-contained implementation.
+    """
+
+    def record_discarded(self, reason: str) -> None:
+        """Record a received datagram that was discarded.
+
+        Args:
+        ----
+            reason: Why the datagram was discarded: ``"invalid"`` (it couldn't be
+                decoded), ``"stale"`` (it answers an attempt that timed out), or
+                ``"unsolicited"`` (no request for its command is outstanding).
+
+        """
+
+    def record_error(self, command: Command, error_code: int | None) -> None:
+        """Record a response that reports an error.
+
+        Args:
+        ----
+            command: The command that failed.
+            error_code: The error code in the response (if any).
+
+        """
+
+    def record_latency(self, priority: Priority, seconds: float) -> None:
+        """Record the time a request took to be answered (including waits and retries).
+
+        Args:
+        ----
+            priority: The priority class of the request.
+            seconds: The time between the request being made and its response.
+
+        """
+
+    def record_lock_wait(self, command: Command, seconds: float) -> None:
+        """Record the time an attempt waited to be sent.
+
+        Attempts wait for any other request with the same command code and for the
+        request scheduler to admit them.
+
+        Args:
+        ----
+            command: The command being sent.
+            seconds: The time spent waiting.
+
+        """
+
+    def record_request(self, command: Command) -> None:
+        """Record a request that is about to be sent to the device.
+
+        Args:
+        ----
+            command: The command being sent.
+
+        """
+
+    def record_retry(self, command: Command) -> None:
+        """Record a retry of a request.
+
+        Args:
+        ----
+            command: The command being retried.
+
+        """
+
+    def record_rtt(self, command: Command, seconds: float) -> None:
+        """Record the round-trip time of an attempt that got a response.
+
+        Args:
+        ----
+            command: The command that was sent.
+            seconds: The time between sending the request and receiving its response.
+
+        """
+
+    def record_timeout(self, command: Command) -> None:
+        """Record an attempt that timed out.
+
+        Args:
+        ----
+            command: The command that timed out.
+
+        """
+
+
+class Histogram:
+    """Define a histogram with fixed buckets.
+
+    Args:
+    ----
+        buckets: The upper bounds of the buckets, in ascending order.
+
+    """
+
+    __slots__ = ("_bounds", "_counts", "count", "sum")
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            buckets: The upper bounds of the buckets, in ascending order.
+
+        """
+        self._bounds = tuple(buckets)
+        # The last count is for values above the largest bound:
+        self._counts = [0] * (len(self._bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    @property
+    def buckets(self) -> list[tuple[float, int]]:
+        """Return the cumulative count of values at or below each bucket's bound.
+
+        This is the shape Prometheus histograms expose (the last bound is infinite).
+
+        Returns
+        -------
+            A list of bucket bounds and cumulative counts.
+
+        """
+        cumulative = 0
+        buckets = []
+        for bound, count in zip(
+            (*self._bounds, float("inf")), self._counts, strict=True
+        ):
+            cumulative += count
+            buckets.append((bound, cumulative))
+        return buckets
+
+    def observe(self, value: float) -> None:
+        """Add a value.
+
+        Args:
+        ----
+            value: The value to add.
+
+        """
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+class ClientMetrics:
+    """Define a self-contained collection of a client's metrics.
+
+    Counts of ``requests``, ``retries``, and ``timeouts`` are kept per command, as are
+    histograms of round-trip times (``rtt``) and of the time attempts waited to be sent
+    (``lock_wait``); ``latency`` holds histograms of the time requests took (waits and
+    retries included) per priority class, ``errors`` counts error responses per command
+    and error code, and ``discarded`` counts discarded datagrams per reason.
+
+    Args:
+    ----
+        buckets: The upper bounds (in seconds) of the histograms' buckets.
+
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            buckets: The upper bounds (in seconds) of the histograms' buckets.
+
+        """
+        self._buckets = tuple(buckets)
+        self.discarded: Counter[str] = Counter()
+        self.errors: Counter[tuple[Command, int | None]] = Counter()
+        self.latency: dict[Priority, Histogram] = {}
+        self.lock_wait: dict[Command, Histogram] = {}
+        self.requests: Counter[Command] = Counter()
+        self.retries: Counter[Command] = Counter()
+        self.rtt: dict[Command, Histogram] = {}
+        self.timeouts: Counter[Command] = Counter()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as plain data (e.g., for serializing to JSON).
+
+        Returns
+        -------
+            A dictionary of metrics (each keyed by command, priority class, or reason).
+
+        """
+        errors: dict[str, dict[str, int]] = {}
+        for (command, error_code), count in self.errors.items():
+            reason = "unknown"
+            if error_code is not None:
+                reason = ERROR_CODE_MAPPING.get(error_code, reason)
+            errors.setdefault(command.name, {})[reason] = count
+
+        return {
+            "discarded": dict(self.discarded),
+            "errors": errors,
+            "latency": {
+                priority.name: histogram.buckets
+                for priority, histogram in self.latency.items()
+            },
+            "lock_wait": {
+                command.name: histogram.buckets
+                for command, histogram in self.lock_wait.items()
+            },
+            "requests": {
+                command.name: count for command, count in self.requests.items()
+            },
+            "retries": {command.name: count for command, count in self.retries.items()},
+            "rtt": {
+                command.name: histogram.buckets
+                for command, histogram in self.rtt.items()
+            },
+            "timeouts": {
+                command.name: count for command, count in self.timeouts.items()
+            },
+        }
+
+    def record_discarded(self, reason: str) -> None:
+        """Record a received datagram that was discarded.
+
+        Args:
+        ----
+            reason: Why the datagram was discarded.
+
+        """
+        self.discarded[reason] += 1
+
+    def record_error(self, command: Command, error_code: int | None) -> None:
+        """Record a response that reports an error.
+
+        Args:
+        ----
+            command: The command that failed.
+            error_code: The error code in the response (if any).
+
+        """
+        self.errors[command, error_code] += 1
+
+    def record_latency(self, priority: Priority, seconds: float) -> None:
+        """Record the time a request took to be answered (including waits and retries).
+
+        Args:
+        ----
+            priority: The priority class of the request.
+            seconds: The time between the request being made and its response.
+
+        """
+        if (histogram := self.latency.get(priority)) is None:
+            histogram = self.latency[priority] = Histogram(self._buckets)
+        histogram.observe(seconds)
+
+    def record_lock_wait(self, command: Command, seconds: float) -> None:
+        """Record the time an attempt waited to be sent.
+
+        Args:
+        ----
+            command: The command being sent.
+            seconds: The time spent waiting.
+
+        """
+        if (histogram := self.lock_wait.get(command)) is None:
+            histogram = self.lock_wait[command] = Histogram(self._buckets)
+        histogram.observe(seconds)
+
+    def record_request(self, command: Command) -> None:
+        """Record a request that is about to be sent to the device.
+
+        Args:
+        ----
+            command: The command being sent.
+
+        """
+        self.requests[command] += 1
+
+    def record_retry(self, command: Command) -> None:
+        """Record a retry of a request.
+
+        Args:
+        ----
+            command: The command being retried.
+
+        """
+        self.retries[command] += 1
+
+    def record_rtt(self, command: Command, seconds: float) -> None:
+        """Record the round-trip time of an attempt that got a response.
+
+        Args:
+        ----
+            command: The command that was sent.
+            seconds: The time between sending the request and receiving its response.
+
+        """
+        if (histogram := self.rtt.get(command)) is None:
+            histogram = self.rtt[command] = Histogram(self._buckets)
+        histogram.observe(seconds)
+
+    def record_timeout(self, command: Command) -> None:
+        """Record an attempt that timed out.
+
+        Args:
+        ----
+            command: The command that timed out.
+
+        """
+        self.timeouts[command] += 1
@@ -0,0 +1,164 @@
+"""Define retry helpers."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+import random
+
+from aioguardian.helpers.command import Command
+
+DEFAULT_ATTEMPTS: int = 3
+DEFAULT_BACKOFF_BASE: float = 0.1
+DEFAULT_BACKOFF_MAX: float = 2.0
+DEFAULT_JITTER: float = 0.5
+DEFAULT_MIN_TIMEOUT: float = 0.5
+
+# Smoothing factors and clock granularity from RFC 6298:
+RTT_ALPHA = 1 / 8
+RTT_BETA = 1 / 4
+RTT_CLOCK_GRANULARITY = 0.01
+RTT_K = 4
+RTT_MAX_BACKOFF = 64
+
+
+@dataclass(frozen=True, kw_only=True)
+class RetryPolicy:
+    """Define how failed (timed out) commands are retried.
+
+    Attributes
+    ----------
+        attempts: The total number of attempts to make.
+        backoff_base: The delay (in seconds) before the first retry; each subsequent
+            retry doubles it.
+        backoff_max: The maximum delay (in seconds) between attempts.
+        jitter: The fraction of each delay that is randomized (0 disables jitter).
+        deadline: An optional total budget (in seconds) for all attempts and delays.
+        timeout: An optional fixed timeout (in seconds) for each attempt; by default,
+            attempts at read-only commands adapt to the command's observed round-trip
+            time and attempts at any other command wait for the client's full request
+            timeout.
+        min_timeout: The smallest timeout (in seconds) an adaptive attempt may use.
+        overrides: Policies to use instead of this one for particular commands.
+
+    """
+
+    attempts: int = DEFAULT_ATTEMPTS
+    backoff_base: float = DEFAULT_BACKOFF_BASE
+    backoff_max: float = DEFAULT_BACKOFF_MAX
+    jitter: float = DEFAULT_JITTER
+    deadline: float | None = None
+    timeout: float | None = None
+    min_timeout: float = DEFAULT_MIN_TIMEOUT
+    overrides: Mapping[Command, RetryPolicy] = field(default_factory=dict)
+
+    def backoff(self, retry: int) -> float:
+        """Return the delay to wait before a retry.
+
+        Args:
+        ----
+            retry: The zero-based index of the retry.
+
+        Returns:
+        -------
+            A delay in seconds.
+
+        """
+        delay = min(self.backoff_base * 2.0**retry, self.backoff_max)
+        return delay - random.uniform(0, delay * self.jitter)  # noqa: S311
+
+    def for_command(self, command: Command) -> RetryPolicy:
+        """Return the policy to use for a particular command.
+
+        Args:
+        ----
+            command: The command being executed.
+
+        Returns:
+        -------
+            A retry policy.
+
+        """
+        return self.overrides.get(command, self)
+
+
+class RttEstimator:
+    """Define an estimator of a device's round-trip time.
+
+    This follows the smoothed RTT/RTT variance approach used by TCP (RFC 6298): each
+    attempt waits for the smoothed RTT plus four times its variance, and the timeout
+    doubles after every attempt that times out.
+
+    Args:
+    ----
+        initial_timeout: The timeout to use before any round trip has been measured.
+        min_timeout: The smallest timeout to use.
+        max_timeout: The largest timeout to use.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_timeout: float,
+        min_timeout: float = DEFAULT_MIN_TIMEOUT,
+        max_timeout: float,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            initial_timeout: The timeout to use before any round trip has been
+                measured.
+            min_timeout: The smallest timeout to use.
+            max_timeout: The largest timeout to use.
+
+        """
+        self._backoff = 1
+        self._initial_timeout = initial_timeout
+        self._max_timeout = max_timeout
+        self._min_timeout = min_timeout
+        self.min_rtt: float | None = None
+        self.rttvar: float | None = None
+        self.srtt: float | None = None
+
+    @property
+    def timeout(self) -> float:
+        """Return the timeout to use for the next attempt.
+
+        Returns
+        -------
+            A timeout in seconds.
+
+        """
+        if self.srtt is None or self.rttvar is None:
+            timeout = self._initial_timeout
+        else:
+            timeout = self.srtt + max(RTT_CLOCK_GRANULARITY, RTT_K * self.rttvar)
+            timeout = max(timeout, self._min_timeout)
+        return min(timeout * self._backoff, self._max_timeout)
+
+    def record_sample(self, rtt: float) -> None:
+        """Record a measured round-trip time.
+
+        Per Karn's algorithm, only round trips of attempts that weren't retried should
+        be recorded (since a late response to an earlier attempt can't be told apart
+        from a response to a retry).
+
+        Args:
+        ----
+            rtt: The measured round-trip time in seconds.
+
+        """
+        if self.srtt is None or self.rttvar is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - RTT_BETA) * self.rttvar + RTT_BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - RTT_ALPHA) * self.srtt + RTT_ALPHA * rtt
+        self.min_rtt = rtt if self.min_rtt is None else min(self.min_rtt, rtt)
+        self._backoff = 1
+
+    def record_timeout(self) -> None:
+        """Record an attempt that timed out."""
+        self._backoff = min(self._backoff * 2, RTT_MAX_BACKOFF)
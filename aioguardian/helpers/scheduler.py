@@ -0,0 +1,162 @@
+"""Define helpers for scheduling requests by priority."""
+
+from __future__ import annotations
+
+import asyncio
+from enum import IntEnum
+import heapq
+import itertools
+
+from aioguardian.errors import PreemptedError
+from aioguardian.helpers.command import READ_ONLY_COMMANDS, Command
+
+# A device only works through so many requests at once; beyond that, more requests in
+# flight only add latency to whatever is sent next:
+DEFAULT_MAX_IN_FLIGHT: int = 4
+
+
+class Priority(IntEnum):
+    """Define the priority classes of requests (lower values are more urgent)."""
+
+    # Commands that move the valve (e.g., closing it because of a leak):
+    VALVE = 0
+    # Other commands that change the device's state:
+    CONTROL = 1
+    # Commands that only read the device's state:
+    TELEMETRY = 2
+
+
+VALVE_COMMANDS = frozenset(
+    {Command.VALVE_CLOSE, Command.VALVE_HALT, Command.VALVE_OPEN}
+)
+
+COMMAND_PRIORITIES: dict[Command, Priority] = {
+    command: (
+        Priority.VALVE
+        if command in VALVE_COMMANDS
+        else Priority.TELEMETRY
+        if command in READ_ONLY_COMMANDS
+        else Priority.CONTROL
+    )
+    for command in Command
+}
+
+
+class RequestScheduler:
+    """Define an object that admits requests to a device in order of priority.
+
+    At most ``max_in_flight`` requests are in flight at once; requests that arrive
+    while that many are in flight wait, and are admitted most urgent first (and in
+    order of arrival within a priority class).
+
+    Args:
+    ----
+        max_in_flight: The maximum number of requests in flight at the same time.
+        shed_telemetry: Whether a valve command that has to wait also cancels every
+            waiting telemetry request.
+
+    """
+
+    __slots__ = ("_in_flight", "_max_in_flight", "_sequence", "_shed", "_waiters")
+
+    def __init__(
+        self,
+        *,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        shed_telemetry: bool = False,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            max_in_flight: The maximum number of requests in flight at the same time.
+            shed_telemetry: Whether a valve command that has to wait also cancels
+                every waiting telemetry request.
+
+        """
+        self._in_flight = 0
+        self._max_in_flight = max_in_flight
+        self._sequence = itertools.count()
+        self._shed = shed_telemetry
+        # Every waiter's future is pending; waiters are removed as soon as they're
+        # admitted, cancelled, or shed:
+        self._waiters: list[tuple[Priority, int, asyncio.Future[None]]] = []
+
+    def __len__(self) -> int:
+        """Return the number of waiting requests.
+
+        Returns
+        -------
+            The number of waiting requests.
+
+        """
+        return len(self._waiters)
+
+    async def acquire(self, priority: Priority) -> None:
+        """Wait until a request may be sent.
+
+        Args:
+        ----
+            priority: The priority of the request.
+
+        """
+        if self._in_flight < self._max_in_flight and not self._waiters:
+            self._in_flight += 1
+            return
+
+        if self._shed and priority == Priority.VALVE:
+            self.cancel_waiting(Priority.TELEMETRY)
+
+        entry = (
+            priority,
+            next(self._sequence),
+            asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(self._waiters, entry)
+        try:
+            await entry[2]
+        except asyncio.CancelledError:
+            if entry[2].cancelled():
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            elif entry[2].exception() is None:
+                # The request was admitted just before it was cancelled, so pass its
+                # turn on:
+                self.release()
+            raise
+
+    def cancel_waiting(self, priority: Priority = Priority.TELEMETRY) -> int:
+        """Cancel the waiting requests of a priority class (and any less urgent ones).
+
+        Each cancelled request raises :class:`~aioguardian.errors.PreemptedError`.
+
+        Args:
+        ----
+            priority: The most urgent priority class to cancel.
+
+        Returns:
+        -------
+            The number of cancelled requests.
+
+        """
+        kept = []
+        for entry in self._waiters:
+            if entry[0] >= priority:
+                entry[2].set_exception(
+                    PreemptedError(f"A waiting {entry[0].name} request was cancelled")
+                )
+            else:
+                kept.append(entry)
+
+        cancelled = len(self._waiters) - len(kept)
+        heapq.heapify(kept)
+        self._waiters = kept
+        return cancelled
+
+    def release(self) -> None:
+        """Mark a request as no longer in flight (admitting the next one, if any)."""
+        if self._waiters:
+            # The request's place in flight passes straight to the next one:
+            heapq.heappop(self._waiters)[2].set_result(None)
+        else:
+            self._in_flight -= 1
@@ -0,0 +1,210 @@
+"""Define parameter validation helpers."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+import functools
+from typing import TYPE_CHECKING, Any
+
+from aioguardian.errors import CommandError
+
+if TYPE_CHECKING:
+    import voluptuous as vol
+
+ParamCheck = Callable[[Any], bool]
+
+MAX_UID_LENGTH = 12
+UID_CACHE_SIZE = 1024
+
+
+def is_int(value: Any) -> bool:  # noqa: ANN401
+    """Return whether a value is an integer.
+
+    Args:
+    ----
+        value: The value to check.
+
+    Returns:
+    -------
+        Whether the value is valid.
+
+    """
+    return isinstance(value, int)
+
+
+def is_str(*, max_length: int) -> ParamCheck:
+    """Return a check that a value is a string of limited length.
+
+    Args:
+    ----
+        max_length: The maximum length of the string.
+
+    Returns:
+    -------
+        A parameter check.
+
+    """
+
+    def check(value: Any) -> bool:  # noqa: ANN401
+        """Return whether a value is a string of limited length.
+
+        Args:
+        ----
+            value: The value to check.
+
+        Returns:
+        -------
+            Whether the value is valid.
+
+        """
+        return isinstance(value, str) and len(value) <= max_length
+
+    return check
+
+
+def is_uid(value: Any) -> bool:  # noqa: ANN401
+    """Return whether a value is a valid paired sensor UID.
+
+    Args:
+    ----
+        value: The value to check.
+
+    Returns:
+    -------
+        Whether the value is valid.
+
+    """
+    return isinstance(value, str) and _is_uid(value)
+
+
+@functools.lru_cache(maxsize=UID_CACHE_SIZE)
+def _is_uid(value: str) -> bool:
+    """Return whether a string is a valid paired sensor UID.
+
+    The same handful of UIDs are validated over and over, so results are memoized.
+
+    Args:
+    ----
+        value: The string to check.
+
+    Returns:
+    -------
+        Whether the string is valid.
+
+    """
+    return value.isalnum() and len(value) <= MAX_UID_LENGTH
+
+
+def is_url(*, max_length: int) -> ParamCheck:
+    """Return a check that a value is an HTTP(S) URL of limited length.
+
+    Args:
+    ----
+        max_length: The maximum length of the URL.
+
+    Returns:
+    -------
+        A parameter check.
+
+    """
+
+    def check(value: Any) -> bool:  # noqa: ANN401
+        """Return whether a value is an HTTP(S) URL of limited length.
+
+        Args:
+        ----
+            value: The value to check.
+
+        Returns:
+        -------
+            Whether the value is valid.
+
+        """
+        if not isinstance(value, str) or len(value) > max_length:
+            return False
+
+        # Firmware upgrades are rare, so the URL parser is only imported when needed:
+        from urllib.parse import urlparse  # pylint: disable=import-outside-toplevel
+
+        parsed = urlparse(value)
+        return parsed.scheme in ("http", "https") and bool(parsed.netloc)
+
+    return check
+
+
+class ParamValidator:
+    """Define a validator of command parameters.
+
+    Each parameter is checked by a plain function; voluptuous is only imported (and
+    the schema only built) when a check fails, so that the resulting error message is
+    the one the schema produces.
+
+    Args:
+    ----
+        checks: A mapping of parameter names to checks.
+        schema_factory: A callable that builds the equivalent voluptuous schema.
+        required: The names of required parameters.
+
+    """
+
+    __slots__ = ("_checks", "_required", "_schema", "_schema_factory")
+
+    def __init__(
+        self,
+        checks: Mapping[str, ParamCheck],
+        schema_factory: Callable[[], vol.Schema],
+        *,
+        required: Iterable[str] = (),
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            checks: A mapping of parameter names to checks.
+            schema_factory: A callable that builds the equivalent voluptuous schema.
+            required: The names of required parameters.
+
+        """
+        self._checks = dict(checks)
+        self._required = frozenset(required)
+        self._schema: vol.Schema | None = None
+        self._schema_factory = schema_factory
+
+    def __call__(self, params: Mapping[str, Any]) -> None:
+        """Validate parameters.
+
+        Args:
+        ----
+            params: The parameters to validate.
+
+        Raises:
+        ------
+            CommandError: Raised when invalid parameters are provided.
+
+        """
+        if self._required <= params.keys() and all(
+            (check := self._checks.get(key)) is not None and check(value)
+            for key, value in params.items()
+        ):
+            return
+
+        import voluptuous as vol  # pylint: disable=import-outside-toplevel
+
+        try:
+            self.schema(dict(params))
+        except vol.Invalid as err:
+            msg = f"Invalid parameters provided: {err}"
+            raise CommandError(msg) from err
+
+    @property
+    def schema(self) -> vol.Schema:
+        """Return the equivalent voluptuous schema.
+
+        Returns
+        -------
+            A voluptuous schema.
+
+        """
+        if self._schema is None:
+            self._schema = self._schema_factory()
+        return self._schema
@@ -0,0 +1,286 @@
+"""Define an object that closes a Guardian device's valve when a leak is detected."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import contextlib
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, cast
+
+from typing_extensions import Self  # noqa: UP035
+
+from aioguardian.client import get_command_class
+from aioguardian.const import LOGGER
+from aioguardian.errors import CommandError, GuardianError
+from aioguardian.helpers.command import Command
+from aioguardian.helpers.metrics import DEFAULT_LATENCY_BUCKETS, Histogram
+from aioguardian.helpers.retry import RetryPolicy
+from aioguardian.models import ValveState
+
+if TYPE_CHECKING:
+    from aioguardian.client import Client
+    from aioguardian.commands.sensor import SensorCommands
+    from aioguardian.commands.system import SystemCommands
+    from aioguardian.commands.valve import ValveCommands
+
+DEFAULT_CHECK_INTERVAL = 1.0
+# Closing the valve isn't read-only, so by default each attempt would wait for the
+# client's full request timeout; a lost close is retried much sooner than that:
+DEFAULT_CLOSE_TIMEOUT = 1.0
+
+# The name the onboard sensor goes by (paired sensors go by their UIDs):
+ONBOARD_SENSOR = "onboard"
+
+# Valve states that are as good as closed (the valve is already on its way):
+CLOSED_VALVE_STATES = frozenset(
+    {
+        ValveState.START_CLOSING,
+        ValveState.CLOSING,
+        ValveState.FINISH_CLOSING,
+        ValveState.CLOSED,
+    }
+)
+
+
+class LeakResponder:
+    """Define an object that closes a device's valve as soon as any sensor gets wet.
+
+    Every ``check_interval`` seconds, the device's onboard sensor and every paired
+    sensor are checked (always asking the device, never a cache). When a sensor starts
+    reporting a leak, the valve is closed; a leak that another sensor reports while the
+    valve is being closed doesn't close it again. The time from detecting a leak to the
+    device acknowledging the close is recorded in ``latency``, ``triggers`` counts the
+    sensors that started reporting a leak, and ``deduplicated`` counts those that
+    didn't need another close. Each attempt at closing the valve waits
+    ``close_timeout`` seconds for the device to acknowledge it before trying again.
+
+    Args:
+    ----
+        client: A connected client.
+        check_interval: The number of seconds between checks of the sensors.
+        paired_sensors: Whether to check paired sensors (as well as the onboard one).
+        buckets: The upper bounds (in seconds) of the latency histogram's buckets.
+        close_timeout: The number of seconds each attempt at closing the valve waits
+            for an acknowledgement.
+
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        *,
+        check_interval: float = DEFAULT_CHECK_INTERVAL,
+        paired_sensors: bool = True,
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+        close_timeout: float = DEFAULT_CLOSE_TIMEOUT,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            client: A connected client.
+            check_interval: The number of seconds between checks of the sensors.
+            paired_sensors: Whether to check paired sensors (as well as the onboard
+                one).
+            buckets: The upper bounds (in seconds) of the latency histogram's buckets.
+            close_timeout: The number of seconds each attempt at closing the valve
+                waits for an acknowledgement.
+
+        """
+        self._check_interval = check_interval
+        self._client = client
+        self._close_policy = RetryPolicy(timeout=close_timeout)
+        self._closing: asyncio.Task[None] | None = None
+        self._paired_sensors = paired_sensors
+        self._task: asyncio.Task[None] | None = None
+        # The sensors that reported a leak the last time they were checked:
+        self._wet: set[str] = set()
+        self.deduplicated = 0
+        self.latency = Histogram(buckets)
+        self.triggers = 0
+
+        # Command groups of our own (loaded up front, so that nothing is imported when
+        # a leak is detected) that never answer from the client's cache:
+        self._sensor = cast(
+            "SensorCommands", get_command_class("sensor")(self._execute_uncached)
+        )
+        self._system = cast(
+            "SystemCommands", get_command_class("system")(self._execute_uncached)
+        )
+        self._valve = cast(
+            "ValveCommands", get_command_class("valve")(self._execute_uncached)
+        )
+
+    async def __aenter__(self) -> Self:
+        """Define an entry point into this object via a context manager.
+
+        Returns
+        -------
+            A running leak responder.
+
+        """
+        self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Define an exit point out of this object via a context manager.
+
+        Args:
+        ----
+            exc_type: An optional exception if one caused the context manager to close.
+            exc_val: The value of the optional exception
+            exc_tb: The traceback of the optional exception
+
+        """
+        await self.stop()
+
+    async def _check_onboard_sensor(self) -> None:
+        """Check the onboard sensor."""
+        try:
+            response = await self._system.onboard_sensor_status()
+        except GuardianError as err:
+            LOGGER.debug("Error while checking the onboard sensor: %s", err)
+            return
+        self._update(ONBOARD_SENSOR, response["data"]["wet"])
+
+    async def _check_paired_sensors(self) -> None:
+        """Check every paired sensor."""
+        try:
+            statuses = await self._sensor.all_paired_sensor_statuses()
+        except GuardianError as err:
+            LOGGER.debug("Error while listing paired sensors: %s", err)
+            return
+
+        for uid, status in statuses.items():
+            if isinstance(status, GuardianError):
+                LOGGER.debug("Error while checking paired sensor %s: %s", uid, status)
+                continue
+            self._update(uid, status["data"]["wet"])
+
+    async def _close_valve(self, detected_at: float) -> None:
+        """Close the valve and record how long it took.
+
+        Args:
+        ----
+            detected_at: The event loop time at which the leak was detected.
+
+        """
+        try:
+            await self._valve.close()
+        except GuardianError as err:
+            # A valve that is already closed (e.g., by hand) is just as good:
+            if not isinstance(err, CommandError) or not await self._valve_closed():
+                LOGGER.error("Failed to close the valve after a leak: %s", err)
+                # Forget the leak, so that the next check tries again:
+                self._wet.clear()
+                return
+
+        latency = asyncio.get_running_loop().time() - detected_at
+        self.latency.observe(latency)
+        LOGGER.info("Closed the valve %.3f seconds after detecting a leak", latency)
+
+    async def _execute_uncached(
+        self, command: Command, *, params: dict | None = None, silent: bool = True
+    ) -> dict[str, Any]:
+        """Execute a command without answering from the client's cache.
+
+        Args:
+        ----
+            command: The command to execute.
+            params: Any parameters to send along with the command.
+            silent: If ``True``, silence "beep" tones associated with this command.
+
+        Returns:
+        -------
+            An API response payload.
+
+        """
+        return await self._client.execute_raw_command(
+            command.value,
+            params=params,
+            silent=silent,
+            use_cache=False,
+            retry_policy=(
+                self._close_policy if command == Command.VALVE_CLOSE else None
+            ),
+        )
+
+    async def _run(self) -> None:
+        """Check the sensors periodically."""
+        while True:
+            await self.check()
+            await asyncio.sleep(self._check_interval)
+
+    def _update(self, sensor: str, wet: bool) -> None:  # noqa: FBT001
+        """Record a sensor's latest reading (closing the valve on a new leak).
+
+        Args:
+        ----
+            sensor: The sensor (``"onboard"`` or a paired sensor's UID).
+            wet: Whether the sensor reports a leak.
+
+        """
+        if not wet:
+            self._wet.discard(sensor)
+            return
+        if sensor in self._wet:
+            return
+
+        detected_at = asyncio.get_running_loop().time()
+        self._wet.add(sensor)
+        self.triggers += 1
+        LOGGER.warning("Leak detected by sensor %s; closing the valve", sensor)
+
+        if self._closing is not None and not self._closing.done():
+            self.deduplicated += 1
+            return
+        self._closing = asyncio.create_task(self._close_valve(detected_at))
+
+    async def _valve_closed(self) -> bool:
+        """Return whether the valve is closed (or closing).
+
+        Returns
+        -------
+            Whether the valve is closed.
+
+        """
+        try:
+            status = await self._valve.get_status()
+        except GuardianError:
+            return False
+        return status.state in CLOSED_VALVE_STATES
+
+    async def check(self) -> None:
+        """Check every sensor once, closing the valve if any starts reporting a leak.
+
+        The check returns once any resulting close has been acknowledged.
+        """
+        checks = [self._check_onboard_sensor()]
+        if self._paired_sensors:
+            checks.append(self._check_paired_sensors())
+        await asyncio.gather(*checks)
+
+        if self._closing is not None:
+            await asyncio.shield(self._closing)
+
+    def start(self) -> None:
+        """Start checking the sensors in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop checking the sensors (letting a close that is under way finish)."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        if self._closing is not None:
+            await self._closing
@@ -0,0 +1,256 @@
+"""Define typed models of command responses."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any
+
+
+class ValveState(IntEnum):
+    """Define the states a valve can be in."""
+
+    DEFAULT = 0
+    START_OPENING = 1
+    OPENING = 2
+    FINISH_OPENING = 3
+    OPENED = 4
+    START_CLOSING = 5
+    CLOSING = 6
+    FINISH_CLOSING = 7
+    CLOSED = 8
+    START_HALT = 9
+    STALLED = 10
+    FREE_SPIN = 11
+    HALTED = 12
+
+    @property
+    def transitional(self) -> bool:
+        """Return whether the valve is moving while in this state.
+
+        Returns
+        -------
+            Whether the state is transitional.
+
+        """
+        return self in {
+            ValveState.CLOSING,
+            ValveState.FINISH_CLOSING,
+            ValveState.FINISH_OPENING,
+            ValveState.OPENING,
+            ValveState.START_CLOSING,
+            ValveState.START_HALT,
+            ValveState.START_OPENING,
+        }
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Diagnostics:
+    """Define diagnostic info about a device.
+
+    Attributes
+    ----------
+        available_heap: The number of bytes of free heap memory.
+        codename: The codename of the device model.
+        firmware: The firmware version.
+        rf_modem_firmware: The firmware version of the RF modem.
+        uid: The UID of the device.
+        uptime: The number of seconds since the device booted.
+
+    """
+
+    available_heap: int
+    codename: str
+    firmware: str
+    rf_modem_firmware: str
+    uid: str
+    uptime: int
+
+    @classmethod
+    def from_payload(cls, data: dict[str, Any]) -> Diagnostics:
+        """Create an instance from the ``data`` portion of a response.
+
+        Args:
+        ----
+            data: The ``data`` portion of a ``SYSTEM_DIAGNOSTICS`` response.
+
+        Returns:
+        -------
+            A model of the response.
+
+        """
+        return cls(
+            available_heap=data["available_heap"],
+            codename=data["codename"],
+            firmware=data["firmware"],
+            rf_modem_firmware=data["rf_modem_firmware"],
+            uid=data["uid"],
+            uptime=data["uptime"],
+        )
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class OnboardSensorStatus:
+    """Define the status of a device's onboard sensors.
+
+    Attributes
+    ----------
+        temperature: The temperature (in °F).
+        wet: Whether a leak is detected.
+
+    """
+
+    temperature: int
+    wet: bool
+
+    @classmethod
+    def from_payload(cls, data: dict[str, Any]) -> OnboardSensorStatus:
+        """Create an instance from the ``data`` portion of a response.
+
+        Args:
+        ----
+            data: The ``data`` portion of a ``SYSTEM_ONBOARD_SENSOR_STATUS``
+                response.
+
+        Returns:
+        -------
+            A model of the response.
+
+        """
+        return cls(temperature=data["temperature"], wet=data["wet"])
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class PairedSensorStatus:
+    """Define the status of a paired sensor.
+
+    Attributes
+    ----------
+        battery_percentage: The remaining battery life.
+        codename: The codename of the sensor model.
+        moved: Whether the sensor has been moved.
+        temperature: The temperature (in °F).
+        uid: The UID of the sensor.
+        wet: Whether a leak is detected.
+
+    """
+
+    battery_percentage: int
+    codename: str
+    moved: bool
+    temperature: int
+    uid: str
+    wet: bool
+
+    @classmethod
+    def from_payload(cls, data: dict[str, Any]) -> PairedSensorStatus:
+        """Create an instance from the ``data`` portion of a response.
+
+        Args:
+        ----
+            data: The ``data`` portion of a ``SENSOR_PAIRED_SENSOR_STATUS`` response.
+
+        Returns:
+        -------
+            A model of the response.
+
+        """
+        return cls(
+            battery_percentage=data["battery_percentage"],
+            codename=data["codename"],
+            moved=data["moved"],
+            temperature=data["temperature"],
+            uid=data["uid"],
+            wet=data["wet"],
+        )
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ValveStatus:
+    """Define the status of a device's valve.
+
+    Attributes
+    ----------
+        average_current: The average current drawn by the valve motor.
+        direction: The direction the valve motor is set to move in.
+        enabled: Whether the valve motor is enabled.
+        instantaneous_current: The current drawn by the valve motor right now.
+        instantaneous_current_ddt: The rate of change of the current drawn.
+        state: The state of the valve.
+        travel_count: The number of times the valve has moved.
+
+    """
+
+    average_current: int
+    direction: bool
+    enabled: bool
+    instantaneous_current: int
+    instantaneous_current_ddt: int
+    state: ValveState
+    travel_count: int
+
+    @classmethod
+    def from_payload(cls, data: dict[str, Any]) -> ValveStatus:
+        """Create an instance from the ``data`` portion of a response.
+
+        Args:
+        ----
+            data: The ``data`` portion of a raw ``VALVE_STATUS`` response (i.e., with
+                the numeric valve state).
+
+        Returns:
+        -------
+            A model of the response.
+
+        """
+        return cls(
+            average_current=data["average_current"],
+            direction=data["direction"],
+            enabled=data["enabled"],
+            instantaneous_current=data["instantaneous_current"],
+            instantaneous_current_ddt=data["instantaneous_current_ddt"],
+            state=ValveState(data["state"]),
+            travel_count=data["travel_count"],
+        )
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class WiFiScanRecord:
+    """Define a nearby SSID found by a WiFi scan.
+
+    Attributes
+    ----------
+        authmode: The authentication mode of the network.
+        bssid: The BSSID of the access point.
+        channel: The channel of the access point.
+        rssi: The signal strength of the access point.
+        ssid: The SSID of the network.
+
+    """
+
+    authmode: int
+    bssid: str
+    channel: int
+    rssi: int
+    ssid: str
+
+    @classmethod
+    def from_payload(cls, data: dict[str, Any]) -> WiFiScanRecord:
+        """Create an instance from a record in a response.
+
+        Args:
+        ----
+            data: A single entry of the ``records`` in a ``WIFI_LIST`` response.
+
+        Returns:
+        -------
+            A model of the record.
+
+        """
+        return cls(
+            authmode=data["authmode"],
+            bssid=data["bssid"],
+            channel=data["channel"],
+            rssi=data["rssi"],
+            ssid=data["ssid"],
+        )
@@ -0,0 +1,574 @@
+"""Define an object that continuously polls a Guardian device for state changes."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Callable, Hashable, Iterable, Mapping
+import contextlib
+import copy
+from dataclasses import dataclass
+from enum import StrEnum
+import itertools
+from types import MappingProxyType, TracebackType
+from typing import TYPE_CHECKING, Any
+
+from typing_extensions import Self  # noqa: UP035
+
+from aioguardian.commands.valve import VALVE_TRANSITIONAL_STATES
+from aioguardian.const import LOGGER
+from aioguardian.errors import CommandError, GuardianError
+from aioguardian.helpers.command import Command
+
+if TYPE_CHECKING:
+    from aioguardian.client import Client
+
+DEFAULT_ACTIVE_INTERVAL: float = 0.5
+DEFAULT_BACKOFF_FACTOR: float = 2.0
+DEFAULT_MERGE_WINDOW: float = 0.1
+DEFAULT_WATCH_QUEUE_SIZE: int = 64
+
+# However large the merge window is, a poll is never run earlier than this fraction of
+# the shortest interval (so that a command isn't polled again right after it was):
+MAX_MERGE_WINDOW_FRACTION = 0.25
+
+DEFAULT_POLL_INTERVALS: dict[Command, float] = {
+    Command.SENSOR_PAIRED_SENSOR_STATUS: 30.0,
+    Command.SYSTEM_ONBOARD_SENSOR_STATUS: 30.0,
+    Command.VALVE_STATUS: 5.0,
+    Command.WIFI_STATUS: 60.0,
+}
+
+
+@dataclass(frozen=True, kw_only=True)
+class AdaptivePolling:
+    """Define how polling speeds up while a device is active.
+
+    A device is active while its valve is moving or any of its sensors (onboard or
+    paired) reports a leak. While it is active, the adaptive commands are polled every
+    ``active_interval`` seconds; once it comes to rest, their intervals grow by
+    ``backoff_factor`` after every poll until they reach the poller's configured
+    intervals.
+
+    Attributes
+    ----------
+        active_interval: The number of seconds between polls while the device is active.
+        backoff_factor: The factor each interval grows by while the device is at rest.
+        commands: The commands whose intervals adapt.
+
+    """
+
+    active_interval: float = DEFAULT_ACTIVE_INTERVAL
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR
+    commands: frozenset[Command] = frozenset(
+        {
+            Command.SENSOR_PAIRED_SENSOR_STATUS,
+            Command.SYSTEM_ONBOARD_SENSOR_STATUS,
+            Command.VALVE_STATUS,
+        }
+    )
+
+
+class Overflow(StrEnum):
+    """Define what happens when a watcher falls behind and its queue fills up."""
+
+    # Merge an update into the queued update for the same command (and sensor), so the
+    # watcher sees every field that changed but not every intermediate value:
+    COALESCE = "coalesce"
+    # Discard the oldest queued update:
+    DROP_OLDEST = "drop_oldest"
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class PollUpdate:
+    """Define a change in a polled payload.
+
+    The same update is handed to every subscriber, so its mappings are read-only.
+
+    Attributes
+    ----------
+        command: The command whose response changed.
+        uid: The UID of the paired sensor the update is for (or ``None``).
+        data: The ``data`` portion of the new response.
+        changes: The fields of ``data`` that differ from the previous response.
+
+    """
+
+    command: Command
+    uid: str | None
+    data: Mapping[str, Any]
+    changes: Mapping[str, Any]
+
+
+PollCallback = Callable[[PollUpdate], None]
+
+
+class _UpdateQueue:
+    """Define a bounded queue of updates for a single watcher."""
+
+    __slots__ = ("_counter", "_maxsize", "_overflow", "_ready", "_updates", "dropped")
+
+    def __init__(self, maxsize: int, overflow: Overflow) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            maxsize: The maximum number of queued updates.
+            overflow: What to do when the queue is full.
+
+        """
+        self._counter = itertools.count()
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._ready = asyncio.Event()
+        self._updates: OrderedDict[Hashable, PollUpdate] = OrderedDict()
+        self.dropped = 0
+
+    async def get(self) -> PollUpdate:
+        """Remove and return the oldest update (waiting for one if needed).
+
+        Returns
+        -------
+            An update.
+
+        """
+        while not self._updates:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._updates.popitem(last=False)[1]
+
+    def put(self, update: PollUpdate) -> None:
+        """Queue an update.
+
+        Args:
+        ----
+            update: The update.
+
+        """
+        key: Hashable
+        if self._overflow == Overflow.COALESCE:
+            key = (update.command, update.uid)
+            if (queued := self._updates.get(key)) is not None:
+                self._updates[key] = PollUpdate(
+                    command=update.command,
+                    uid=update.uid,
+                    data=update.data,
+                    changes=MappingProxyType({**queued.changes, **update.changes}),
+                )
+                return
+        else:
+            key = next(self._counter)
+
+        if len(self._updates) >= self._maxsize:
+            dropped = self._updates.popitem(last=False)[1]
+            self.dropped += 1
+            LOGGER.debug("Watcher fell behind; dropping update: %s", dropped)
+
+        self._updates[key] = update
+        self._ready.set()
+
+
+class Poller:
+    """Define an object that continuously polls a Guardian device for state changes.
+
+    Each command is polled at its own interval; polls that fall due close together are
+    run in a single wake-up. Subscribers are only called when a response differs from
+    the one before it.
+
+    Args:
+    ----
+        client: A connected client.
+        intervals: A mapping of commands to the number of seconds between polls (any
+            of ``SENSOR_PAIRED_SENSOR_STATUS``, ``SYSTEM_ONBOARD_SENSOR_STATUS``,
+            ``VALVE_STATUS``, and ``WIFI_STATUS``).
+        merge_window: How many seconds early a poll may run so it can share a
+            wake-up with another (at most a quarter of the shortest interval).
+        adaptive: An optional policy for polling faster while the device is active
+            (the configured intervals become the longest intervals used at rest).
+        subscribed_only: Whether to only poll commands that have subscribers.
+
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        *,
+        intervals: Mapping[Command, float] | None = None,
+        merge_window: float = DEFAULT_MERGE_WINDOW,
+        adaptive: AdaptivePolling | None = None,
+        subscribed_only: bool = False,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            client: A connected client.
+            intervals: A mapping of commands to the number of seconds between polls
+                (any of ``SENSOR_PAIRED_SENSOR_STATUS``,
+                ``SYSTEM_ONBOARD_SENSOR_STATUS``, ``VALVE_STATUS``, and
+                ``WIFI_STATUS``).
+            merge_window: How many seconds early a poll may run so it can share a
+                wake-up with another (at most a quarter of the shortest interval).
+            adaptive: An optional policy for polling faster while the device is
+                active (the configured intervals become the longest intervals used at
+                rest).
+            subscribed_only: Whether to only poll commands that have subscribers.
+
+        Raises:
+        ------
+            CommandError: Raised when a command can't be polled.
+
+        """
+        self._intervals = dict(
+            DEFAULT_POLL_INTERVALS if intervals is None else intervals
+        )
+        for command in self._intervals:
+            if command not in DEFAULT_POLL_INTERVALS:
+                msg = f"{command.name} can't be polled"
+                raise CommandError(msg)
+
+        self._adaptive = adaptive
+        self._client = client
+        self._current_intervals = dict(self._intervals)
+        self._data: dict[tuple[Command, str | None], dict[str, Any]] = {}
+        self._merge_window = merge_window
+        self._stop_when_unwatched = False
+        self._subscribed_only = subscribed_only
+        self._subscribers: list[tuple[PollCallback, frozenset[Command] | None]] = []
+        self._task: asyncio.Task[None] | None = None
+        self._wake = asyncio.Event()
+        self._watchers = 0
+
+    async def __aenter__(self) -> Self:
+        """Define an entry point into this object via a context manager.
+
+        Returns
+        -------
+            A running poller.
+
+        """
+        self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Define an exit point out of this object via a context manager.
+
+        Args:
+        ----
+            exc_type: An optional exception if one caused the context manager to close.
+            exc_val: The value of the optional exception
+            exc_tb: The traceback of the optional exception
+
+        """
+        await self.stop()
+
+    def _adapt(self, polled: Iterable[Command]) -> None:
+        """Adjust the adaptive intervals to the device's latest state.
+
+        Args:
+        ----
+            polled: The commands that were just polled.
+
+        """
+        if self._adaptive is None:
+            return
+
+        active = self.active
+        for command in self._adaptive.commands & self._intervals.keys():
+            if active:
+                self._current_intervals[command] = self._adaptive.active_interval
+            elif command in polled:
+                self._current_intervals[command] = min(
+                    self._current_intervals[command] * self._adaptive.backoff_factor,
+                    self._intervals[command],
+                )
+
+    def _notify(self, command: Command, uid: str | None, data: dict[str, Any]) -> None:
+        """Store a polled payload and notify subscribers of any changes.
+
+        Args:
+        ----
+            command: The command that was polled.
+            uid: The UID of the paired sensor the payload is for (or ``None``).
+            data: The ``data`` portion of the response.
+
+        """
+        previous = self._data.get((command, uid))
+        self._data[(command, uid)] = copy.deepcopy(data)
+
+        changes = {
+            field: value
+            for field, value in data.items()
+            if previous is None or field not in previous or previous[field] != value
+        }
+        if not changes:
+            return
+
+        update = PollUpdate(
+            command=command,
+            uid=uid,
+            data=MappingProxyType(data),
+            changes=MappingProxyType(changes),
+        )
+        for callback, commands in list(self._subscribers):
+            if commands is not None and command not in commands:
+                continue
+            try:
+                callback(update)
+            except Exception:  # noqa: BLE001
+                LOGGER.exception("Error in poll subscriber for %s", command.name)
+
+    async def _poll_command(self, command: Command) -> None:
+        """Poll a single command.
+
+        Args:
+        ----
+            command: The command to poll.
+
+        """
+        try:
+            if command == Command.SENSOR_PAIRED_SENSOR_STATUS:
+                await self._poll_paired_sensors()
+                return
+
+            if command == Command.SYSTEM_ONBOARD_SENSOR_STATUS:
+                response = await self._client.system.onboard_sensor_status()
+            elif command == Command.VALVE_STATUS:
+                response = await self._client.valve.status()
+            else:
+                response = await self._client.wifi.status()
+        except GuardianError as err:
+            LOGGER.debug("Error while polling %s: %s", command.name, err)
+            return
+
+        self._notify(command, None, response["data"])
+
+    def _polled_commands(self) -> Iterable[Command]:
+        """Return the commands that the background loop should poll.
+
+        Returns
+        -------
+            The commands to poll.
+
+        """
+        if not self._subscribed_only:
+            return self._intervals.keys()
+
+        commands: set[Command] = set()
+        for _, subscribed in self._subscribers:
+            if subscribed is None:
+                return self._intervals.keys()
+            commands |= subscribed
+        return commands & self._intervals.keys()
+
+    async def _poll_paired_sensors(self) -> None:
+        """Poll the status of every paired sensor."""
+        statuses = await self._client.sensor.all_paired_sensor_statuses()
+
+        for uid, status in statuses.items():
+            if isinstance(status, GuardianError):
+                LOGGER.debug("Error while polling paired sensor %s: %s", uid, status)
+                continue
+            self._notify(Command.SENSOR_PAIRED_SENSOR_STATUS, uid, status["data"])
+
+        # Forget about sensors that have been unpaired:
+        for key in list(self._data):
+            if key[0] == Command.SENSOR_PAIRED_SENSOR_STATUS and key[1] not in statuses:
+                del self._data[key]
+
+    async def _run(self) -> None:
+        """Poll each command whenever it falls due."""
+        loop = asyncio.get_running_loop()
+        next_due = dict.fromkeys(self._intervals, loop.time())
+
+        while True:
+            self._wake.clear()
+            now = loop.time()
+            polled = self._polled_commands()
+            merge_window = min(
+                self._merge_window,
+                MAX_MERGE_WINDOW_FRACTION
+                * min(
+                    (self._current_intervals[command] for command in polled), default=0
+                ),
+            )
+            due = [
+                command for command in polled if next_due[command] <= now + merge_window
+            ]
+
+            if not due:
+                # Sleep until the next poll is due (or until the set of polled commands
+                # changes):
+                with contextlib.suppress(TimeoutError):
+                    async with asyncio.timeout_at(
+                        min((next_due[command] for command in polled), default=None)
+                    ):
+                        await self._wake.wait()
+                continue
+
+            await self.poll(*due)
+            self._adapt(due)
+
+            # Intervals are counted from the end of the poll (however long it took).
+            # Polls that weren't due may still need to be brought forward (e.g., when a
+            # leak has just been detected):
+            finished = loop.time()
+            for command, due_at in next_due.items():
+                interval = self._current_intervals[command]
+                next_due[command] = (
+                    finished + interval
+                    if command in due
+                    else min(due_at, finished + interval)
+                )
+
+    @property
+    def active(self) -> bool:
+        """Return whether the valve is moving or any sensor reports a leak.
+
+        Returns
+        -------
+            Whether the device is active.
+
+        """
+        for (command, _), data in self._data.items():
+            if command == Command.VALVE_STATUS:
+                if data.get("state") in VALVE_TRANSITIONAL_STATES:
+                    return True
+            elif data.get("wet"):
+                return True
+        return False
+
+    def get(self, command: Command, uid: str | None = None) -> dict[str, Any] | None:
+        """Return the most recently polled data for a command.
+
+        Args:
+        ----
+            command: The command.
+            uid: The UID of a paired sensor (for ``SENSOR_PAIRED_SENSOR_STATUS``).
+
+        Returns:
+        -------
+            A copy of the ``data`` portion of the latest response (or ``None``).
+
+        """
+        if (data := self._data.get((command, uid))) is None:
+            return None
+        return copy.deepcopy(data)
+
+    async def poll(self, *commands: Command) -> None:
+        """Poll commands immediately (notifying subscribers of any changes).
+
+        Args:
+        ----
+            *commands: The commands to poll (all polled commands if omitted).
+
+        """
+        await asyncio.gather(
+            *(self._poll_command(command) for command in commands or self._intervals)
+        )
+
+    def start(self) -> None:
+        """Start polling in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def subscribe(
+        self, callback: PollCallback, *, commands: Iterable[Command] | None = None
+    ) -> Callable[[], None]:
+        """Subscribe to changes in polled data.
+
+        Args:
+        ----
+            callback: A callback to run with each :class:`PollUpdate`.
+            commands: The commands to receive updates for (all if omitted).
+
+        Returns:
+        -------
+            A callable that removes the subscription.
+
+        """
+        subscriber = (callback, None if commands is None else frozenset(commands))
+        self._subscribers.append(subscriber)
+        self._wake.set()
+
+        def unsubscribe() -> None:
+            """Remove the subscription."""
+            with contextlib.suppress(ValueError):
+                self._subscribers.remove(subscriber)
+
+        return unsubscribe
+
+    async def watch(
+        self,
+        *commands: Command,
+        max_queue_size: int = DEFAULT_WATCH_QUEUE_SIZE,
+        overflow: Overflow = Overflow.COALESCE,
+    ) -> AsyncGenerator[PollUpdate, None]:
+        """Iterate over changes in polled data.
+
+        The latest known data for each watched command is yielded first. If the poller
+        isn't running, it is started, and it is stopped again once the last watcher is
+        done.
+
+        Args:
+        ----
+            *commands: The commands to watch (all polled commands if omitted).
+            max_queue_size: The maximum number of updates to hold for this watcher.
+            overflow: What to do when this watcher falls behind and its queue is full.
+
+        Yields:
+        ------
+            Updates, in the order they happened.
+
+        Raises:
+        ------
+            CommandError: Raised when a command can't be polled.
+
+        """
+        for command in commands:
+            if command not in self._intervals:
+                msg = f"{command.name} can't be polled"
+                raise CommandError(msg)
+
+        queue = _UpdateQueue(max_queue_size, overflow)
+        for (command, uid), data in self._data.items():
+            if not commands or command in commands:
+                queue.put(
+                    PollUpdate(
+                        command=command,
+                        uid=uid,
+                        data=MappingProxyType(data),
+                        changes=MappingProxyType(data),
+                    )
+                )
+
+        unsubscribe = self.subscribe(queue.put, commands=commands or None)
+        if self._task is None or self._task.done():
+            self._stop_when_unwatched = True
+            self.start()
+        self._watchers += 1
+
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            unsubscribe()
+            self._watchers -= 1
+            if not self._watchers and self._stop_when_unwatched:
+                self._stop_when_unwatched = False
+                await self.stop()
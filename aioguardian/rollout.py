@@ -0,0 +1,273 @@
+"""Define an object to roll out firmware across a fleet of Guardian devices."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from enum import StrEnum
+import functools
+import json
+import math
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from aioguardian.const import LOGGER
+from aioguardian.errors import GuardianError, RolloutError
+from aioguardian.helpers.command import Command
+from aioguardian.helpers.concurrency import as_completed_bounded
+
+if TYPE_CHECKING:
+    from aioguardian.client import Client
+    from aioguardian.fleet import Fleet
+
+DEFAULT_CANARY_SIZE = 1
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MAX_ERROR_RATE = 0.1
+# A device downloads and installs new firmware before it restarts, which can take
+# several minutes:
+DEFAULT_UPGRADE_TIMEOUT = 600.0
+# The number of seconds between checks of an upgrading device's firmware version:
+UPGRADE_POLL_INTERVAL = 5.0
+# The cumulative fractions of the fleet that are upgraded by the end of each wave
+# (after the canaries):
+DEFAULT_WAVES: tuple[float, ...] = (0.1, 0.5, 1.0)
+
+
+class DeviceStatus(StrEnum):
+    """Define where a device is in a rollout."""
+
+    PENDING = "pending"
+    UPGRADED = "upgraded"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True, kw_only=True)
+class RolloutPlan:
+    """Define how firmware is rolled out across a fleet.
+
+    Attributes
+    ----------
+        firmware: The firmware version that devices report once upgraded.
+        url: A Guardian-provided URL that hosts firmware files.
+        port: A port at the Guardian-provided URL that can be accessed.
+        filename: A firmware filename.
+        canary_size: The number of devices upgraded (on their own) before any wave.
+        waves: The cumulative fractions of the fleet that are upgraded by the end of
+            each wave.
+        max_concurrency: The maximum number of devices to upgrade at the same time.
+        max_error_rate: The fraction of upgrades that may fail before the rollout
+            halts.
+        upgrade_timeout: The number of seconds a device has to report the new firmware
+            version after acknowledging the upgrade.
+
+    """
+
+    firmware: str
+    url: str | None = None
+    port: int | None = None
+    filename: str | None = None
+    canary_size: int = DEFAULT_CANARY_SIZE
+    waves: tuple[float, ...] = DEFAULT_WAVES
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    max_error_rate: float = DEFAULT_MAX_ERROR_RATE
+    upgrade_timeout: float = DEFAULT_UPGRADE_TIMEOUT
+
+
+class Rollout:
+    """Define an object that rolls out firmware across a fleet in waves.
+
+    A canary group is upgraded first, then the rest of the fleet in waves of growing
+    size. Each device is upgraded, and its diagnostics are then checked until they
+    report the new firmware version (or the plan's ``upgrade_timeout`` passes). If too
+    many upgrades fail by the end of a wave, the rollout halts. Devices that already
+    run the new firmware are skipped.
+
+    Args:
+    ----
+        fleet: A connected fleet.
+        plan: The rollout plan.
+        progress_file: An optional file to save progress to (and resume from).
+
+    """
+
+    def __init__(
+        self, fleet: Fleet, plan: RolloutPlan, *, progress_file: Path | None = None
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            fleet: A connected fleet.
+            plan: The rollout plan.
+            progress_file: An optional file to save progress to (and resume from).
+
+        """
+        self._fleet = fleet
+        self._plan = plan
+        self._progress_file = progress_file
+        self.errors: dict[str, GuardianError] = {}
+        self.progress: dict[str, DeviceStatus] = dict.fromkeys(
+            fleet.clients, DeviceStatus.PENDING
+        )
+
+        if progress_file is not None and progress_file.exists():
+            self._load(progress_file)
+
+    def _load(self, progress_file: Path) -> None:
+        """Load the progress of an earlier run.
+
+        Args:
+        ----
+            progress_file: The file the progress was saved to.
+
+        Raises:
+        ------
+            RolloutError: Raised when the progress is for different firmware.
+
+        """
+        saved = json.loads(progress_file.read_text())
+        if saved["firmware"] != self._plan.firmware:
+            msg = (
+                f"{progress_file} tracks a rollout of {saved['firmware']} (not "
+                f"{self._plan.firmware})"
+            )
+            raise RolloutError(msg)
+
+        for ip_address, status in saved["devices"].items():
+            if ip_address in self.progress:
+                self.progress[ip_address] = DeviceStatus(status)
+
+    def _save(self) -> None:
+        """Save the progress (replacing the file atomically)."""
+        if self._progress_file is None:
+            return
+        temp_file = self._progress_file.with_suffix(".tmp")
+        temp_file.write_text(
+            json.dumps({"firmware": self._plan.firmware, "devices": self.progress})
+        )
+        temp_file.replace(self._progress_file)
+
+    async def _upgrade(self, client: Client) -> dict[str, Any]:
+        """Upgrade a device and verify its new firmware.
+
+        Args:
+        ----
+            client: The client for the device.
+
+        Returns:
+        -------
+            The device's diagnostics info.
+
+        Raises:
+        ------
+            RolloutError: Raised when the device doesn't report the new firmware.
+
+        """
+        data = await client.system.diagnostics()
+        if data["data"]["firmware"] == self._plan.firmware:
+            return data
+
+        await client.system.upgrade_firmware(
+            url=self._plan.url, port=self._plan.port, filename=self._plan.filename
+        )
+
+        # The device may download the firmware for a while before it restarts (by
+        # which time the client may no longer be holding commands), so its diagnostics
+        # are checked (never from a cache) until they report the new firmware:
+        firmware = data["data"]["firmware"]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._plan.upgrade_timeout
+        while True:
+            try:
+                data = await client.execute_raw_command(
+                    Command.SYSTEM_DIAGNOSTICS.value, use_cache=False
+                )
+            except GuardianError as err:
+                # A device that is restarting can't answer:
+                LOGGER.debug("Error while checking an upgrading device: %s", err)
+            else:
+                if (firmware := data["data"]["firmware"]) == self._plan.firmware:
+                    return data
+
+            if loop.time() >= deadline:
+                msg = (
+                    f"Device still reports firmware {firmware} "
+                    f"{self._plan.upgrade_timeout} seconds after upgrading"
+                )
+                raise RolloutError(msg)
+            await asyncio.sleep(UPGRADE_POLL_INTERVAL)
+
+    def _waves(self) -> list[list[str]]:
+        """Split the devices that still need upgrading into waves.
+
+        Returns
+        -------
+            A list of waves (each a list of IP addresses).
+
+        """
+        # Wave sizes are based on the whole fleet, so a resumed rollout still grows
+        # gradually:
+        total = len(self.progress)
+        bounds = [min(self._plan.canary_size, total)]
+        bounds.extend(math.ceil(fraction * total) for fraction in self._plan.waves)
+        bounds.append(total)
+
+        ip_addresses = list(self.progress)
+        waves = []
+        start = 0
+        for end in bounds:
+            if end <= start:
+                continue
+            if wave := [
+                ip_address
+                for ip_address in ip_addresses[start:end]
+                if self.progress[ip_address] != DeviceStatus.UPGRADED
+            ]:
+                waves.append(wave)
+            start = end
+        return waves
+
+    async def run(self) -> dict[str, DeviceStatus]:
+        """Run (or resume) the rollout.
+
+        Returns
+        -------
+            A dictionary of IP addresses to rollout statuses.
+
+        Raises
+        ------
+            RolloutError: Raised when too many upgrades fail.
+
+        """
+        semaphore = asyncio.Semaphore(self._plan.max_concurrency)
+        attempted = failed = 0
+
+        for number, wave in enumerate(self._waves()):
+            LOGGER.info("Upgrading %s device(s) in wave %s", len(wave), number)
+            async for ip_address, result in as_completed_bounded(
+                {
+                    ip_address: functools.partial(
+                        self._upgrade, self._fleet.clients[ip_address]
+                    )
+                    for ip_address in wave
+                },
+                semaphore,
+            ):
+                attempted += 1
+                if isinstance(result, GuardianError):
+                    LOGGER.warning("Failed to upgrade %s: %s", ip_address, result)
+                    failed += 1
+                    self.errors[ip_address] = result
+                    self.progress[ip_address] = DeviceStatus.FAILED
+                else:
+                    self.progress[ip_address] = DeviceStatus.UPGRADED
+                self._save()
+
+            if failed / attempted > self._plan.max_error_rate:
+                msg = (
+                    f"Halting the rollout after wave {number}: {failed} of "
+                    f"{attempted} upgrades failed"
+                )
+                raise RolloutError(msg)
+
+        return self.progress
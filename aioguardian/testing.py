@@ -0,0 +1,612 @@
+"""Define a simulated Guardian device for testing and benchmarking.
+
+A :class:`SimulatedDevice` is a real UDP server (usually bound to the loopback
+interface) that answers every command the way a valve controller does, so clients can
+be exercised end to end without any hardware:
+
+.. code-block:: python
+
+    async with SimulatedDevice(faults=FaultProfile(latency=0.01, loss=0.05)) as device:
+        async with Client(device.host, port=device.port) as client:
+            await client.valve.open()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from dataclasses import dataclass
+import json
+import random
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from aioguardian.const import LOGGER
+from aioguardian.helpers.command import Command
+from aioguardian.models import ValveState
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from typing_extensions import Self  # noqa: UP035
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_REBOOT_TIME = 0.1
+DEFAULT_REORDER_DELAY = 0.05
+DEFAULT_VALVE_TRAVEL_TIME = 0.3
+
+# The payloads a factory-fresh device reports (taken from real responses):
+DEFAULT_DIAGNOSTICS: dict[str, Any] = {
+    "codename": "gvc1",
+    "uid": "ABCDEF123456",
+    "firmware": "0.20.9-beta+official.ef3",
+    "rf_modem_firmware": "4.0.0",
+    "available_heap": 34456,
+}
+DEFAULT_ONBOARD_SENSOR_STATUS: dict[str, Any] = {"temperature": 71, "wet": False}
+DEFAULT_PAIRED_SENSOR_STATUS: dict[str, Any] = {
+    "codename": "gld1",
+    "temperature": 68,
+    "wet": False,
+    "moved": True,
+    "battery_percentage": 79,
+}
+DEFAULT_PAIRED_SENSOR_UIDS = ("6309FB799CDE",)
+DEFAULT_WIFI_RECORDS: list[dict[str, Any]] = [
+    {
+        "bssid": "60:31:97:BE:53:5D",
+        "rssi": -89,
+        "channel": 1,
+        "authmode": 4,
+        "ssid": "CenturyLink0526",
+    }
+]
+DEFAULT_WIFI_STATUS: dict[str, Any] = {
+    "station_connected": True,
+    "ip_assigned": True,
+    "mqtt_connected": True,
+    "rssi": -63,
+    "channel": 1,
+    "lan_ipv4": "192.168.1.100",
+    "lan_ipv6": "AC10:BD0:FFFF:FFFF:AC10:BD0:FFFF:FFFF",
+    "ap_enabled": True,
+    "ap_clients": 0,
+    "bssid": "ABCDEF123456",
+    "ssid": "My_Network",
+}
+
+ERROR_CODE_SENSOR_NOT_PAIRED = 3
+ERROR_CODE_VALVE_ALREADY_OPENED = 17
+ERROR_CODE_VALVE_ALREADY_CLOSED = 18
+ERROR_CODE_VALVE_ALREADY_STOPPED = 19
+
+VALVE_MOTOR_CURRENT = 120
+
+# The states a valve moves through (and the state it comes to rest in) for each motion:
+VALVE_CLOSING_STATES = (
+    ValveState.START_CLOSING,
+    ValveState.CLOSING,
+    ValveState.FINISH_CLOSING,
+    ValveState.CLOSED,
+)
+VALVE_HALTING_STATES = (ValveState.START_HALT, ValveState.HALTED)
+VALVE_OPENING_STATES = (
+    ValveState.START_OPENING,
+    ValveState.OPENING,
+    ValveState.FINISH_OPENING,
+    ValveState.OPENED,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class FaultProfile:
+    """Define the network faults a simulated device injects into its replies.
+
+    Attributes
+    ----------
+        latency: The number of seconds every reply is delayed by.
+        jitter: The maximum number of seconds (chosen at random) added to the latency.
+        loss: The probability that a reply is never sent.
+        duplicate: The probability that a reply is sent twice.
+        reorder: The probability that a reply is held back (by ``reorder_delay``) so
+            that replies sent after it overtake it.
+        reorder_delay: The number of seconds a reordered reply is held back by.
+        seed: An optional seed for the random choices (to make runs repeatable).
+
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    loss: float = 0.0
+    duplicate: float = 0.0
+    reorder: float = 0.0
+    reorder_delay: float = DEFAULT_REORDER_DELAY
+    seed: int | None = None
+
+
+class SimulatedDevice(asyncio.DatagramProtocol):
+    """Define a simulated Guardian valve controller.
+
+    Args:
+    ----
+        host: The IP address to listen on.
+        port: The port to listen on (by default, any free port).
+        faults: The network faults to inject (by default, none).
+        paired_sensor_uids: The UIDs of the paired sensors the device starts with.
+        reboot_time: The number of seconds the device is unreachable while rebooting.
+        valve_travel_time: The number of seconds the valve takes to open or close.
+        available_firmware: The firmware version a firmware upgrade installs (by
+            default, the current version).
+        upgrade_delay: The number of seconds between acknowledging a firmware upgrade
+            and rebooting into the new firmware (e.g., to download it).
+
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = DEFAULT_HOST,
+        port: int = 0,
+        faults: FaultProfile | None = None,
+        paired_sensor_uids: Iterable[str] = DEFAULT_PAIRED_SENSOR_UIDS,
+        reboot_time: float = DEFAULT_REBOOT_TIME,
+        valve_travel_time: float = DEFAULT_VALVE_TRAVEL_TIME,
+        available_firmware: str | None = None,
+        upgrade_delay: float = 0.0,
+    ) -> None:
+        """Initialize.
+
+        Args:
+        ----
+            host: The IP address to listen on.
+            port: The port to listen on (by default, any free port).
+            faults: The network faults to inject (by default, none).
+            paired_sensor_uids: The UIDs of the paired sensors the device starts with.
+            reboot_time: The number of seconds the device is unreachable while
+                rebooting.
+            valve_travel_time: The number of seconds the valve takes to open or close.
+            available_firmware: The firmware version a firmware upgrade installs (by
+                default, the current version).
+            upgrade_delay: The number of seconds between acknowledging a firmware
+                upgrade and rebooting into the new firmware (e.g., to download it).
+
+        """
+        self.available_firmware = available_firmware
+        self.diagnostics = copy.deepcopy(DEFAULT_DIAGNOSTICS)
+        self.onboard_sensor_status = copy.deepcopy(DEFAULT_ONBOARD_SENSOR_STATUS)
+        self.paired_sensors: dict[str, dict[str, Any]] = {}
+        self.reboot_time = reboot_time
+        self.received: dict[Command, int] = {}
+        self.travel_count = 0
+        self.upgrade_delay = upgrade_delay
+        self.valve_state = ValveState.DEFAULT
+        self.valve_travel_time = valve_travel_time
+        self.wifi_status = copy.deepcopy(DEFAULT_WIFI_STATUS)
+        self._booted_at = 0.0
+        self._failures: dict[Command, int | None] = {}
+        self._host = host
+        self._motion_task: asyncio.Task | None = None
+        self._port = port
+        self._random = random.Random()  # noqa: S311
+        self._rebooting_until = 0.0
+        self._transport: asyncio.DatagramTransport | None = None
+        self._upgrade_handle: asyncio.TimerHandle | None = None
+        self.faults = faults or FaultProfile()
+
+        for uid in paired_sensor_uids:
+            self.pair_sensor(uid)
+
+    async def __aenter__(self) -> Self:
+        """Define an entry point into this object via a context manager.
+
+        Returns
+        -------
+            A running simulated device.
+
+        """
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Define an exit point out of this object via a context manager.
+
+        Args:
+        ----
+            exc_type: An optional exception if one caused the context manager to close.
+            exc_val: The value of the optional exception
+            exc_tb: The traceback of the optional exception
+
+        """
+        self.close()
+
+    @property
+    def faults(self) -> FaultProfile:
+        """Return the network faults the device injects.
+
+        Returns
+        -------
+            A fault profile.
+
+        """
+        return self._faults
+
+    @faults.setter
+    def faults(self, faults: FaultProfile) -> None:
+        """Change the network faults the device injects.
+
+        Args:
+        ----
+            faults: The new fault profile.
+
+        """
+        self._faults = faults
+        self._random.seed(faults.seed)
+
+    @property
+    def host(self) -> str:
+        """Return the IP address the device listens on.
+
+        Returns
+        -------
+            An IP address.
+
+        """
+        return self._host
+
+    @property
+    def port(self) -> int:
+        """Return the port the device listens on.
+
+        Returns
+        -------
+            A port.
+
+        """
+        return self._port
+
+    @property
+    def rebooting(self) -> bool:
+        """Return whether the device is rebooting (and therefore unreachable).
+
+        Returns
+        -------
+            Whether the device is rebooting.
+
+        """
+        return asyncio.get_running_loop().time() < self._rebooting_until
+
+    def _move_valve(self, states: tuple[ValveState, ...]) -> None:
+        """Move the valve through a sequence of states.
+
+        Args:
+        ----
+            states: The states to move through (the last of which is the resting state).
+
+        """
+        if self._motion_task:
+            self._motion_task.cancel()
+        self.valve_state = states[0]
+        self._motion_task = asyncio.create_task(self._run_valve_motion(states[1:]))
+
+    async def _run_valve_motion(self, states: tuple[ValveState, ...]) -> None:
+        """Step the valve through the remainder of a motion.
+
+        Args:
+        ----
+            states: The states still to move through.
+
+        """
+        step = self.valve_travel_time / len(VALVE_OPENING_STATES)
+        for state in states:
+            await asyncio.sleep(step)
+            self.valve_state = state
+        self.travel_count += 1
+        self._motion_task = None
+
+    def _handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Return the response to a request (changing the device's state as needed).
+
+        Args:
+        ----
+            request: The decoded request.
+
+        Returns:
+        -------
+            The response payload.
+
+        """
+        code = request.get("command")
+        response: dict[str, Any] = {"command": code, "status": "ok"}
+        if request.get("silent"):
+            response["silent"] = True
+
+        try:
+            command = Command(code)
+        except ValueError:
+            response["status"] = "error"
+            return response
+
+        self.received[command] = self.received.get(command, 0) + 1
+
+        if command in self._failures:
+            response["status"] = "error"
+            if (error_code := self._failures[command]) is not None:
+                response["error_code"] = error_code
+            return response
+
+        if (error_code := self._run_command(command, request, response)) is not None:
+            response["status"] = "error"
+            response["error_code"] = error_code
+
+        return response
+
+    def _install_upgrade(self) -> None:
+        """Install the available firmware (by rebooting into it)."""
+        self._upgrade_handle = None
+        if self.available_firmware:
+            self.diagnostics["firmware"] = self.available_firmware
+        self._reboot()
+
+    def _reboot(self) -> None:
+        """Reboot the device (which takes it offline for a little while)."""
+        loop = asyncio.get_running_loop()
+        self._rebooting_until = loop.time() + self.reboot_time
+        self._booted_at = self._rebooting_until
+
+    def _run_command(  # noqa: C901, PLR0912
+        self, command: Command, request: dict[str, Any], response: dict[str, Any]
+    ) -> int | None:
+        """Run a command, adding any data it returns to the response.
+
+        Args:
+        ----
+            command: The command to run.
+            request: The decoded request.
+            response: The response payload.
+
+        Returns:
+        -------
+            An error code if the command failed.
+
+        """
+        if command == Command.SYSTEM_PING:
+            response["data"] = {"uid": self.diagnostics["uid"]}
+        elif command == Command.SYSTEM_DIAGNOSTICS:
+            uptime = asyncio.get_running_loop().time() - self._booted_at
+            response["data"] = {**self.diagnostics, "uptime": int(uptime)}
+        elif command == Command.SYSTEM_ONBOARD_SENSOR_STATUS:
+            response["data"] = dict(self.onboard_sensor_status)
+        elif command == Command.SYSTEM_REBOOT:
+            self._reboot()
+        elif command == Command.SYSTEM_FACTORY_RESET:
+            self.paired_sensors.clear()
+            self.wifi_status = copy.deepcopy(DEFAULT_WIFI_STATUS)
+            self._reboot()
+        elif command == Command.SYSTEM_UPGRADE_FIRMWARE:
+            if self.upgrade_delay:
+                self._upgrade_handle = asyncio.get_running_loop().call_later(
+                    self.upgrade_delay, self._install_upgrade
+                )
+            else:
+                self._install_upgrade()
+        elif command in (Command.VALVE_OPEN, Command.VALVE_CLOSE, Command.VALVE_HALT):
+            return self._run_valve_command(command)
+        elif command == Command.VALVE_RESET:
+            if self._motion_task:
+                self._motion_task.cancel()
+                self._motion_task = None
+            self.valve_state = ValveState.DEFAULT
+        elif command == Command.VALVE_STATUS:
+            moving = self.valve_state.transitional
+            response["data"] = {
+                "enabled": moving,
+                "direction": self.valve_state not in VALVE_CLOSING_STATES,
+                "state": int(self.valve_state),
+                "travel_count": self.travel_count,
+                "instantaneous_current": VALVE_MOTOR_CURRENT if moving else 0,
+                "instantaneous_current_ddt": 0,
+                "average_current": VALVE_MOTOR_CURRENT if moving else 34,
+            }
+        elif command == Command.WIFI_CONFIGURE:
+            self.wifi_status["ssid"] = request.get("ssid")
+        elif command in (Command.WIFI_DISABLE_AP, Command.WIFI_ENABLE_AP):
+            self.wifi_status["ap_enabled"] = command == Command.WIFI_ENABLE_AP
+        elif command == Command.WIFI_LIST:
+            records = copy.deepcopy(DEFAULT_WIFI_RECORDS)
+            response["data"] = {"record_count": len(records), "records": records}
+        elif command == Command.WIFI_STATUS:
+            response["data"] = dict(self.wifi_status)
+        elif command == Command.SENSOR_PAIR_DUMP:
+            response["data"] = {
+                "pair_count": len(self.paired_sensors),
+                "paired_uids": list(self.paired_sensors),
+            }
+        elif command == Command.SENSOR_PAIR_SENSOR:
+            self.pair_sensor(request["uid"])
+        elif command in (
+            Command.SENSOR_PAIRED_SENSOR_STATUS,
+            Command.SENSOR_UNPAIR_SENSOR,
+        ):
+            if (status := self.paired_sensors.get(request.get("uid", ""))) is None:
+                return ERROR_CODE_SENSOR_NOT_PAIRED
+            if command == Command.SENSOR_UNPAIR_SENSOR:
+                self.paired_sensors.pop(status["uid"])
+            else:
+                response["data"] = dict(status)
+
+        # The remaining commands (IOT_PUBLISH_STATE, WIFI_RESET, and WIFI_SCAN) simply
+        # acknowledge the request:
+        return None
+
+    def _run_valve_command(self, command: Command) -> int | None:
+        """Run a command that moves the valve.
+
+        Args:
+        ----
+            command: The command to run.
+
+        Returns:
+        -------
+            An error code if the valve can't make the requested motion.
+
+        """
+        if command == Command.VALVE_HALT:
+            if not self.valve_state.transitional:
+                return ERROR_CODE_VALVE_ALREADY_STOPPED
+            self._move_valve(VALVE_HALTING_STATES)
+        elif command == Command.VALVE_OPEN:
+            if self.valve_state == ValveState.OPENED:
+                return ERROR_CODE_VALVE_ALREADY_OPENED
+            self._move_valve(VALVE_OPENING_STATES)
+        else:
+            if self.valve_state == ValveState.CLOSED:
+                return ERROR_CODE_VALVE_ALREADY_CLOSED
+            self._move_valve(VALVE_CLOSING_STATES)
+        return None
+
+    def _send(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Send a reply, injecting whatever faults the fault profile calls for.
+
+        Args:
+        ----
+            data: The encoded reply.
+            addr: The address to send the reply to.
+
+        """
+        faults = self.faults
+        if faults.loss and self._random.random() < faults.loss:
+            LOGGER.debug("Simulating a lost reply to %s", addr)
+            return
+
+        delay = faults.latency
+        if faults.jitter:
+            delay += self._random.uniform(0, faults.jitter)
+        if faults.reorder and self._random.random() < faults.reorder:
+            delay += faults.reorder_delay
+
+        copies = 1
+        if faults.duplicate and self._random.random() < faults.duplicate:
+            copies = 2
+
+        loop = asyncio.get_running_loop()
+        for _ in range(copies):
+            if delay:
+                loop.call_later(delay, self._sendto, data, addr)
+            else:
+                self._sendto(data, addr)
+
+    def _sendto(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Send a datagram (if the device is still running).
+
+        Args:
+        ----
+            data: The datagram.
+            addr: The address to send it to.
+
+        """
+        if self._transport:
+            self._transport.sendto(data, addr)
+
+    def close(self) -> None:
+        """Stop the device."""
+        if self._motion_task:
+            self._motion_task.cancel()
+            self._motion_task = None
+
+        if self._upgrade_handle:
+            self._upgrade_handle.cancel()
+            self._upgrade_handle = None
+
+        if self._transport:
+            self._transport.close()
+            self._transport = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Respond to the socket being opened.
+
+        Args:
+        ----
+            transport: The datagram transport for the socket.
+
+        """
+        self._transport = transport  # type: ignore[assignment]
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Answer a request.
+
+        Args:
+        ----
+            data: The request datagram.
+            addr: The address the request came from.
+
+        """
+        if self.rebooting:
+            return
+
+        try:
+            request = json.loads(data)
+        except ValueError:
+            LOGGER.debug("Ignoring malformed request from %s: %s", addr, data)
+            return
+
+        self._send(json.dumps(self._handle_request(request)).encode(), addr)
+
+    def fail(self, command: Command, *, error_code: int | None = None) -> None:
+        """Make a command fail until :meth:`recover` is called.
+
+        Args:
+        ----
+            command: The command to fail.
+            error_code: An optional error code to include in the error responses.
+
+        """
+        self._failures[command] = error_code
+
+    def pair_sensor(self, uid: str) -> None:
+        """Pair a sensor with the device.
+
+        Args:
+        ----
+            uid: The UID of the sensor.
+
+        """
+        self.paired_sensors[uid] = {"uid": uid, **DEFAULT_PAIRED_SENSOR_STATUS}
+
+    def recover(self, command: Command) -> None:
+        """Make a command that was set to fail succeed again.
+
+        Args:
+        ----
+            command: The command to recover.
+
+        """
+        self._failures.pop(command, None)
+
+    def set_wet(self, wet: bool, *, uid: str | None = None) -> None:  # noqa: FBT001
+        """Simulate a leak (or the end of one).
+
+        Args:
+        ----
+            wet: Whether a leak is detected.
+            uid: The UID of the paired sensor that detects it (by default, the
+                device's onboard sensor).
+
+        """
+        if uid is None:
+            self.onboard_sensor_status["wet"] = wet
+        else:
+            self.paired_sensors[uid]["wet"] = wet
+
+    async def start(self) -> None:
+        """Start the device."""
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: self, local_addr=(self._host, self._port)
+        )
+        self._host, self._port = transport.get_extra_info("sockname")[:2]
+        self._booted_at = loop.time()
@@ -0,0 +1 @@
+"""Define benchmarks of aioguardian's command path."""
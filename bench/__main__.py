@@ -0,0 +1,346 @@
+"""Benchmark command throughput and latency against simulated devices.
+
+Every scenario runs real clients over real UDP sockets (on the loopback interface)
+against :class:`~aioguardian.testing.SimulatedDevice` instances:
+
+* ``serial``: one client sends commands one after another.
+* ``contention``: many tasks share one client and send the same (non-coalesced)
+  command, so they queue on that command's lock.
+* ``fanout``: one task per device sends commands concurrently over a shared endpoint.
+
+Each scenario is run twice: once timed (for throughput, latency percentiles, and CPU
+time) and once under ``tracemalloc`` (for memory), since tracing skews timings. The
+simulated devices run in the same process, so CPU time includes their (small) share.
+
+USAGE: python -m bench [--commands N] [--json FILE] [--baseline FILE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine
+import contextlib
+from dataclasses import asdict, dataclass
+import json
+from pathlib import Path
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from aioguardian import Client
+from aioguardian.helpers.datagram import DatagramEndpoint
+from aioguardian.testing import SimulatedDevice
+
+DEFAULT_COMMANDS = 2000
+DEFAULT_CONCURRENCY = 16
+DEFAULT_DEVICES = 32
+DEFAULT_TOLERANCE = 0.2
+
+Scenario = Callable[[int, list[float]], Coroutine[Any, Any, None]]
+
+
+@dataclass(frozen=True, kw_only=True)
+class Result:
+    """Define the result of a benchmark scenario.
+
+    Attributes
+    ----------
+        scenario: The name of the scenario.
+        commands: The number of commands sent.
+        commands_per_second: The throughput.
+        p50_ms: The median latency (in milliseconds).
+        p95_ms: The 95th percentile latency (in milliseconds).
+        p99_ms: The 99th percentile latency (in milliseconds).
+        cpu_us_per_command: The CPU time per command (in microseconds).
+        peak_kib: The peak memory traced while the scenario ran (in KiB).
+        allocations_per_command: The number of memory blocks allocated per command
+            (from a ``tracemalloc`` snapshot diff, so blocks that were freed again
+            before the scenario ended aren't counted).
+
+    """
+
+    scenario: str
+    commands: int
+    commands_per_second: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    cpu_us_per_command: float
+    peak_kib: float
+    allocations_per_command: float
+
+
+async def timed(latencies: list[float], request: Awaitable[object]) -> None:
+    """Run a request and record its latency.
+
+    Args:
+    ----
+        latencies: The list of latencies to add to.
+        request: The request to run.
+
+    """
+    start = time.perf_counter()
+    await request
+    latencies.append(time.perf_counter() - start)
+
+
+async def run_serial(commands: int, latencies: list[float]) -> None:
+    """Send commands one after another from a single client.
+
+    Args:
+    ----
+        commands: The number of commands to send.
+        latencies: The list of latencies to add to.
+
+    """
+    async with (
+        SimulatedDevice() as device,
+        Client(device.host, port=device.port) as client,
+    ):
+        for _ in range(commands):
+            await timed(latencies, client.valve.status())
+
+
+async def run_contention(
+    commands: int, latencies: list[float], *, concurrency: int = DEFAULT_CONCURRENCY
+) -> None:
+    """Send the same command from many tasks that share a single client.
+
+    ``IOT_PUBLISH_STATE`` isn't read-only, so concurrent requests aren't coalesced and
+    every one of them waits its turn on the command's lock.
+
+    Args:
+    ----
+        commands: The number of commands to send.
+        latencies: The list of latencies to add to.
+        concurrency: The number of tasks to send commands from.
+
+    """
+
+    async def worker(client: Client, count: int) -> None:
+        """Send commands.
+
+        Args:
+        ----
+            client: The client to send commands with.
+            count: The number of commands to send.
+
+        """
+        for _ in range(count):
+            await timed(latencies, client.iot.publish_state())
+
+    async with (
+        SimulatedDevice() as device,
+        Client(device.host, port=device.port) as client,
+    ):
+        await asyncio.gather(
+            *(worker(client, commands // concurrency) for _ in range(concurrency))
+        )
+
+
+async def run_fanout(
+    commands: int, latencies: list[float], *, devices: int = DEFAULT_DEVICES
+) -> None:
+    """Send commands to many devices at once over a shared endpoint.
+
+    Args:
+    ----
+        commands: The number of commands to send.
+        latencies: The list of latencies to add to.
+        devices: The number of devices to send commands to.
+
+    """
+
+    async def worker(client: Client, count: int) -> None:
+        """Send commands.
+
+        Args:
+        ----
+            client: The client to send commands with.
+            count: The number of commands to send.
+
+        """
+        for _ in range(count):
+            await timed(latencies, client.valve.status())
+
+    endpoint = DatagramEndpoint()
+    await endpoint.open(("127.0.0.1", 0))
+
+    async with contextlib.AsyncExitStack() as stack:
+        stack.callback(endpoint.close)
+        clients = []
+        for _ in range(devices):
+            device = await stack.enter_async_context(SimulatedDevice())
+            clients.append(
+                await stack.enter_async_context(
+                    Client(device.host, port=device.port, endpoint=endpoint)
+                )
+            )
+        await asyncio.gather(
+            *(worker(client, commands // devices) for client in clients)
+        )
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "serial": run_serial,
+    "contention": run_contention,
+    "fanout": run_fanout,
+}
+
+
+def run_scenario(name: str, scenario: Scenario, commands: int) -> Result:
+    """Run a scenario and measure it.
+
+    Args:
+    ----
+        name: The name of the scenario.
+        scenario: The scenario to run.
+        commands: The number of commands to send.
+
+    Returns:
+    -------
+        The result of the scenario.
+
+    """
+    # Warm up (imports, caches, the RTT estimate, etc.) before measuring anything:
+    asyncio.run(scenario(min(commands, 100), []))
+
+    latencies: list[float] = []
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    asyncio.run(scenario(commands, latencies))
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        snapshot_before = take_snapshot()
+        asyncio.run(scenario(commands, []))
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot_after = take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    allocations = sum(
+        stat.count_diff
+        for stat in snapshot_after.compare_to(snapshot_before, "traceback")
+    )
+
+    p50, p95, p99 = (
+        statistics.quantiles(latencies, n=100)[index] * 1000 for index in (49, 94, 98)
+    )
+    return Result(
+        scenario=name,
+        commands=len(latencies),
+        commands_per_second=len(latencies) / wall,
+        p50_ms=p50,
+        p95_ms=p95,
+        p99_ms=p99,
+        cpu_us_per_command=cpu / len(latencies) * 1_000_000,
+        peak_kib=(peak - before) / 1024,
+        allocations_per_command=max(allocations, 0) / len(latencies),
+    )
+
+
+def take_snapshot() -> tracemalloc.Snapshot:
+    """Take a snapshot of the traced memory blocks (leaving out tracemalloc's own).
+
+    Returns
+    -------
+        A snapshot.
+
+    """
+    return tracemalloc.take_snapshot().filter_traces(
+        (tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__),)
+    )
+
+
+def find_regressions(
+    results: list[Result], baseline: list[dict[str, Any]], tolerance: float
+) -> list[str]:
+    """Compare results with a baseline and describe any regressions.
+
+    Args:
+    ----
+        results: The results of this run.
+        baseline: The results of a previous run (as written by ``--json``).
+        tolerance: The fraction by which a metric may worsen before it is reported.
+
+    Returns:
+    -------
+        Descriptions of the regressions.
+
+    """
+    regressions = []
+    previous = {entry["scenario"]: entry for entry in baseline}
+    for result in results:
+        if (entry := previous.get(result.scenario)) is None:
+            continue
+        if result.commands_per_second < entry["commands_per_second"] * (1 - tolerance):
+            regressions.append(
+                f"{result.scenario}: {result.commands_per_second:.0f} commands/s "
+                f"(baseline: {entry['commands_per_second']:.0f})"
+            )
+        regressions.extend(
+            f"{result.scenario}: {metric} {getattr(result, metric):.2f} "
+            f"(baseline: {entry[metric]:.2f})"
+            for metric in ("p99_ms", "cpu_us_per_command")
+            if getattr(result, metric) > entry[metric] * (1 + tolerance)
+        )
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmarks.
+
+    Returns
+    -------
+        The exit code.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=DEFAULT_COMMANDS)
+    parser.add_argument("--scenario", choices=SCENARIOS, action="append")
+    parser.add_argument("--json", type=Path, help="write the results to this file")
+    parser.add_argument("--baseline", type=Path, help="compare with these results")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    results = [
+        run_scenario(name, SCENARIOS[name], args.commands)
+        for name in args.scenario or SCENARIOS
+    ]
+
+    header = (
+        f"{'scenario':<12}{'cmd/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        f"{'CPU us':>10}{'peak KiB':>10}{'allocs':>10}"
+    )
+    print(header)  # noqa: T201
+    for result in results:
+        print(  # noqa: T201
+            f"{result.scenario:<12}{result.commands_per_second:>10.0f}"
+            f"{result.p50_ms:>10.3f}{result.p95_ms:>10.3f}{result.p99_ms:>10.3f}"
+            f"{result.cpu_us_per_command:>10.1f}{result.peak_kib:>10.1f}"
+            f"{result.allocations_per_command:>10.1f}"
+        )
+
+    if args.json:
+        args.json.write_text(
+            json.dumps([asdict(result) for result in results], indent=2) + "\n"
+        )
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        if regressions := find_regressions(results, baseline, args.tolerance):
+            print("Regressions:", *regressions, sep="\n  ")  # noqa: T201
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,17 +15,12 @@ async def main() -> None:
 
     async with Client("172.16.11.208") as guardian:
         try:
-            pair_dump_response = await guardian.sensor.pair_dump()
-            _LOGGER.info("pair_dump_response command response: %s", pair_dump_response)
-
-            for uid in pair_dump_response["data"]["paired_uids"]:
-                paired_sensor_status_resp = await guardian.sensor.paired_sensor_status(
-                    uid
-                )
+            statuses = await guardian.sensor.all_paired_sensor_statuses()
+            for uid, status in statuses.items():
                 _LOGGER.info(
                     "paired_sensor_status command response (UID: %s): %s",
                     uid,
-                    paired_sensor_status_resp,
+                    status,
                 )
         except GuardianError as err:
             _LOGGER.info(err)
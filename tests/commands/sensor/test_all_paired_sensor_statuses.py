@@ -0,0 +1,140 @@
+"""Test the all_paired_sensor_statuses command."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from aioguardian import Client
+from aioguardian.errors import CommandError
+from aioguardian.helpers.command import Command
+from aioguardian.testing import SimulatedDevice
+from tests.common import load_fixture
+
+
+@pytest.mark.asyncio
+async def test_all_paired_sensor_statuses_explicit_uids(
+    mock_datagram_client: MagicMock,
+) -> None:
+    """Test getting the status of particular sensors, one of which fails.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    with mock_datagram_client:
+        mock_datagram_client.recv.side_effect = [
+            (
+                load_fixture("paired_sensor_status_success_response.json").encode(),
+                "192.168.1.100",
+            ),
+            (
+                load_fixture("paired_sensor_status_failure_3_response.json").encode(),
+                "192.168.1.100",
+            ),
+        ]
+
+        async with Client("192.168.1.100") as client:
+            statuses = await client.sensor.all_paired_sensor_statuses(
+                uids=["6309FB799CDE", "BCDEF1234567"], max_concurrency=2
+            )
+
+        assert mock_datagram_client.send.call_count == 2
+        assert statuses["6309FB799CDE"]["data"]["wet"] is False  # type: ignore[index]
+        assert isinstance(statuses["BCDEF1234567"], CommandError)
+        assert str(statuses["BCDEF1234567"]) == (
+            "SENSOR_PAIRED_SENSOR_STATUS command failed: sensor_not_paired"
+        )
+
+
+@pytest.mark.asyncio
+async def test_all_paired_sensor_statuses_success(
+    mock_datagram_client: MagicMock,
+) -> None:
+    """Test getting the status of every paired sensor.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    with mock_datagram_client:
+        mock_datagram_client.recv.side_effect = [
+            (load_fixture("pair_dump_success_response.json").encode(), "192.168.1.100"),
+            (
+                load_fixture("paired_sensor_status_success_response.json").encode(),
+                "192.168.1.100",
+            ),
+        ]
+
+        async with Client("192.168.1.100") as client:
+            statuses = await client.sensor.all_paired_sensor_statuses()
+
+        assert statuses == {
+            "6309FB799CDE": {
+                "command": 51,
+                "status": "ok",
+                "silent": True,
+                "data": {
+                    "uid": "6309FB799CDE",
+                    "codename": "gld1",
+                    "temperature": 68,
+                    "wet": False,
+                    "moved": True,
+                    "battery_percentage": 79,
+                },
+            }
+        }
+
+
+@pytest.mark.asyncio
+async def test_iter_paired_sensor_statuses(mock_datagram_client: MagicMock) -> None:
+    """Test iterating over the status of every paired sensor.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    with mock_datagram_client:
+        mock_datagram_client.recv.side_effect = [
+            (load_fixture("pair_dump_success_response.json").encode(), "192.168.1.100"),
+            (
+                load_fixture("paired_sensor_status_success_response.json").encode(),
+                "192.168.1.100",
+            ),
+        ]
+
+        async with Client("192.168.1.100") as client:
+            statuses = [
+                (uid, status)
+                async for uid, status in client.sensor.iter_paired_sensor_statuses()
+            ]
+
+        assert len(statuses) == 1
+        assert statuses[0][0] == "6309FB799CDE"
+        assert statuses[0][1]["command"] == 51  # type: ignore[index]
+
+
+@pytest.mark.asyncio
+async def test_paired_uids_remembered() -> None:
+    """Test that the UIDs of the paired sensors aren't looked up for every batch."""
+    async with (
+        SimulatedDevice() as device,
+        Client(device.host, port=device.port) as client,
+    ):
+        # The UIDs are remembered until they expire:
+        with patch("aioguardian.commands.sensor.PAIRED_UIDS_TTL", 0):
+            await client.sensor.all_paired_sensor_statuses()
+            await client.sensor.all_paired_sensor_statuses()
+        assert device.received[Command.SENSOR_PAIR_DUMP] == 2
+        await client.sensor.all_paired_sensor_statuses()
+        await client.sensor.all_paired_sensor_statuses()
+        assert device.received[Command.SENSOR_PAIR_DUMP] == 3
+
+        # Pairing or unpairing a sensor forgets them:
+        await client.sensor.pair_sensor("AAAAAAAAAAAA")
+        assert "AAAAAAAAAAAA" in await client.sensor.all_paired_sensor_statuses()
+        await client.sensor.unpair_sensor("AAAAAAAAAAAA")
+        assert "AAAAAAAAAAAA" not in await client.sensor.all_paired_sensor_statuses()
+        assert device.received[Command.SENSOR_PAIR_DUMP] == 5
@@ -6,6 +6,7 @@ import pytest
 
 from aioguardian import Client
 from aioguardian.errors import CommandError
+from aioguardian.models import PairedSensorStatus
 from tests.common import load_fixture
 
 
@@ -101,7 +102,7 @@ async def test_paired_sensor_status_dump_success(
     with mock_datagram_client:
         async with Client("192.168.1.100") as client:
             paired_sensor_status = await client.sensor.paired_sensor_status(
-                "ABCDE1234567"
+                "6309FB799CDE"
             )
 
         assert paired_sensor_status["command"] == 51
@@ -114,3 +115,32 @@ async def test_paired_sensor_status_dump_success(
             "moved": True,
             "battery_percentage": 79,
         }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "command_response",
+    [load_fixture("paired_sensor_status_success_response.json").encode()],
+)
+async def test_get_paired_sensor_status_success(
+    mock_datagram_client: MagicMock,
+) -> None:
+    """Test retrieving a paired sensor's status as a typed model.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    with mock_datagram_client:
+        async with Client("192.168.1.100") as client:
+            sensor_status = await client.sensor.get_paired_sensor_status("6309FB799CDE")
+
+        assert sensor_status == PairedSensorStatus(
+            battery_percentage=79,
+            codename="gld1",
+            moved=True,
+            temperature=68,
+            uid="6309FB799CDE",
+            wet=False,
+        )
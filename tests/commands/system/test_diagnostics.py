@@ -6,6 +6,7 @@ import pytest
 
 from aioguardian import Client
 from aioguardian.errors import CommandError
+from aioguardian.models import Diagnostics
 from tests.common import load_fixture
 
 
@@ -58,3 +59,29 @@ async def test_diagnostics_success(mock_datagram_client: MagicMock) -> None:
             "rf_modem_firmware": "4.0.0",
             "available_heap": 34456,
         }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "command_response", [load_fixture("diagnostics_success_response.json").encode()]
+)
+async def test_get_diagnostics_success(mock_datagram_client: MagicMock) -> None:
+    """Test retrieving diagnostics info as a typed model.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    with mock_datagram_client:
+        async with Client("192.168.1.100") as client:
+            diagnostics = await client.system.get_diagnostics()
+
+        assert diagnostics == Diagnostics(
+            available_heap=34456,
+            codename="gvc1",
+            firmware="0.20.9-beta+official.ef3",
+            rf_modem_firmware="4.0.0",
+            uid="ABCDEF123456",
+            uptime=41,
+        )
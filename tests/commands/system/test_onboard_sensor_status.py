@@ -6,6 +6,7 @@ import pytest
 
 from aioguardian import Client
 from aioguardian.errors import CommandError
+from aioguardian.models import OnboardSensorStatus
 from tests.common import load_fixture
 
 
@@ -53,3 +54,25 @@ async def test_onboard_sensor_status_failure(mock_datagram_client: MagicMock) ->
             "SYSTEM_ONBOARD_SENSOR_STATUS command failed "
             "(response: {'command': 80, 'status': 'error'})"
         )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "command_response",
+    [load_fixture("onboard_sensor_status_success_response.json").encode()],
+)
+async def test_get_onboard_sensor_status_success(
+    mock_datagram_client: MagicMock,
+) -> None:
+    """Test retrieving the onboard sensor status as a typed model.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    with mock_datagram_client:
+        async with Client("192.168.1.100") as client:
+            sensor_status = await client.system.get_onboard_sensor_status()
+
+        assert sensor_status == OnboardSensorStatus(temperature=71, wet=False)
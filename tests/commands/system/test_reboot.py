@@ -1,6 +1,6 @@
 """Test the reboot command."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -45,9 +45,8 @@ async def test_reboot_success(mock_datagram_client: MagicMock) -> None:
     """
     with mock_datagram_client:
         async with Client("192.168.1.100") as client:
-            # Patch asyncio.sleep so that this test doesn't take 3-ish seconds:
-            with patch("asyncio.sleep", AsyncMock()):
-                reboot_response = await client.system.reboot()
+            reboot_response = await client.system.reboot()
+            assert client.restarting
 
         assert reboot_response["command"] == 2
         assert reboot_response["status"] == "ok"
@@ -6,6 +6,7 @@ import pytest
 
 from aioguardian import Client
 from aioguardian.errors import CommandError
+from aioguardian.models import ValveState, ValveStatus
 from tests.common import load_fixture
 
 
@@ -58,3 +59,32 @@ async def test_status_success(mock_datagram_client: MagicMock) -> None:
             "instantaneous_current_ddt": 0,
             "average_current": 34,
         }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "command_response", [load_fixture("valve_status_success_response.json").encode()]
+)
+async def test_get_status_success(mock_datagram_client: MagicMock) -> None:
+    """Test retrieving the valve status as a typed model.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    with mock_datagram_client:
+        async with Client("192.168.1.100") as client:
+            valve_status = await client.valve.get_status()
+
+        assert valve_status == ValveStatus(
+            average_current=34,
+            direction=True,
+            enabled=False,
+            instantaneous_current=0,
+            instantaneous_current_ddt=0,
+            state=ValveState.DEFAULT,
+            travel_count=0,
+        )
+        assert not valve_status.state.transitional
+        assert not hasattr(valve_status, "__dict__")
@@ -6,6 +6,7 @@ import pytest
 
 from aioguardian import Client
 from aioguardian.errors import CommandError
+from aioguardian.models import WiFiScanRecord
 from tests.common import load_fixture
 
 
@@ -32,9 +33,6 @@ async def test_list_failure(mock_datagram_client: MagicMock) -> None:
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "command_response", [load_fixture("wifi_list_success_response.json").encode()]
-)
 async def test_list_success(mock_datagram_client: MagicMock) -> None:
     """Test the wifi_list command succeeding.
 
@@ -44,6 +42,11 @@ async def test_list_success(mock_datagram_client: MagicMock) -> None:
 
     """
     with mock_datagram_client:
+        mock_datagram_client.recv.side_effect = [
+            (load_fixture("wifi_scan_success_response.json").encode(), "192.168.1.100"),
+            (load_fixture("wifi_list_success_response.json").encode(), "192.168.1.100"),
+        ]
+
         async with Client("192.168.1.100") as client:
             await client.wifi.scan()
             wifi_list_response = await client.wifi.list()
@@ -94,3 +97,30 @@ async def test_list_success_cached(mock_datagram_client: MagicMock) -> None:
                 }
             ],
         }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "command_response", [load_fixture("wifi_list_success_response.json").encode()]
+)
+async def test_get_scan_records_success(mock_datagram_client: MagicMock) -> None:
+    """Test listing nearby SSIDs as typed models.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    with mock_datagram_client:
+        async with Client("192.168.1.100") as client:
+            records = await client.wifi.get_scan_records()
+
+        assert records == [
+            WiFiScanRecord(
+                authmode=4,
+                bssid="60:31:97:BE:53:5D",
+                channel=1,
+                rssi=-89,
+                ssid="CenturyLink0526",
+            )
+        ]
@@ -18,3 +18,30 @@ def load_fixture(filename: str) -> str:
     path = Path(f"{Path(__file__).parent}/fixtures/{filename}")
     with Path.open(path, encoding="utf-8") as fptr:
         return fptr.read()
+
+
+SUCCESS_RESPONSE_FIXTURES = {
+    0: "ping_success_response.json",
+    1: "diagnostics_success_response.json",
+    2: "reboot_success_response.json",
+    4: "upgrade_firmware_success_response.json",
+    16: "valve_status_success_response.json",
+    17: "valve_open_success_response.json",
+    18: "valve_close_success_response.json",
+    19: "valve_halt_success_response.json",
+    20: "valve_reset_success_response.json",
+    32: "wifi_status_success_response.json",
+    33: "wifi_reset_success_response.json",
+    34: "wifi_configure_success_response.json",
+    35: "wifi_enable_ap_success_response.json",
+    36: "wifi_disable_ap_success_response.json",
+    37: "wifi_scan_success_response.json",
+    38: "wifi_list_success_response.json",
+    48: "pair_dump_success_response.json",
+    49: "pair_sensor_success_response.json",
+    50: "unpair_sensor_success_response.json",
+    51: "paired_sensor_status_success_response.json",
+    65: "publish_state_success_response.json",
+    80: "onboard_sensor_status_success_response.json",
+    255: "factory_reset_success_response.json",
+}
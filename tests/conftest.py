@@ -1,11 +1,16 @@
 """Define generic fixtures for tests."""
 
 # pylint: disable=redefined-outer-name
+import asyncio
 from collections.abc import Generator
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from aioguardian.helpers.datagram import DatagramEndpoint
+from tests.common import SUCCESS_RESPONSE_FIXTURES, load_fixture
+
 
 @pytest.fixture
 def command_response() -> MagicMock:
@@ -60,3 +65,67 @@ def remote_addr_response() -> str:
 
     """
     return "192.168.1.100"
+
+
+@pytest.fixture
+def mock_datagram_endpoint(unresponsive_devices: list[str]) -> Generator:
+    """Define a mocked transport for a shared datagram endpoint.
+
+    Every request is answered with the success fixture for its command code, unless
+    the request is addressed to an unresponsive device.
+
+    Args:
+    ----
+        unresponsive_devices: IP addresses of devices that never respond.
+
+    """
+    mock_transport = MagicMock()
+
+    async def open_endpoint(
+        endpoint: DatagramEndpoint, local_addr: tuple[str, int] | None = None
+    ) -> None:
+        """Open the endpoint with the mocked transport.
+
+        Args:
+        ----
+            endpoint: The endpoint being opened.
+            local_addr: The local address to bind to.
+
+        """
+
+        def sendto(data: bytes, addr: tuple[str, int]) -> None:
+            """Answer a request.
+
+            Args:
+            ----
+                data: The request payload.
+                addr: The address of the device.
+
+            """
+            if addr[0] in unresponsive_devices:
+                return
+            command_code = json.loads(data)["command"]
+            response = load_fixture(SUCCESS_RESPONSE_FIXTURES[command_code]).encode()
+            asyncio.get_running_loop().call_soon(
+                endpoint.datagram_received, response, addr
+            )
+
+        mock_transport.sendto.side_effect = sendto
+        endpoint.connection_made(mock_transport)
+
+    with patch.object(
+        DatagramEndpoint, "open", autospec=True, side_effect=open_endpoint
+    ):
+        yield mock_transport
+
+
+@pytest.fixture
+def unresponsive_devices() -> list[str]:
+    """Define IP addresses of devices that never respond.
+
+    Returns
+    -------
+        A list of IP addresses.
+
+    """
+    return []
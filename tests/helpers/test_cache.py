@@ -0,0 +1,79 @@
+"""Test response cache helpers."""
+
+from typing import Any
+from unittest.mock import patch
+
+from aioguardian.helpers.cache import ResponseCache
+from aioguardian.helpers.command import Command
+
+
+def test_cache_expiration() -> None:
+    """Test that cached responses expire after their TTL."""
+    cache = ResponseCache(ttls={Command.VALVE_STATUS: 1.0})
+
+    with patch("time.monotonic", return_value=100.0):
+        cache.record(Command.VALVE_STATUS, None, {"command": 16})
+    with patch("time.monotonic", return_value=100.5):
+        assert cache.get(Command.VALVE_STATUS) == {"command": 16}
+    with patch("time.monotonic", return_value=101.0):
+        assert cache.get(Command.VALVE_STATUS) is None
+    assert len(cache) == 0
+
+
+def test_cache_invalidation() -> None:
+    """Test that mutating commands invalidate the responses they make stale."""
+    cache = ResponseCache()
+    cache.record(Command.VALVE_STATUS, None, {"command": 16})
+    cache.record(Command.WIFI_STATUS, None, {"command": 32})
+    cache.record(Command.SENSOR_PAIR_DUMP, None, {"command": 48})
+
+    cache.record(Command.VALVE_CLOSE, None, {"command": 18})
+    assert cache.get(Command.VALVE_STATUS) is None
+    assert cache.get(Command.WIFI_STATUS) == {"command": 32}
+
+    cache.record(Command.SENSOR_PAIR_SENSOR, {"uid": "ABC"}, {"command": 49})
+    assert cache.get(Command.SENSOR_PAIR_DUMP) is None
+    assert cache.get(Command.WIFI_STATUS) == {"command": 32}
+
+    # Commands with no explicit invalidations clear everything:
+    cache.record(Command.SYSTEM_REBOOT, None, {"command": 2})
+    assert len(cache) == 0
+
+
+def test_cache_lru_eviction() -> None:
+    """Test that the least recently used response is evicted when the cache is full."""
+    cache = ResponseCache(max_entries=2)
+    cache.record(Command.SENSOR_PAIRED_SENSOR_STATUS, {"uid": "A"}, {"uid": "A"})
+    cache.record(Command.SENSOR_PAIRED_SENSOR_STATUS, {"uid": "B"}, {"uid": "B"})
+    assert cache.get(Command.SENSOR_PAIRED_SENSOR_STATUS, {"uid": "A"}) == {"uid": "A"}
+
+    cache.record(Command.SENSOR_PAIRED_SENSOR_STATUS, {"uid": "C"}, {"uid": "C"})
+    assert len(cache) == 2
+    assert cache.get(Command.SENSOR_PAIRED_SENSOR_STATUS, {"uid": "A"}) == {"uid": "A"}
+    assert cache.get(Command.SENSOR_PAIRED_SENSOR_STATUS, {"uid": "B"}) is None
+
+
+def test_cache_returns_copies() -> None:
+    """Test that modifying a cached response doesn't modify the cache."""
+    cache = ResponseCache()
+    payload: dict[str, Any] = {"command": 16, "data": {"state": 0}}
+    cache.record(Command.VALVE_STATUS, None, payload)
+    payload["data"]["state"] = 1
+
+    cached = cache.get(Command.VALVE_STATUS)
+    assert cached == {"command": 16, "data": {"state": 0}}
+    cached["data"]["state"] = "default"
+    assert cache.get(Command.VALVE_STATUS) == {"command": 16, "data": {"state": 0}}
+
+
+def test_cache_uncacheable_commands() -> None:
+    """Test that only read-only commands with a TTL are cached."""
+    cache = ResponseCache(
+        ttls={Command.VALVE_STATUS: 1.0, Command.VALVE_OPEN: 1.0},
+    )
+    cache.record(Command.WIFI_STATUS, None, {"command": 32})
+    cache.record(Command.VALVE_OPEN, None, {"command": 17})
+
+    assert len(cache) == 0
+    assert cache.get(Command.WIFI_STATUS) is None
+    assert cache.get(Command.VALVE_OPEN) is None
@@ -0,0 +1,105 @@
+"""Test request coalescing helpers."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from aioguardian.errors import CommandError
+from aioguardian.helpers.coalesce import RequestCoalescer
+
+
+@pytest.mark.asyncio
+async def test_coalesced_error() -> None:
+    """Test that an error in a shared request is raised to every caller."""
+    coalescer = RequestCoalescer()
+    calls = 0
+
+    async def request() -> dict[str, Any]:
+        """Fail a request.
+
+        Raises
+        ------
+            CommandError: Always.
+
+        """
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        msg = "Something went wrong"
+        raise CommandError(msg)
+
+    results = await asyncio.gather(
+        coalescer.run("key", request),
+        coalescer.run("key", request),
+        return_exceptions=True,
+    )
+
+    assert calls == 1
+    assert all(isinstance(result, CommandError) for result in results)
+
+    # A lone failing request doesn't leave an unretrieved exception behind:
+    with pytest.raises(CommandError):
+        await coalescer.run("key", request)
+
+
+@pytest.mark.asyncio
+async def test_coalesced_follower_cancelled() -> None:
+    """Test that cancelling a caller that joined a request doesn't affect the rest."""
+    coalescer = RequestCoalescer()
+    release = asyncio.Event()
+
+    async def request() -> dict[str, Any]:
+        """Return a response once released.
+
+        Returns
+        -------
+            An API response payload.
+
+        """
+        await release.wait()
+        return {"status": "ok"}
+
+    leader = asyncio.create_task(coalescer.run("key", request))
+    follower = asyncio.create_task(coalescer.run("key", request))
+    await asyncio.sleep(0)
+
+    follower.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await follower
+
+    release.set()
+    assert await leader == {"status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_coalesced_leader_cancelled() -> None:
+    """Test that callers that joined a cancelled request make it again themselves."""
+    coalescer = RequestCoalescer()
+    calls = 0
+
+    async def request() -> dict[str, Any]:
+        """Return a response (after blocking forever on the first call).
+
+        Returns
+        -------
+            An API response payload.
+
+        """
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.Event().wait()
+        return {"status": "ok"}
+
+    leader = asyncio.create_task(coalescer.run("key", request))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(coalescer.run("key", request))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+    assert await follower == {"status": "ok"}
+    assert calls == 2
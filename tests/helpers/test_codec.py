@@ -0,0 +1,104 @@
+"""Test JSON codec helpers."""
+
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from aioguardian import Client
+from aioguardian.helpers.codec import (
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibCodec,
+    get_default_codec,
+)
+from tests.common import load_fixture
+
+
+@pytest.fixture(autouse=True)
+def clear_default_codec() -> None:
+    """Clear the memoized default codec around each test."""
+    get_default_codec.cache_clear()
+
+
+def test_codec_round_trip() -> None:
+    """Test that the stdlib codec encodes to bytes and decodes from bytes."""
+    codec = StdlibCodec()
+    encoded = codec.dumps({"command": 16, "silent": True})
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == {"command": 16, "silent": True}
+
+
+def test_codec_fallback() -> None:
+    """Test that the stdlib codec is used when no faster codec is installed."""
+    with patch.dict(sys.modules, {"msgspec": None, "orjson": None}):
+        assert get_default_codec().name == "json"
+
+
+def test_codec_msgspec() -> None:
+    """Test that msgspec is used when orjson isn't installed."""
+    encoder = MagicMock()
+    encoder.encode.return_value = b"{}"
+    decoder = MagicMock()
+    decoder.decode.return_value = {}
+    msgspec = SimpleNamespace(
+        json=SimpleNamespace(
+            Decoder=MagicMock(return_value=decoder),
+            Encoder=MagicMock(return_value=encoder),
+        )
+    )
+
+    with patch.dict(sys.modules, {"msgspec": msgspec, "orjson": None}):
+        codec = get_default_codec()
+
+    assert isinstance(codec, MsgspecCodec)
+    assert codec.dumps({}) == b"{}"
+    assert codec.loads(b"{}") == {}
+
+
+def test_codec_preferred() -> None:
+    """Test that orjson is preferred when it is installed."""
+    orjson = SimpleNamespace(
+        dumps=MagicMock(return_value=b'{"command":16}'),
+        loads=MagicMock(return_value={"command": 16}),
+    )
+
+    with patch.dict(sys.modules, {"orjson": orjson}):
+        codec = get_default_codec()
+
+    assert isinstance(codec, OrjsonCodec)
+    assert codec.name == "orjson"
+    assert codec.dumps({"command": 16}) == b'{"command":16}'
+    orjson.dumps.assert_called_once_with({"command": 16})
+    assert codec.loads(b'{"command":16}') == {"command": 16}
+    orjson.loads.assert_called_once_with(b'{"command":16}')
+
+
+@pytest.mark.asyncio
+async def test_client_custom_codec(mock_datagram_client: MagicMock) -> None:
+    """Test that a client uses the codec it is given.
+
+    Parameterless commands are sent as pre-serialized frames, so only commands with
+    parameters are encoded by the codec.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    codec = MagicMock(wraps=StdlibCodec())
+
+    with mock_datagram_client:
+        mock_datagram_client.recv.side_effect = [
+            (load_fixture("pair_sensor_success_response.json").encode(), "1.2.3.4"),
+            (load_fixture("ping_success_response.json").encode(), "1.2.3.4"),
+        ]
+
+        async with Client("192.168.1.100", codec=codec) as client:
+            await client.sensor.pair_sensor("AB123")
+            await client.system.ping()
+
+    codec.dumps.assert_called_once_with({"command": 49, "silent": True, "uid": "AB123"})
+    assert codec.loads.call_count == 2
+    mock_datagram_client.send.assert_awaited_with(b'{"command": 0, "silent": true}')
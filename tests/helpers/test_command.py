@@ -1,5 +1,7 @@
 """Test command helpers."""
 
+import json
+
 import pytest
 
 from aioguardian.errors import CommandError
@@ -30,3 +32,13 @@ async def test_get_command_from_name() -> None:
     with pytest.raises(CommandError) as err:
         _ = get_command_from_name("not real")
     assert str(err.value) == "Unknown command name: not real"
+
+
+def test_command_frame() -> None:
+    """Test the pre-serialized frames of parameterless commands."""
+    for command in Command:
+        for silent in (False, True):
+            assert json.loads(command.frame(silent)) == {
+                "command": command.value,
+                "silent": silent,
+            }
@@ -0,0 +1,146 @@
+"""Test datagram helpers."""
+
+import asyncio
+from collections.abc import Callable
+import json
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from aioguardian import Client
+from aioguardian.errors import SocketError
+from aioguardian.helpers.datagram import DatagramEndpoint
+from tests.common import load_fixture
+
+
+class MockDevice(asyncio.DatagramProtocol):
+    """Define a bare-bones device that answers pings over a real socket."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.transport: asyncio.DatagramTransport | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Store the transport.
+
+        Args:
+        ----
+            transport: The datagram transport.
+
+        """
+        self.transport = transport  # type: ignore[assignment]
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Answer a ping.
+
+        Args:
+        ----
+            data: The request payload.
+            addr: The address of the client.
+
+        """
+        assert json.loads(data)["command"] == 0
+        assert self.transport
+        self.transport.sendto(load_fixture("ping_success_response.json").encode(), addr)
+
+
+@pytest.mark.asyncio
+async def test_endpoint_real_socket() -> None:
+    """Test a client communicating over a shared endpoint with a real socket."""
+    loop = asyncio.get_running_loop()
+    device_transport, device = await loop.create_datagram_endpoint(
+        MockDevice, local_addr=("127.0.0.1", 0)
+    )
+    device_port = device_transport.get_extra_info("sockname")[1]
+
+    endpoint = DatagramEndpoint()
+    await endpoint.open(("127.0.0.1", 0))
+
+    async with Client("127.0.0.1", port=device_port, endpoint=endpoint) as client:
+        ping_response = await client.system.ping()
+
+    assert ping_response["command"] == 0
+    assert ping_response["data"]["uid"] == "ABCDEF123456"
+
+    endpoint.close()
+    device_transport.close()
+
+
+@pytest.mark.asyncio
+async def test_endpoint_unknown_device(
+    caplog: pytest.LogCaptureFixture, mock_datagram_endpoint: MagicMock
+) -> None:
+    """Test that datagrams from unregistered devices are discarded.
+
+    Args:
+    ----
+        caplog: A mocked logging utility.
+        mock_datagram_endpoint: A mocked transport for a shared datagram endpoint.
+
+    """
+    caplog.set_level(logging.DEBUG)
+
+    endpoint = DatagramEndpoint()
+    await endpoint.open()
+    endpoint.datagram_received(b"{}", ("192.168.1.200", 7777))
+    endpoint.error_received(OSError("Something went wrong"))
+    endpoint.connection_lost(OSError("Something else went wrong"))
+
+    assert "Discarding datagram from unknown device" in caplog.text
+    assert "Error on the shared datagram endpoint" in caplog.text
+    assert "The shared datagram endpoint was lost" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_endpoint_not_open() -> None:
+    """Test that sending over an unopened endpoint throws an exception."""
+    endpoint = DatagramEndpoint()
+
+    with pytest.raises(SocketError) as err:
+        async with Client("192.168.1.100", endpoint=endpoint) as client:
+            await client.system.ping()
+
+    assert str(err.value) == "The shared endpoint isn't open"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("unresponsive_devices", [["192.168.1.100"]])
+@pytest.mark.parametrize(
+    ("lose_endpoint", "error_message"),
+    [
+        (lambda endpoint: endpoint.close(), "The shared endpoint was closed"),
+        (
+            lambda endpoint: endpoint.connection_lost(OSError("Network is down")),
+            "The shared endpoint was lost",
+        ),
+    ],
+)
+async def test_endpoint_lost_fails_pending_requests(
+    error_message: str,
+    lose_endpoint: Callable[[DatagramEndpoint], None],
+    mock_datagram_endpoint: MagicMock,
+) -> None:
+    """Test that losing the endpoint fails the outstanding requests of its clients.
+
+    Args:
+    ----
+        error_message: The expected error message.
+        lose_endpoint: A callable that closes or loses the endpoint.
+        mock_datagram_endpoint: A mocked transport for a shared datagram endpoint.
+
+    """
+    endpoint = DatagramEndpoint()
+    await endpoint.open()
+
+    async with Client("192.168.1.100", endpoint=endpoint) as client:
+        ping = asyncio.create_task(client.system.ping())
+        await asyncio.sleep(0)
+        assert mock_datagram_endpoint.sendto.call_count == 1
+
+        lose_endpoint(endpoint)
+
+        with pytest.raises(SocketError) as err:
+            await ping
+
+    assert str(err.value) == error_message
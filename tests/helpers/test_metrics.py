@@ -0,0 +1,97 @@
+"""Test metrics helpers."""
+
+# pylint: disable=protected-access
+
+import asyncio
+
+import pytest
+
+from aioguardian import Client, Fleet
+from aioguardian.errors import CommandError, SocketError
+from aioguardian.helpers.command import Command
+from aioguardian.helpers.metrics import ClientMetrics, Histogram
+from aioguardian.helpers.retry import RetryPolicy
+from aioguardian.testing import FaultProfile, SimulatedDevice
+
+
+def test_histogram() -> None:
+    """Test a histogram."""
+    histogram = Histogram([0.01, 0.1])
+    for value in (0.005, 0.01, 0.05, 2):
+        histogram.observe(value)
+
+    assert histogram.buckets == [(0.01, 2), (0.1, 3), (float("inf"), 4)]
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(2.065)
+
+
+@pytest.mark.asyncio
+async def test_client_metrics() -> None:
+    """Test recording a client's metrics."""
+    metrics = ClientMetrics()
+
+    async with (
+        SimulatedDevice() as device,
+        Client(
+            device.host,
+            port=device.port,
+            request_timeout=0.05,  # type: ignore[arg-type]
+            metrics=metrics,
+            retry_policy=RetryPolicy(attempts=2, backoff_base=0.01, min_timeout=0.05),
+        ) as client,
+    ):
+        assert client.metrics is metrics
+
+        # Concurrent requests for the same command wait for each other:
+        await asyncio.gather(*(client.iot.publish_state() for _ in range(3)))
+
+        with pytest.raises(CommandError):
+            await client.sensor.paired_sensor_status("AAAAAAAAAAAA")
+        device.fail(Command.WIFI_SCAN)
+        with pytest.raises(CommandError):
+            await client.wifi.scan()
+
+        device.faults = FaultProfile(loss=1)
+        with pytest.raises(SocketError):
+            await client.system.ping()
+
+    assert metrics.requests == {
+        Command.IOT_PUBLISH_STATE: 3,
+        Command.SENSOR_PAIRED_SENSOR_STATUS: 1,
+        Command.SYSTEM_PING: 1,
+        Command.WIFI_SCAN: 1,
+    }
+    assert metrics.retries == {Command.SYSTEM_PING: 1}
+    assert metrics.timeouts == {Command.SYSTEM_PING: 2}
+    assert metrics.lock_wait[Command.IOT_PUBLISH_STATE].count == 3
+    assert metrics.lock_wait[Command.IOT_PUBLISH_STATE].sum > 0
+    assert metrics.rtt[Command.IOT_PUBLISH_STATE].count == 3
+    assert Command.SYSTEM_PING not in metrics.rtt
+
+    summary = metrics.as_dict()
+    assert summary["errors"] == {
+        "SENSOR_PAIRED_SENSOR_STATUS": {"sensor_not_paired": 1},
+        "WIFI_SCAN": {"unknown": 1},
+    }
+    assert summary["requests"]["IOT_PUBLISH_STATE"] == 3
+    assert summary["retries"] == {"SYSTEM_PING": 1}
+    assert summary["timeouts"] == {"SYSTEM_PING": 2}
+    assert summary["rtt"]["IOT_PUBLISH_STATE"][-1] == (float("inf"), 3)
+    assert summary["lock_wait"]["SYSTEM_PING"][-1] == (float("inf"), 2)
+    # Requests that got any response (even an error) count towards their latency:
+    assert summary["latency"]["CONTROL"][-1] == (float("inf"), 4)
+    assert summary["latency"]["TELEMETRY"][-1] == (float("inf"), 1)
+
+
+@pytest.mark.asyncio
+async def test_fleet_metrics() -> None:
+    """Test recording metrics for every device in a fleet."""
+    async with SimulatedDevice() as device:
+        async with Fleet(
+            [device.host], port=device.port, metrics_factory=lambda _: ClientMetrics()
+        ) as fleet:
+            await fleet.system.ping()
+
+        metrics = fleet.clients[device.host].metrics
+        assert isinstance(metrics, ClientMetrics)
+        assert metrics.requests == {Command.SYSTEM_PING: 1}
@@ -0,0 +1,65 @@
+"""Test retry helpers."""
+
+from unittest.mock import patch
+
+import pytest
+
+from aioguardian.helpers.command import Command
+from aioguardian.helpers.retry import RetryPolicy, RttEstimator
+
+
+def test_retry_policy_backoff() -> None:
+    """Test that retry delays grow exponentially, are capped, and are jittered."""
+    policy = RetryPolicy(backoff_base=0.1, backoff_max=0.5, jitter=0)
+    assert [policy.backoff(retry) for retry in range(5)] == pytest.approx(
+        [0.1, 0.2, 0.4, 0.5, 0.5]
+    )
+
+    policy = RetryPolicy(backoff_base=0.1, jitter=0.5)
+    with patch("random.uniform", return_value=0.05) as mock_uniform:
+        assert policy.backoff(0) == pytest.approx(0.05)
+    mock_uniform.assert_called_once_with(0, 0.05)
+
+
+def test_retry_policy_overrides() -> None:
+    """Test that per-command policies override the default."""
+    valve_policy = RetryPolicy(attempts=10)
+    policy = RetryPolicy(overrides={Command.VALVE_CLOSE: valve_policy})
+
+    assert policy.for_command(Command.VALVE_CLOSE) is valve_policy
+    assert policy.for_command(Command.WIFI_SCAN) is policy
+
+
+def test_rtt_estimator() -> None:
+    """Test that the RTT estimator follows the smoothed RTT approach."""
+    estimator = RttEstimator(initial_timeout=10, min_timeout=0.1, max_timeout=10)
+    assert estimator.timeout == 10
+
+    estimator.record_sample(0.2)
+    assert estimator.srtt == pytest.approx(0.2)
+    assert estimator.rttvar == pytest.approx(0.1)
+    assert estimator.timeout == pytest.approx(0.6)
+
+    estimator.record_sample(0.2)
+    assert estimator.srtt == pytest.approx(0.2)
+    assert estimator.rttvar == pytest.approx(0.075)
+    assert estimator.timeout == pytest.approx(0.5)
+
+    # Each timeout doubles the next timeout (up to the maximum):
+    estimator.record_timeout()
+    assert estimator.timeout == pytest.approx(1.0)
+    for _ in range(10):
+        estimator.record_timeout()
+    assert estimator.timeout == 10
+
+    # A new sample resets the backoff:
+    estimator.record_sample(0.2)
+    assert estimator.timeout < 1
+
+
+def test_rtt_estimator_min_timeout() -> None:
+    """Test that the RTT estimator never drops below the minimum timeout."""
+    estimator = RttEstimator(initial_timeout=10, min_timeout=0.5, max_timeout=10)
+    estimator.record_sample(0.01)
+    assert estimator.timeout == 0.5
+    assert estimator.min_rtt == 0.01
@@ -0,0 +1,126 @@
+"""Test request scheduling helpers."""
+
+import asyncio
+
+import pytest
+
+from aioguardian.errors import PreemptedError
+from aioguardian.helpers.command import Command
+from aioguardian.helpers.scheduler import COMMAND_PRIORITIES, Priority, RequestScheduler
+
+
+def test_command_priorities() -> None:
+    """Test that every command has the expected priority class."""
+    assert COMMAND_PRIORITIES[Command.VALVE_CLOSE] == Priority.VALVE
+    assert COMMAND_PRIORITIES[Command.VALVE_RESET] == Priority.CONTROL
+    assert COMMAND_PRIORITIES[Command.WIFI_STATUS] == Priority.TELEMETRY
+    assert COMMAND_PRIORITIES[Command.WIFI_SCAN] == Priority.CONTROL
+    assert set(COMMAND_PRIORITIES) == set(Command)
+
+
+@pytest.mark.asyncio
+async def test_admission_order() -> None:
+    """Test that waiting requests are admitted most urgent first."""
+    scheduler = RequestScheduler(max_in_flight=1)
+    admitted: list[str] = []
+
+    async def request(name: str, priority: Priority) -> None:
+        """Wait for admission, then finish straight away.
+
+        Args:
+        ----
+            name: The name of the request.
+            priority: The priority of the request.
+
+        """
+        await scheduler.acquire(priority)
+        admitted.append(name)
+        scheduler.release()
+
+    await scheduler.acquire(Priority.TELEMETRY)
+    tasks = [
+        asyncio.create_task(request(name, priority))
+        for name, priority in (
+            ("scan", Priority.TELEMETRY),
+            ("reset", Priority.CONTROL),
+            ("status", Priority.TELEMETRY),
+            ("close", Priority.VALVE),
+        )
+    ]
+    await asyncio.sleep(0)
+    assert len(scheduler) == 4
+
+    scheduler.release()
+    await asyncio.gather(*tasks)
+    assert admitted == ["close", "reset", "scan", "status"]
+    assert not scheduler
+
+
+@pytest.mark.asyncio
+async def test_cancelled_while_waiting() -> None:
+    """Test that a request cancelled while waiting gives up its place."""
+    scheduler = RequestScheduler(max_in_flight=1)
+    await scheduler.acquire(Priority.TELEMETRY)
+
+    waiting = asyncio.create_task(scheduler.acquire(Priority.TELEMETRY))
+    await asyncio.sleep(0)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert not scheduler
+
+    # A request that is admitted but cancelled before it runs passes its turn on:
+    admitted = asyncio.create_task(scheduler.acquire(Priority.TELEMETRY))
+    await asyncio.sleep(0)
+    scheduler.release()
+    admitted.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await admitted
+
+    async with asyncio.timeout(1):
+        await scheduler.acquire(Priority.TELEMETRY)
+
+
+@pytest.mark.asyncio
+async def test_cancel_waiting() -> None:
+    """Test cancelling waiting requests of a priority class."""
+    scheduler = RequestScheduler(max_in_flight=1)
+    await scheduler.acquire(Priority.TELEMETRY)
+
+    telemetry = asyncio.create_task(scheduler.acquire(Priority.TELEMETRY))
+    control = asyncio.create_task(scheduler.acquire(Priority.CONTROL))
+    await asyncio.sleep(0)
+
+    assert scheduler.cancel_waiting() == 1
+    with pytest.raises(PreemptedError) as err:
+        await telemetry
+    assert str(err.value) == "A waiting TELEMETRY request was cancelled"
+
+    scheduler.release()
+    await control
+
+
+@pytest.mark.asyncio
+async def test_shed_telemetry() -> None:
+    """Test that a waiting valve command can shed waiting telemetry requests."""
+    scheduler = RequestScheduler(max_in_flight=1, shed_telemetry=True)
+    await scheduler.acquire(Priority.TELEMETRY)
+
+    telemetry = asyncio.create_task(scheduler.acquire(Priority.TELEMETRY))
+    await asyncio.sleep(0)
+    valve = asyncio.create_task(scheduler.acquire(Priority.VALVE))
+    await asyncio.sleep(0)
+    with pytest.raises(PreemptedError):
+        await telemetry
+
+    # A shed request that is then cancelled doesn't pass on a turn it never had:
+    shed = asyncio.create_task(scheduler.acquire(Priority.TELEMETRY))
+    await asyncio.sleep(0)
+    scheduler.cancel_waiting()
+    shed.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await shed
+
+    scheduler.release()
+    await valve
+    assert scheduler._in_flight == 1  # pylint: disable=protected-access
@@ -0,0 +1,72 @@
+"""Test parameter validation helpers."""
+
+# pylint: disable=protected-access
+
+import subprocess
+import sys
+
+import pytest
+
+from aioguardian.commands import sensor, system, wifi
+from aioguardian.errors import CommandError
+from aioguardian.helpers.validation import _is_uid, is_uid
+
+
+def test_fallback_to_schema() -> None:
+    """Test values the fast checks reject, but the schemas accept or explain."""
+    # Non-string UIDs are accepted by the schema (which coerces them):
+    sensor.PAIRED_SENSOR_UID_VALIDATOR({"uid": 12345})
+
+    with pytest.raises(CommandError) as err:
+        system.UPGRADE_FIRMWARE_PARAM_VALIDATOR({"url": "http://"})
+    assert str(err.value) == (
+        "Invalid parameters provided: expected a URL for dictionary value @ data['url']"
+    )
+
+    with pytest.raises(CommandError) as err:
+        system.UPGRADE_FIRMWARE_PARAM_VALIDATOR({"url": 12345})
+    assert str(err.value) == (
+        "Invalid parameters provided: Invalid URL for dictionary value @ data['url']"
+    )
+
+    with pytest.raises(CommandError) as err:
+        wifi.WIFI_CONFIGURE_PARAM_VALIDATOR({"ssid": "My_Network"})
+    assert str(err.value) == (
+        "Invalid parameters provided: required key not provided @ data['password']"
+    )
+
+
+def test_legacy_schemas() -> None:
+    """Test that the voluptuous schemas are still available."""
+    assert sensor.PAIRED_SENSOR_UID_SCHEMA({"uid": "ABC123"}) == {"uid": "ABC123"}
+    assert system.UPGRADE_FIRMWARE_PARAM_SCHEMA({"port": 443}) == {"port": 443}
+    assert wifi.WIFI_CONFIGURE_PARAM_SCHEMA(
+        {"ssid": "My_Network", "password": "hunter2"}
+    ) == {"ssid": "My_Network", "password": "hunter2"}
+
+    for module in (sensor, system, wifi):
+        with pytest.raises(AttributeError):
+            _ = module.NOT_REAL
+
+
+def test_uid_memoized() -> None:
+    """Test that UID validation is memoized."""
+    _is_uid.cache_clear()
+    assert is_uid("ABCDEF123456")
+    assert is_uid("ABCDEF123456")
+    assert _is_uid.cache_info().hits == 1
+    assert not is_uid("ABCDEF1234567")
+    assert not is_uid("ABC-123")
+    assert not is_uid(12345)
+
+
+def test_voluptuous_imported_lazily() -> None:
+    """Test that importing the library doesn't import voluptuous."""
+    subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            "import sys, aioguardian; assert 'voluptuous' not in sys.modules",
+        ],
+        check=True,
+    )
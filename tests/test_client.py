@@ -1,12 +1,23 @@
 """Test generic client characteristics."""
 
+# pylint: disable=protected-access
 import asyncio
+from collections.abc import Awaitable
+import json
+import logging
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from aioguardian import Client
 from aioguardian.errors import SocketError
+from aioguardian.helpers.cache import ResponseCache
+from aioguardian.helpers.command import Command
+from aioguardian.helpers.debug import DebugLogging
+from aioguardian.helpers.metrics import ClientMetrics
+from aioguardian.helpers.retry import RetryPolicy
+from aioguardian.helpers.scheduler import Priority, RequestScheduler
+from aioguardian.testing import FaultProfile, SimulatedDevice
 from tests.common import load_fixture
 
 
@@ -28,6 +39,31 @@ async def test_command_timeout(mock_datagram_client: MagicMock) -> None:
         assert str(err.value) == "SYSTEM_PING command timed out"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "recv_response", [AsyncMock(side_effect=ConnectionRefusedError(111, "Refused"))]
+)
+async def test_command_socket_error(mock_datagram_client: MagicMock) -> None:
+    """Test that a socket error while awaiting a response throws a SocketError.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    with mock_datagram_client:
+        with pytest.raises(SocketError) as err:
+            async with Client("192.168.1.100") as client:
+                await client.system.ping()
+
+        assert (
+            str(err.value) == "Unable to receive from the device: [Errno 111] Refused"
+        )
+        assert isinstance(err.value.__cause__, ConnectionRefusedError)
+        # Socket errors aren't retried:
+        assert mock_datagram_client.send.call_count == 1
+
+
 @pytest.mark.asyncio
 async def test_command_timeout_successful_retry(
     mock_datagram_client: MagicMock,
@@ -93,3 +129,551 @@ async def test_raw_command_success(mock_datagram_client: MagicMock) -> None:
         assert ping_response["command"] == 0
         assert ping_response["status"] == "ok"
         assert ping_response["data"]["uid"] == "ABCDEF123456"
+
+
+@pytest.mark.asyncio
+async def test_disconnect_with_pending_command(mock_datagram_client: MagicMock) -> None:
+    """Test that disconnecting fails any commands that are still waiting.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    with mock_datagram_client:
+        mock_datagram_client.recv.side_effect = asyncio.Event().wait
+
+        client = Client("192.168.1.100")
+        await client.connect()
+        task = asyncio.create_task(client.system.ping())
+        await asyncio.sleep(0)
+
+        client.disconnect()
+
+        with pytest.raises(SocketError) as err:
+            await task
+
+        assert str(err.value) == "The connection was closed"
+
+
+@pytest.mark.asyncio
+async def test_pipelined_commands(mock_datagram_client: MagicMock) -> None:
+    """Test that commands with different codes are in flight at the same time.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    responses = [
+        load_fixture("wifi_status_success_response.json").encode(),
+        load_fixture("onboard_sensor_status_success_response.json").encode(),
+        load_fixture("valve_status_success_response.json").encode(),
+    ]
+    sends_before_first_recv: list[int] = []
+
+    async def recv() -> tuple[bytes, str]:
+        """Return the responses in the reverse order of the requests.
+
+        Returns
+        -------
+            A datagram and the address it came from.
+
+        """
+        if not sends_before_first_recv:
+            sends_before_first_recv.append(mock_datagram_client.send.call_count)
+        return responses.pop(0), "192.168.1.100"
+
+    with mock_datagram_client:
+        mock_datagram_client.recv.side_effect = recv
+
+        async with Client("192.168.1.100") as client:
+            valve_status, onboard_status, wifi_status = await asyncio.gather(
+                client.valve.status(),
+                client.system.onboard_sensor_status(),
+                client.wifi.status(),
+            )
+
+        assert sends_before_first_recv == [3]
+        assert valve_status["command"] == 16
+        assert onboard_status["command"] == 80
+        assert wifi_status["command"] == 32
+
+
+@pytest.mark.asyncio
+async def test_same_command_serialized(mock_datagram_client: MagicMock) -> None:
+    """Test that two requests for the same command code aren't in flight together.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    with mock_datagram_client:
+        mock_datagram_client.recv.side_effect = [
+            (load_fixture("ping_success_response.json").encode(), "192.168.1.100"),
+            (load_fixture("ping_success_response.json").encode(), "192.168.1.100"),
+        ]
+
+        async with Client("192.168.1.100") as client:
+            await asyncio.gather(client.system.ping(), client.system.ping(silent=False))
+
+        assert mock_datagram_client.send.call_count == 2
+        assert mock_datagram_client.recv.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_real_command_timeout(mock_datagram_client: MagicMock) -> None:
+    """Test that a device that never responds causes a timeout.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    with mock_datagram_client, patch("asyncio.sleep"):
+        mock_datagram_client.recv.side_effect = asyncio.Event().wait
+
+        with pytest.raises(SocketError) as err:
+            async with Client("192.168.1.100", request_timeout=0.01) as client:  # type: ignore[arg-type]
+                await client.system.ping()
+
+        assert str(err.value) == "SYSTEM_PING command timed out"
+        assert mock_datagram_client.send.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_unrequested_response_discarded(mock_datagram_client: MagicMock) -> None:
+    """Test that a response nobody is waiting for is discarded.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    with mock_datagram_client:
+        mock_datagram_client.recv.side_effect = [
+            (
+                load_fixture("valve_status_success_response.json").encode(),
+                "192.168.1.100",
+            ),
+            (load_fixture("ping_success_response.json").encode(), "192.168.1.100"),
+        ]
+
+        async with Client("192.168.1.100") as client:
+            ping_response = await client.system.ping()
+
+        assert ping_response["command"] == 0
+        assert mock_datagram_client.recv.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalid_responses_discarded(mock_datagram_client: MagicMock) -> None:
+    """Test that responses that can't be routed are discarded and counted.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    metrics = ClientMetrics()
+
+    with mock_datagram_client:
+        mock_datagram_client.recv.side_effect = [
+            (b"not json", "192.168.1.100"),
+            (b"[]", "192.168.1.100"),
+            (b'{"command": [0]}', "192.168.1.100"),
+            (
+                load_fixture("valve_status_success_response.json").encode(),
+                "192.168.1.100",
+            ),
+            (load_fixture("ping_success_response.json").encode(), "192.168.1.100"),
+        ]
+
+        async with Client("192.168.1.100", metrics=metrics) as client:
+            ping_response = await client.system.ping()
+
+        assert ping_response["command"] == 0
+        assert metrics.discarded == {"invalid": 3, "unsolicited": 1}
+
+
+@pytest.mark.asyncio
+async def test_stale_response_discarded(mock_datagram_client: MagicMock) -> None:
+    """Test that a late response to a timed out attempt isn't mistaken for the retry's.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    metrics = ClientMetrics()
+    ping_response = (
+        load_fixture("ping_success_response.json").encode(),
+        "192.168.1.100",
+    )
+
+    with mock_datagram_client, patch("asyncio.sleep"):
+        mock_datagram_client.recv.side_effect = [
+            # Until a round trip has been measured, nothing is considered too soon:
+            asyncio.TimeoutError,
+            ping_response,
+            # A response that arrives immediately after a retry is sent (i.e., faster
+            # than any round trip seen so far) must belong to the attempt that timed
+            # out:
+            asyncio.TimeoutError,
+            ping_response,
+            ping_response,
+        ]
+
+        async with Client("192.168.1.100", metrics=metrics) as client:
+            await client.system.ping()
+            assert not metrics.discarded
+
+            client._rtts[Command.SYSTEM_PING].min_rtt = 10
+            await client.system.ping()
+
+        assert metrics.discarded == {"stale": 1}
+        assert mock_datagram_client.recv.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_late_response_about_another_sensor() -> None:
+    """Test that a late answer about one paired sensor isn't returned for another."""
+    metrics = ClientMetrics()
+
+    async with (
+        SimulatedDevice(
+            paired_sensor_uids=["AAAA11112222", "BBBB33334444"],
+            faults=FaultProfile(latency=0.3),
+        ) as device,
+        Client(
+            device.host,
+            port=device.port,
+            metrics=metrics,
+            retry_policy=RetryPolicy(attempts=1, timeout=0.2),
+        ) as client,
+    ):
+        device.set_wet(True, uid="AAAA11112222")
+        with pytest.raises(SocketError):
+            await client.sensor.paired_sensor_status("AAAA11112222")
+
+        # The answer about the first sensor arrives while this request is outstanding:
+        device.faults = FaultProfile(latency=0.15)
+        status = await client.sensor.paired_sensor_status("BBBB33334444")
+
+    assert status["data"]["uid"] == "BBBB33334444"
+    assert status["data"]["wet"] is False
+    assert metrics.discarded == {"stale": 1}
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_deadline(mock_datagram_client: MagicMock) -> None:
+    """Test that a retry policy's deadline stops retries early.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    with mock_datagram_client:
+        mock_datagram_client.recv.side_effect = asyncio.Event().wait
+
+        with pytest.raises(SocketError) as err:
+            async with Client(
+                "192.168.1.100",
+                request_timeout=0.02,  # type: ignore[arg-type]
+                retry_policy=RetryPolicy(attempts=10, backoff_base=0.01, deadline=0.05),
+            ) as client:
+                await client.system.ping()
+
+        assert str(err.value) == "SYSTEM_PING command timed out"
+        assert mock_datagram_client.send.call_count < 10
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_override(mock_datagram_client: MagicMock) -> None:
+    """Test that a per-command retry policy is used for that command.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    with mock_datagram_client, patch("asyncio.sleep"):
+        mock_datagram_client.recv.side_effect = asyncio.TimeoutError
+
+        with pytest.raises(SocketError):
+            async with Client(
+                "192.168.1.100",
+                retry_policy=RetryPolicy(
+                    attempts=2, overrides={Command.SYSTEM_PING: RetryPolicy(attempts=5)}
+                ),
+            ) as client:
+                await client.system.ping()
+
+        assert mock_datagram_client.send.call_count == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "command_response", [load_fixture("ping_success_response.json").encode()]
+)
+async def test_rtt_sampled_on_first_attempt(mock_datagram_client: MagicMock) -> None:
+    """Test that per-attempt timeouts adapt to the device's round-trip time.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    with mock_datagram_client:
+        async with Client("192.168.1.100") as client:
+            rtt_estimator = client._get_rtt_estimator(Command.SYSTEM_PING)
+            assert rtt_estimator.timeout == 10
+            await client.system.ping()
+            assert rtt_estimator.srtt is not None
+            assert rtt_estimator.timeout < 10
+            # Other commands keep estimates of their own:
+            assert client._get_rtt_estimator(Command.VALVE_STATUS).srtt is None
+
+
+@pytest.mark.asyncio
+async def test_slow_commands_after_fast_ones() -> None:
+    """Test that fast commands don't shrink the timeouts of slow ones."""
+    async with (
+        SimulatedDevice() as device,
+        Client(
+            device.host,
+            port=device.port,
+            request_timeout=2,
+            retry_policy=RetryPolicy(min_timeout=0.01),
+        ) as client,
+    ):
+        for _ in range(5):
+            await client.system.ping()
+        assert client._get_rtt_estimator(Command.SYSTEM_PING).timeout < 0.3
+
+        device.faults = FaultProfile(latency=0.3)
+        # A WiFi scan always gets the full request timeout; a read-only command that
+        # hasn't been measured yet starts out with it:
+        await client.wifi.scan()
+        await client.valve.status()
+
+    assert device.received[Command.SYSTEM_PING] == 5
+    assert device.received[Command.VALVE_STATUS] == 1
+    assert device.received[Command.WIFI_SCAN] == 1
+
+
+@pytest.mark.asyncio
+async def test_response_cache(mock_datagram_client: MagicMock) -> None:
+    """Test that cached responses don't go over the wire.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    with mock_datagram_client:
+        mock_datagram_client.recv.side_effect = [
+            (
+                load_fixture("valve_status_success_response.json").encode(),
+                "192.168.1.100",
+            ),
+            (
+                load_fixture("valve_close_success_response.json").encode(),
+                "192.168.1.100",
+            ),
+            (
+                load_fixture("valve_status_success_response.json").encode(),
+                "192.168.1.100",
+            ),
+        ]
+
+        async with Client("192.168.1.100", cache=ResponseCache()) as client:
+            first_status = await client.valve.status()
+            second_status = await client.valve.status()
+            assert mock_datagram_client.send.call_count == 1
+            assert first_status == second_status
+
+            # Closing the valve invalidates the cached status:
+            await client.valve.close()
+            await client.valve.status()
+            assert mock_datagram_client.send.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_coalesced(mock_datagram_client: MagicMock) -> None:
+    """Test that identical in-flight read-only requests share one round trip.
+
+    Args:
+    ----
+        mock_datagram_client: A mocked UDP client.
+
+    """
+    with mock_datagram_client:
+        mock_datagram_client.recv.side_effect = [
+            (
+                load_fixture("valve_status_success_response.json").encode(),
+                "192.168.1.100",
+            ),
+        ]
+
+        async with Client("192.168.1.100") as client:
+            responses = await asyncio.gather(
+                client.valve.status(), client.valve.status(), client.valve.status()
+            )
+
+        assert mock_datagram_client.send.call_count == 1
+        # Each caller gets its own (correctly post-processed) payload:
+        for response in responses:
+            assert response["data"]["state"] == "default"
+        assert responses[0] is not responses[1]
+
+
+@pytest.mark.asyncio
+async def test_debug_logging(caplog: pytest.LogCaptureFixture) -> None:
+    """Test sampling debug logs of received datagrams.
+
+    Args:
+    ----
+        caplog: A mocked logging utility.
+
+    """
+    async with (
+        SimulatedDevice() as device,
+        Client(
+            device.host,
+            port=device.port,
+            debug_logging=DebugLogging(sample_every=2, raw=True),
+        ) as client,
+    ):
+        # Nothing is logged unless debug logging is enabled:
+        await client.system.ping()
+        assert not caplog.messages
+
+        caplog.set_level(logging.DEBUG)
+        for _ in range(4):
+            await client.system.ping()
+
+    response = {
+        "command": 0,
+        "status": "ok",
+        "silent": True,
+        "data": {"uid": "ABCDEF123456"},
+    }
+    assert (
+        caplog.messages
+        == [
+            f"Received data from {(device.host, device.port)}: "
+            f"{json.dumps(response).encode()!r}"
+        ]
+        * 2
+    )
+
+
+@pytest.mark.asyncio
+async def test_restart_grace_period() -> None:
+    """Test that a device that answers long enough after restarting is ready."""
+    async with (
+        SimulatedDevice(reboot_time=0) as device,
+        Client(device.host, port=device.port) as client,
+    ):
+        with (
+            patch("aioguardian.client.RESTART_PROBE_INTERVAL", 0.01),
+            patch("aioguardian.client.RESTART_GRACE_PERIOD", 0.05),
+        ):
+            await client.system.reboot()
+            data = await client.valve.status()
+            assert data["status"] == "ok"
+            assert not client.restarting
+            assert device.received[Command.SYSTEM_PING] >= 1
+
+
+@pytest.mark.asyncio
+async def test_restart_timeout(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that held commands are released when a device doesn't come back.
+
+    Args:
+    ----
+        caplog: A mocked logging utility.
+
+    """
+    async with (
+        SimulatedDevice(reboot_time=10) as device,
+        Client(
+            device.host,
+            port=device.port,
+            request_timeout=0.02,  # type: ignore[arg-type]
+            retry_policy=RetryPolicy(attempts=1, min_timeout=0.02),
+        ) as client,
+    ):
+        with (
+            patch("aioguardian.client.RESTART_PROBE_INTERVAL", 0.01),
+            patch("aioguardian.client.RESTART_TIMEOUT", 0.1),
+        ):
+            await client.system.reboot()
+            with pytest.raises(SocketError):
+                await client.valve.status()
+
+    assert "Device didn't finish restarting within 0.1 seconds" in caplog.messages
+
+
+@pytest.mark.asyncio
+async def test_disconnect_while_restarting() -> None:
+    """Test that disconnecting releases (and fails) held commands."""
+    async with SimulatedDevice(reboot_time=10) as device:
+        client = Client(device.host, port=device.port)
+        await client.connect()
+        await client.system.reboot()
+
+        request = asyncio.create_task(client.valve.status())
+        await asyncio.sleep(0)
+        client.disconnect()
+        assert not client.restarting
+        with pytest.raises(SocketError):
+            await request
+        assert not await client._ping_once()
+
+
+@pytest.mark.asyncio
+async def test_valve_commands_jump_the_queue() -> None:
+    """Test that valve commands are sent ahead of waiting telemetry."""
+    metrics = ClientMetrics()
+    async with (
+        SimulatedDevice(faults=FaultProfile(latency=0.02)) as device,
+        Client(
+            device.host,
+            port=device.port,
+            metrics=metrics,
+            scheduler=RequestScheduler(max_in_flight=1),
+        ) as client,
+    ):
+        finished: list[str] = []
+
+        async def run(name: str, request: Awaitable[object]) -> None:
+            """Run a request and note when it finishes.
+
+            Args:
+            ----
+                name: The name of the request.
+                request: The request.
+
+            """
+            await request
+            finished.append(name)
+
+        telemetry = [
+            run("wifi_status", client.wifi.status()),
+            run("pair_dump", client.sensor.pair_dump()),
+            run("diagnostics", client.system.diagnostics()),
+        ]
+        tasks = [asyncio.create_task(request) for request in telemetry]
+        await asyncio.sleep(0.005)
+        assert len(client.scheduler) == 2
+
+        await run("close", client.valve.close())
+        assert finished == ["wifi_status", "close"]
+        await asyncio.gather(*tasks)
+
+    assert metrics.latency[Priority.VALVE].count == 1
+    assert metrics.latency[Priority.TELEMETRY].count == 3
@@ -0,0 +1,234 @@
+"""Test the fleet object."""
+
+import asyncio
+import socket
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from aioguardian import Client, Fleet
+from aioguardian.errors import SocketError
+from aioguardian.helpers.datagram import (
+    DatagramEndpoint,
+    DatagramHandler,
+    DeviceStream,
+    LostHandler,
+)
+
+
+@pytest.mark.asyncio
+async def test_fleet_as_completed_early_exit(mock_datagram_endpoint: MagicMock) -> None:
+    """Test that leaving the as_completed iterator early cancels the rest.
+
+    Args:
+    ----
+        mock_datagram_endpoint: A mocked transport for a shared datagram endpoint.
+
+    """
+    async with Fleet(["192.168.1.100", "192.168.1.101"]) as fleet:
+        async for ip_address, response in fleet.as_completed(
+            lambda client: client.system.ping()
+        ):
+            assert ip_address in fleet.clients
+            assert response["command"] == 0  # type: ignore[index]
+            break
+
+
+@pytest.mark.asyncio
+async def test_fleet_bulk_command(mock_datagram_endpoint: MagicMock) -> None:
+    """Test running a command against every device in a fleet.
+
+    Args:
+    ----
+        mock_datagram_endpoint: A mocked transport for a shared datagram endpoint.
+
+    """
+    async with Fleet(["192.168.1.100", "192.168.1.101"]) as fleet:
+        results = await fleet.valve.status()
+
+    assert set(results) == {"192.168.1.100", "192.168.1.101"}
+    for response in results.values():
+        assert response["command"] == 16  # type: ignore[index]
+        assert response["data"]["state"] == "default"  # type: ignore[index]
+
+    # Both devices share the single endpoint:
+    assert mock_datagram_endpoint.sendto.call_count == 2
+    assert {call.args[1] for call in mock_datagram_endpoint.sendto.call_args_list} == {
+        ("192.168.1.100", 7777),
+        ("192.168.1.101", 7777),
+    }
+    mock_datagram_endpoint.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_fleet_concurrency_cap(mock_datagram_endpoint: MagicMock) -> None:
+    """Test that the fleet caps the number of devices talked to at once.
+
+    Args:
+    ----
+        mock_datagram_endpoint: A mocked transport for a shared datagram endpoint.
+
+    """
+    in_flight = 0
+    max_in_flight = 0
+
+    async def ping(client: Client) -> dict:
+        """Ping a device while tracking concurrency.
+
+        Args:
+        ----
+            client: The client for the device.
+
+        Returns:
+        -------
+            An API response payload.
+
+        """
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            return await client.system.ping()
+        finally:
+            in_flight -= 1
+
+    ip_addresses = [f"192.168.1.{idx}" for idx in range(100, 110)]
+    async with Fleet(ip_addresses, max_concurrency=3) as fleet:
+        results = await fleet.execute(ping)
+
+    assert len(results) == 10
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("unresponsive_devices", [["192.168.1.101"]])
+async def test_fleet_device_error(mock_datagram_endpoint: MagicMock) -> None:
+    """Test that an error on one device doesn't fail the whole fleet.
+
+    Args:
+    ----
+        mock_datagram_endpoint: A mocked transport for a shared datagram endpoint.
+
+    """
+    with patch("asyncio.sleep"):
+        async with Fleet(
+            ["192.168.1.100", "192.168.1.101"],
+            request_timeout=0.01,  # type: ignore[arg-type]
+        ) as fleet:
+            results = await fleet.system.ping()
+
+    assert results["192.168.1.100"]["command"] == 0  # type: ignore[index]
+    assert isinstance(results["192.168.1.101"], SocketError)
+    assert str(results["192.168.1.101"]) == "SYSTEM_PING command timed out"
+
+
+@pytest.mark.asyncio
+async def test_fleet_register_error(mock_datagram_endpoint: MagicMock) -> None:
+    """Test that an unexpected error while registering a device throws an exception.
+
+    Args:
+    ----
+        mock_datagram_endpoint: A mocked transport for a shared datagram endpoint.
+
+    """
+    with (
+        patch.object(DatagramEndpoint, "register", side_effect=RuntimeError("Bug")),
+        pytest.raises(RuntimeError),
+    ):
+        async with Fleet(["192.168.1.100"]):
+            pass
+
+    # The shared socket isn't left open:
+    mock_datagram_endpoint.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_fleet_register_timeout(mock_datagram_endpoint: MagicMock) -> None:
+    """Test that a timeout while registering a device is reported for that device.
+
+    Args:
+    ----
+        mock_datagram_endpoint: A mocked transport for a shared datagram endpoint.
+
+    """
+    with patch.object(DatagramEndpoint, "register", side_effect=asyncio.TimeoutError):
+        async with Fleet(["192.168.1.100"]) as fleet:
+            assert isinstance(fleet.connect_errors["192.168.1.100"], SocketError)
+            assert (
+                str(fleet.connect_errors["192.168.1.100"])
+                == "Connection to device timed out"
+            )
+
+
+@pytest.mark.asyncio
+async def test_fleet_unresolvable_device(
+    caplog: pytest.LogCaptureFixture, mock_datagram_endpoint: MagicMock
+) -> None:
+    """Test that a device that can't be resolved doesn't stop the rest of the fleet.
+
+    Args:
+    ----
+        caplog: A mocked logging utility.
+        mock_datagram_endpoint: A mocked transport for a shared datagram endpoint.
+
+    """
+    register = DatagramEndpoint.register
+
+    async def register_or_fail(
+        endpoint: DatagramEndpoint,
+        host: str,
+        port: int,
+        handler: DatagramHandler,
+        *,
+        on_lost: LostHandler | None = None,
+    ) -> DeviceStream:
+        """Fail to resolve one of the devices.
+
+        Args:
+        ----
+            endpoint: The shared endpoint.
+            host: The IP address or hostname of the device.
+            port: The port of the device.
+            handler: A callback to run with each datagram the device sends.
+            on_lost: An optional callback to run if the endpoint is lost.
+
+        Returns:
+        -------
+            A stream that sends datagrams to the device.
+
+        Raises:
+        ------
+            socket.gaierror: Raised for the unresolvable device.
+
+        """
+        if host == "guardian.invalid":
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        return await register(endpoint, host, port, handler, on_lost=on_lost)
+
+    with patch.object(DatagramEndpoint, "register", register_or_fail):
+        async with Fleet(["192.168.1.100", "guardian.invalid"]) as fleet:
+            assert list(fleet.connect_errors) == ["guardian.invalid"]
+            results = await fleet.system.ping()
+
+    assert str(fleet.connect_errors["guardian.invalid"]) == (
+        "Unable to connect to the device: [Errno -2] Name or service not known"
+    )
+    assert "Unable to connect to guardian.invalid" in caplog.text
+    assert results["192.168.1.100"]["command"] == 0  # type: ignore[index]
+    assert isinstance(results["guardian.invalid"], SocketError)
+
+
+@pytest.mark.asyncio
+async def test_fleet_unknown_command(mock_datagram_endpoint: MagicMock) -> None:
+    """Test that an unknown fleet command throws an exception.
+
+    Args:
+    ----
+        mock_datagram_endpoint: A mocked transport for a shared datagram endpoint.
+
+    """
+    async with Fleet(["192.168.1.100"]) as fleet:
+        with pytest.raises(AttributeError) as err:
+            await fleet.valve.explode()
+
+    assert str(err.value) == "ValveCommands has no command named explode"
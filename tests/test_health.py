@@ -0,0 +1,221 @@
+"""Test connection health supervision."""
+
+# pylint: disable=protected-access
+import asyncio
+from collections.abc import AsyncGenerator
+import socket
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+
+from aioguardian import Client
+from aioguardian.errors import CircuitOpenError, CommandError, SocketError
+from aioguardian.fleet import Fleet
+from aioguardian.health import HealthPolicy, HealthState, HealthSupervisor
+from aioguardian.helpers.command import Command
+from aioguardian.helpers.retry import RetryPolicy
+from aioguardian.testing import FaultProfile, SimulatedDevice
+
+TEST_POLICY = HealthPolicy(
+    failure_threshold=2, idle_ping_interval=0.1, probe_interval=0.05
+)
+
+
+@pytest_asyncio.fixture
+async def device() -> AsyncGenerator[SimulatedDevice, None]:
+    """Define a running simulated device.
+
+    Yields
+    ------
+        A simulated device.
+
+    """
+    async with SimulatedDevice() as device:
+        yield device
+
+
+def make_client(device: SimulatedDevice, policy: HealthPolicy = TEST_POLICY) -> Client:
+    """Return a client (with fast timeouts) for a simulated device.
+
+    Args:
+    ----
+        device: The simulated device.
+        policy: The health policy.
+
+    Returns:
+    -------
+        A client.
+
+    """
+    return Client(
+        device.host,
+        port=device.port,
+        request_timeout=0.05,  # type: ignore[arg-type]
+        retry_policy=RetryPolicy(attempts=1, min_timeout=0.05),
+        health=policy,
+    )
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker(device: SimulatedDevice) -> None:
+    """Test that requests fail fast while the device is unreachable.
+
+    Args:
+    ----
+        device: A simulated device.
+
+    """
+    async with make_client(device) as client:
+        assert client.health
+        assert not client.health.consecutive_failures
+
+        device.faults = FaultProfile(loss=1)
+        with pytest.raises(SocketError):
+            await client.valve.status()
+        assert client.health.state == HealthState.DEGRADED
+        with pytest.raises(SocketError):
+            await client.valve.status()
+        assert client.health.consecutive_failures == TEST_POLICY.failure_threshold
+
+        # Requests are no longer sent to the device:
+        received = device.received[Command.VALVE_STATUS]
+        with pytest.raises(CircuitOpenError):
+            await client.valve.status()
+        assert device.received[Command.VALVE_STATUS] == received
+
+        # Once the device responds again, a probe closes the circuit:
+        device.faults = FaultProfile()
+        await asyncio.sleep(0.2)
+        assert not client.health.consecutive_failures
+        assert device.received[Command.SYSTEM_PING]
+        data = await client.valve.status()
+        assert data["status"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_error_response_is_healthy(device: SimulatedDevice) -> None:
+    """Test that a response reporting an error still counts as a healthy one.
+
+    Args:
+    ----
+        device: A simulated device.
+
+    """
+    async with make_client(device) as client:
+        assert client.health
+        device.faults = FaultProfile(loss=1)
+        with pytest.raises(SocketError):
+            await client.valve.status()
+        assert client.health.consecutive_failures == 1
+
+        device.faults = FaultProfile()
+        device.fail(Command.VALVE_STATUS)
+        with pytest.raises(CommandError):
+            await client.valve.status()
+        assert client.health.state == HealthState.HEALTHY
+
+
+@pytest.mark.asyncio
+async def test_fleet_health(device: SimulatedDevice) -> None:
+    """Test that a fleet passes its health policy to each client.
+
+    Args:
+    ----
+        device: A simulated device.
+
+    """
+    async with Fleet([device.host], port=device.port, health=TEST_POLICY) as fleet:
+        assert fleet.clients[device.host].health
+
+
+@pytest.mark.asyncio
+async def test_idle_ping(device: SimulatedDevice) -> None:
+    """Test that an idle connection is kept alive with pings.
+
+    Args:
+    ----
+        device: A simulated device.
+
+    """
+    async with make_client(device):
+        await asyncio.sleep(0.25)
+        assert device.received[Command.SYSTEM_PING] >= 1
+
+    # Nothing is pinged once the client disconnects:
+    pings = device.received[Command.SYSTEM_PING]
+    await asyncio.sleep(0.15)
+    assert device.received[Command.SYSTEM_PING] == pings
+
+
+@pytest.mark.asyncio
+async def test_probe_without_connection() -> None:
+    """Test that a probe that can't reconnect waits for the next interval."""
+    ping = AsyncMock()
+    reconnect = AsyncMock(side_effect=SocketError("Connection to device timed out"))
+    supervisor = HealthSupervisor(TEST_POLICY, ping, reconnect)
+    supervisor.consecutive_failures = TEST_POLICY.failure_threshold
+
+    supervisor.start()
+    await asyncio.sleep(0.12)
+    supervisor.stop()
+
+    assert 1 <= reconnect.await_count <= 3
+    ping.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_reconnect(device: SimulatedDevice) -> None:
+    """Test that reconnecting fails outstanding requests and keeps the client usable.
+
+    Args:
+    ----
+        device: A simulated device.
+
+    """
+    async with Client(device.host, port=device.port) as client:
+        device.faults = FaultProfile(latency=0.2)
+        request = asyncio.create_task(client.valve.status())
+        await asyncio.sleep(0.05)
+        await client.reconnect()
+        with pytest.raises(SocketError):
+            await request
+
+        device.faults = FaultProfile()
+        data = await client.valve.status()
+        assert data["status"] == "ok"
+
+        # Probing a disconnected client fails:
+        client.disconnect()
+        with pytest.raises(SocketError):
+            await client._probe()
+
+
+@pytest.mark.asyncio
+async def test_connection_refused() -> None:
+    """Test that refused connections (e.g., a device that left) open the circuit."""
+    # Find a port that nothing listens on:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    async with Client(
+        "127.0.0.1",
+        port=port,
+        request_timeout=0.1,  # type: ignore[arg-type]
+        retry_policy=RetryPolicy(attempts=1),
+        health=HealthPolicy(failure_threshold=2, probe_interval=60),
+    ) as client:
+        assert client.health
+        # The ICMP error only shows up once the first request has been sent:
+        with pytest.raises(SocketError):
+            await client.system.ping()
+
+        with pytest.raises(SocketError) as err:
+            await client.system.ping()
+        assert isinstance(err.value.__cause__, ConnectionRefusedError)
+        assert str(err.value).startswith("Unable to send to the device")
+
+        assert client.health.state == HealthState.OPEN
+        with pytest.raises(CircuitOpenError):
+            await client.system.ping()
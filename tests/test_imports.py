@@ -0,0 +1,57 @@
+"""Test that the package's imports are lazy."""
+
+import subprocess
+import sys
+
+import pytest
+
+import aioguardian
+from aioguardian import Client
+
+
+def run_python(code: str) -> None:
+    """Run Python code in a fresh interpreter.
+
+    Args:
+    ----
+        code: The code to run.
+
+    """
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_client_commands_loaded_on_first_use() -> None:
+    """Test that a client's command groups are created on first use."""
+    client = Client("192.168.1.100")
+    assert "valve" not in vars(client)
+    assert client.valve is client.valve
+    assert "valve" in vars(client)
+
+
+def test_import_client_is_lazy() -> None:
+    """Test that importing the client doesn't import command groups or their deps."""
+    run_python(
+        "import sys\n"
+        "from aioguardian import Client\n"
+        "lazy = {'asyncio_dgram', 'typing_extensions', 'urllib.parse', 'voluptuous'}\n"
+        "lazy |= {f'aioguardian.commands.{group}' for group in "
+        "('iot', 'sensor', 'system', 'valve', 'wifi')}\n"
+        "assert not lazy & set(sys.modules), lazy & set(sys.modules)\n"
+    )
+
+
+def test_import_package_is_lazy() -> None:
+    """Test that importing the package imports nothing else from it."""
+    run_python(
+        "import sys\n"
+        "import aioguardian\n"
+        "assert [m for m in sys.modules if m.startswith('aioguardian.')] == []\n"
+    )
+
+
+def test_package_attributes() -> None:
+    """Test the package's lazily imported attributes."""
+    assert {"Client", "Fleet", "Poller"} <= set(dir(aioguardian))
+
+    with pytest.raises(AttributeError):
+        _ = aioguardian.NotAThing
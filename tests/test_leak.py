@@ -0,0 +1,268 @@
+"""Test the leak responder."""
+
+# pylint: disable=protected-access
+import asyncio
+from collections.abc import AsyncGenerator
+import json
+
+import pytest
+import pytest_asyncio
+
+from aioguardian import Client
+from aioguardian.helpers.cache import ResponseCache
+from aioguardian.helpers.command import Command
+from aioguardian.helpers.retry import RetryPolicy
+from aioguardian.leak import LeakResponder
+from aioguardian.models import ValveState
+from aioguardian.testing import FaultProfile, SimulatedDevice
+
+OTHER_UID = "AAAAAAAAAAAA"
+TEST_UID = "6309FB799CDE"
+
+
+@pytest_asyncio.fixture
+async def device() -> AsyncGenerator[SimulatedDevice, None]:
+    """Define a running simulated device.
+
+    Yields
+    ------
+        A simulated device.
+
+    """
+    async with SimulatedDevice(valve_travel_time=0.04) as device:
+        yield device
+
+
+@pytest_asyncio.fixture
+async def client(device: SimulatedDevice) -> AsyncGenerator[Client, None]:
+    """Define a client connected to a simulated device (with a response cache).
+
+    Args:
+    ----
+        device: A simulated device.
+
+    Yields:
+    ------
+        A connected client.
+
+    """
+    async with Client(
+        device.host,
+        port=device.port,
+        request_timeout=1,
+        retry_policy=RetryPolicy(min_timeout=0.02),
+        cache=ResponseCache(),
+    ) as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_close_on_leak(client: Client, device: SimulatedDevice) -> None:
+    """Test that the valve is closed as soon as the onboard sensor gets wet.
+
+    Args:
+    ----
+        client: A connected client.
+        device: A simulated device.
+
+    """
+    responder = LeakResponder(client)
+    await responder.check()
+    assert Command.VALVE_CLOSE not in device.received
+    assert responder.triggers == 0
+
+    # The cached (dry) readings aren't trusted:
+    assert not (await client.system.onboard_sensor_status())["data"]["wet"]
+    device.set_wet(True)
+    await responder.check()
+    assert device.received[Command.VALVE_CLOSE] == 1
+    assert device.valve_state in {ValveState.START_CLOSING, ValveState.CLOSING}
+    assert responder.triggers == 1
+    assert responder.latency.count == 1
+
+    # A sensor that stays wet doesn't close the valve again:
+    await responder.check()
+    assert device.received[Command.VALVE_CLOSE] == 1
+
+    # ...but one that dries out and gets wet again does:
+    device.set_wet(False)
+    await responder.check()
+    device.set_wet(True)
+    await responder.check()
+    assert device.received[Command.VALVE_CLOSE] == 2
+    assert responder.triggers == 2
+
+
+@pytest.mark.asyncio
+async def test_deduplicate_triggers(client: Client, device: SimulatedDevice) -> None:
+    """Test that leaks reported by several sensors at once close the valve once.
+
+    Args:
+    ----
+        client: A connected client.
+        device: A simulated device.
+
+    """
+    device.faults = FaultProfile(latency=0.01)
+    device.pair_sensor(OTHER_UID)
+    device.set_wet(True, uid=TEST_UID)
+    device.set_wet(True, uid=OTHER_UID)
+
+    responder = LeakResponder(client)
+    await responder.check()
+    assert device.received[Command.VALVE_CLOSE] == 1
+    assert responder.triggers == 2
+    assert responder.deduplicated == 1
+    assert responder.latency.count == 1
+
+
+@pytest.mark.asyncio
+async def test_paired_sensors_disabled(client: Client, device: SimulatedDevice) -> None:
+    """Test that paired sensors can be left out of checks.
+
+    Args:
+    ----
+        client: A connected client.
+        device: A simulated device.
+
+    """
+    device.set_wet(True, uid=TEST_UID)
+
+    responder = LeakResponder(client, paired_sensors=False)
+    await responder.check()
+    assert Command.SENSOR_PAIR_DUMP not in device.received
+    assert Command.VALVE_CLOSE not in device.received
+
+
+@pytest.mark.asyncio
+async def test_valve_already_closed(client: Client, device: SimulatedDevice) -> None:
+    """Test that a valve that is already closed counts as closed.
+
+    Args:
+    ----
+        client: A connected client.
+        device: A simulated device.
+
+    """
+    device.valve_state = ValveState.CLOSED
+    device.set_wet(True)
+
+    responder = LeakResponder(client)
+    await responder.check()
+    assert responder.latency.count == 1
+
+
+@pytest.mark.asyncio
+async def test_close_failure(
+    caplog: pytest.LogCaptureFixture, client: Client, device: SimulatedDevice
+) -> None:
+    """Test that a failed close is retried on the next check.
+
+    Args:
+    ----
+        caplog: A mocked logging utility.
+        client: A connected client.
+        device: A simulated device.
+
+    """
+    device.fail(Command.VALVE_CLOSE)
+    device.fail(Command.VALVE_STATUS)
+    device.set_wet(True)
+
+    responder = LeakResponder(client)
+    await responder.check()
+    assert "Failed to close the valve after a leak" in caplog.text
+    assert responder.latency.count == 0
+
+    device.recover(Command.VALVE_CLOSE)
+    await responder.check()
+    assert device.received[Command.VALVE_CLOSE] == 2
+    assert responder.latency.count == 1
+
+
+@pytest.mark.asyncio
+async def test_lost_close(device: SimulatedDevice) -> None:
+    """Test that a lost close is retried well before the client's request timeout.
+
+    Args:
+    ----
+        device: A simulated device.
+
+    """
+    datagram_received = device.datagram_received
+    dropped: list[bytes] = []
+
+    def drop_first_close(data: bytes, addr: tuple[str, int]) -> None:
+        """Drop the first request to close the valve.
+
+        Args:
+        ----
+            data: The request datagram.
+            addr: The address the request came from.
+
+        """
+        if not dropped and json.loads(data)["command"] == Command.VALVE_CLOSE.value:
+            dropped.append(data)
+            return
+        datagram_received(data, addr)
+
+    device.datagram_received = drop_first_close  # type: ignore[method-assign]
+    device.set_wet(True)
+
+    async with Client(device.host, port=device.port, request_timeout=10) as client:
+        responder = LeakResponder(client, paired_sensors=False, close_timeout=0.1)
+        async with asyncio.timeout(1):
+            await responder.check()
+
+    assert dropped
+    assert device.received[Command.VALVE_CLOSE] == 1
+    assert responder.latency.count == 1
+    assert responder.latency.sum >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_check_errors(client: Client, device: SimulatedDevice) -> None:
+    """Test that sensors that can't be checked don't stop the others being checked.
+
+    Args:
+    ----
+        client: A connected client.
+        device: A simulated device.
+
+    """
+    device.fail(Command.SYSTEM_ONBOARD_SENSOR_STATUS)
+    device.fail(Command.SENSOR_PAIR_DUMP)
+    device.set_wet(True)
+    responder = LeakResponder(client)
+    await responder.check()
+    assert Command.VALVE_CLOSE not in device.received
+
+    device.recover(Command.SENSOR_PAIR_DUMP)
+    device.fail(Command.SENSOR_PAIRED_SENSOR_STATUS)
+    await responder.check()
+    assert Command.VALVE_CLOSE not in device.received
+
+    device.recover(Command.SYSTEM_ONBOARD_SENSOR_STATUS)
+    await responder.check()
+    assert device.received[Command.VALVE_CLOSE] == 1
+
+
+@pytest.mark.asyncio
+async def test_background_checks(client: Client, device: SimulatedDevice) -> None:
+    """Test checking the sensors in the background.
+
+    Args:
+    ----
+        client: A connected client.
+        device: A simulated device.
+
+    """
+    async with LeakResponder(client, check_interval=0.01) as responder:
+        responder.start()
+        device.set_wet(True, uid=TEST_UID)
+        async with asyncio.timeout(1):
+            while Command.VALVE_CLOSE not in device.received:  # noqa: ASYNC110
+                await asyncio.sleep(0.01)
+
+    assert responder._task is None
+    assert responder.latency.count == 1
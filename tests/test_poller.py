@@ -0,0 +1,445 @@
+"""Test the poller object."""
+
+# pylint: disable=protected-access
+import asyncio
+from collections.abc import AsyncGenerator
+import contextlib
+import json
+import logging
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import pytest_asyncio
+
+from aioguardian import Client, Poller
+from aioguardian.errors import CommandError
+from aioguardian.helpers.command import Command
+from aioguardian.helpers.datagram import DatagramEndpoint
+from aioguardian.poller import (
+    DEFAULT_POLL_INTERVALS,
+    AdaptivePolling,
+    Overflow,
+    PollUpdate,
+    _UpdateQueue,
+)
+
+
+@pytest_asyncio.fixture
+async def client(mock_datagram_endpoint: MagicMock) -> AsyncGenerator[Client, None]:
+    """Define a client connected to a mocked device.
+
+    Args:
+    ----
+        mock_datagram_endpoint: A mocked transport for a shared datagram endpoint.
+
+    Yields:
+    ------
+        A connected client.
+
+    """
+    endpoint = DatagramEndpoint()
+    await endpoint.open()
+    async with Client("192.168.1.100", endpoint=endpoint) as client:
+        yield client
+    endpoint.close()
+
+
+@pytest.mark.asyncio
+async def test_poll_change_only(client: Client) -> None:
+    """Test that subscribers are only notified when polled data changes.
+
+    Args:
+    ----
+        client: A connected client.
+
+    """
+    poller = Poller(client)
+    updates: list[PollUpdate] = []
+    poller.subscribe(updates.append)
+
+    await poller.poll()
+    assert {(update.command, update.uid) for update in updates} == {
+        (Command.SENSOR_PAIRED_SENSOR_STATUS, "6309FB799CDE"),
+        (Command.SYSTEM_ONBOARD_SENSOR_STATUS, None),
+        (Command.VALVE_STATUS, None),
+        (Command.WIFI_STATUS, None),
+    }
+    assert poller.get(Command.VALVE_STATUS)["state"] == "default"  # type: ignore[index]
+    assert poller.get(Command.SENSOR_PAIRED_SENSOR_STATUS) is None
+
+    # Nothing has changed, so nobody is notified:
+    updates.clear()
+    await poller.poll()
+    assert not updates
+
+    with patch.object(
+        client.valve,
+        "status",
+        AsyncMock(
+            return_value={
+                "command": 16,
+                "status": "ok",
+                "data": {**poller.get(Command.VALVE_STATUS), "state": "opening"},  # type: ignore[dict-item]
+            }
+        ),
+    ):
+        await poller.poll(Command.VALVE_STATUS)
+
+    assert len(updates) == 1
+    assert updates[0].command == Command.VALVE_STATUS
+    assert updates[0].changes == {"state": "opening"}
+    assert updates[0].data["travel_count"] == 0
+
+
+def test_poll_invalid_command(client: Client) -> None:
+    """Test that only supported commands can be polled.
+
+    Args:
+    ----
+        client: A connected client.
+
+    """
+    with pytest.raises(CommandError) as err:
+        Poller(client, intervals={Command.WIFI_LIST: 10.0})
+    assert str(err.value) == "WIFI_LIST can't be polled"
+
+
+@pytest.mark.asyncio
+async def test_poll_errors(client: Client, caplog: pytest.LogCaptureFixture) -> None:
+    """Test that polling errors are logged and unpaired sensors are forgotten.
+
+    Args:
+    ----
+        client: A connected client.
+        caplog: A mocked logging utility.
+
+    """
+    caplog.set_level(logging.DEBUG)
+    poller = Poller(client)
+    await poller.poll(Command.SENSOR_PAIRED_SENSOR_STATUS)
+    assert poller.get(Command.SENSOR_PAIRED_SENSOR_STATUS, "6309FB799CDE")
+
+    with (
+        patch.object(
+            client.sensor,
+            "all_paired_sensor_statuses",
+            AsyncMock(return_value={"ABCDE1234567": CommandError("Whoops")}),
+        ),
+        patch.object(
+            client.valve, "status", AsyncMock(side_effect=CommandError("Oof"))
+        ),
+    ):
+        await poller.poll(Command.SENSOR_PAIRED_SENSOR_STATUS, Command.VALVE_STATUS)
+
+    assert poller.get(Command.SENSOR_PAIRED_SENSOR_STATUS, "6309FB799CDE") is None
+    assert "Error while polling paired sensor ABCDE1234567: Whoops" in caplog.text
+    assert "Error while polling VALVE_STATUS: Oof" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_poll_merged_wake_ups(client: Client) -> None:
+    """Test that polls which fall due close together share a wake-up.
+
+    Args:
+    ----
+        client: A connected client.
+
+    """
+    poller = Poller(
+        client,
+        intervals={Command.VALVE_STATUS: 0.05, Command.WIFI_STATUS: 0.06},
+        merge_window=0.02,
+    )
+
+    with patch.object(poller, "poll", AsyncMock(wraps=poller.poll)) as mock_poll:
+        async with poller:
+            poller.start()  # Starting a running poller does nothing.
+            while mock_poll.call_count < 2:  # noqa: ASYNC110
+                await asyncio.sleep(0.01)
+
+    for call in mock_poll.call_args_list[:2]:
+        assert set(call.args) == {Command.VALVE_STATUS, Command.WIFI_STATUS}
+
+    # Stopping a stopped poller does nothing:
+    await poller.stop()
+
+
+@pytest.mark.asyncio
+async def test_poll_interval_within_merge_window(client: Client) -> None:
+    """Test that an interval no longer than the merge window doesn't poll nonstop.
+
+    Args:
+    ----
+        client: A connected client.
+
+    """
+    status = client.valve.status
+
+    async def slow_status() -> dict[str, Any]:
+        """Get the valve status, slowly.
+
+        Returns
+        -------
+            An API response payload.
+
+        """
+        await asyncio.sleep(0.02)
+        return await status()
+
+    poller = Poller(client, intervals={Command.VALVE_STATUS: 0.5})
+
+    with patch.object(client.valve, "status", AsyncMock(side_effect=slow_status)):
+        async with poller:
+            await asyncio.sleep(1.2)
+
+        # Polled at roughly 0, 0.5, and 1.0 seconds (rather than back to back):
+        assert 2 <= client.valve.status.call_count <= 3  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_poll_subscriptions(
+    client: Client, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test filtered subscriptions, unsubscribing, and failing subscribers.
+
+    Args:
+    ----
+        client: A connected client.
+        caplog: A mocked logging utility.
+
+    """
+    poller = Poller(client)
+    valve_updates: list[PollUpdate] = []
+    all_updates: list[PollUpdate] = []
+
+    poller.subscribe(MagicMock(side_effect=Exception("Broken subscriber")))
+    poller.subscribe(valve_updates.append, commands=[Command.VALVE_STATUS])
+    unsubscribe = poller.subscribe(all_updates.append)
+    unsubscribe()
+    unsubscribe()
+
+    await poller.poll(Command.VALVE_STATUS, Command.WIFI_STATUS)
+
+    assert [update.command for update in valve_updates] == [Command.VALVE_STATUS]
+    assert not all_updates
+    assert "Error in poll subscriber for VALVE_STATUS" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_poll_adaptive_backoff(client: Client) -> None:
+    """Test that polling speeds up while the valve moves and backs off at rest.
+
+    Args:
+    ----
+        client: A connected client.
+
+    """
+    poller = Poller(
+        client,
+        intervals={Command.VALVE_STATUS: 8.0, Command.WIFI_STATUS: 60.0},
+        adaptive=AdaptivePolling(active_interval=0.5, backoff_factor=2.0),
+    )
+    intervals = []
+
+    for state in (
+        "closed",
+        "opening",
+        "opened",
+        "opened",
+        "opened",
+        "opened",
+        "opened",
+    ):
+        with patch.object(
+            client.valve,
+            "status",
+            AsyncMock(
+                return_value={"command": 16, "status": "ok", "data": {"state": state}}
+            ),
+        ):
+            await poller.poll(Command.VALVE_STATUS)
+        poller._adapt([Command.VALVE_STATUS])
+        intervals.append(poller._current_intervals[Command.VALVE_STATUS])
+
+    assert intervals == [8.0, 0.5, 1.0, 2.0, 4.0, 8.0, 8.0]
+    # Commands that aren't adaptive keep their interval:
+    assert poller._current_intervals[Command.WIFI_STATUS] == 60.0
+
+
+@pytest.mark.asyncio
+async def test_poll_adaptive_leak(client: Client) -> None:
+    """Test that a leak speeds up polling of the valve.
+
+    Args:
+    ----
+        client: A connected client.
+
+    """
+    poller = Poller(
+        client,
+        intervals={
+            Command.SYSTEM_ONBOARD_SENSOR_STATUS: 60.0,
+            Command.VALVE_STATUS: 60.0,
+        },
+        merge_window=0,
+        adaptive=AdaptivePolling(active_interval=0.01),
+    )
+
+    with (
+        patch.object(
+            client.system,
+            "onboard_sensor_status",
+            AsyncMock(
+                return_value={
+                    "command": 80,
+                    "status": "ok",
+                    "data": {"temperature": 71, "wet": True},
+                }
+            ),
+        ),
+        patch.object(client.valve, "status", AsyncMock(wraps=client.valve.status)),
+    ):
+        async with poller:
+            while client.valve.status.call_count < 3:  # type: ignore[attr-defined]  # noqa: ASYNC110
+                await asyncio.sleep(0.01)
+
+    assert poller.active
+
+
+@pytest.mark.asyncio
+async def test_poll_adaptive_defaults(client: Client) -> None:
+    """Test that the default adaptive policy polls an active device every half second.
+
+    Args:
+    ----
+        client: A connected client.
+
+    """
+    poller = Poller(client, adaptive=AdaptivePolling())
+
+    with (
+        patch.object(
+            client.system,
+            "onboard_sensor_status",
+            AsyncMock(
+                return_value={
+                    "command": 80,
+                    "status": "ok",
+                    "data": {"temperature": 71, "wet": True},
+                }
+            ),
+        ) as onboard_sensor_status,
+        patch.object(
+            client.sensor,
+            "all_paired_sensor_statuses",
+            AsyncMock(wraps=client.sensor.all_paired_sensor_statuses),
+        ) as all_paired_sensor_statuses,
+        patch.object(
+            client.valve, "status", AsyncMock(wraps=client.valve.status)
+        ) as valve_status,
+    ):
+        async with poller:
+            await asyncio.sleep(1.2)
+
+    assert poller.active
+    # Polled at roughly 0, 0.5, and 1.0 seconds (rather than back to back):
+    for mock in (all_paired_sensor_statuses, onboard_sensor_status, valve_status):
+        assert 2 <= mock.call_count <= 3
+
+
+@pytest.mark.asyncio
+async def test_watch(client: Client, mock_datagram_endpoint: MagicMock) -> None:
+    """Test watching a client for changes.
+
+    Args:
+    ----
+        client: A connected client.
+        mock_datagram_endpoint: A mocked transport for a shared datagram endpoint.
+
+    """
+    async with contextlib.aclosing(client.watch(Command.VALVE_STATUS)) as updates:
+        update = await anext(updates)
+        assert update.command == Command.VALVE_STATUS
+        assert update.changes["state"] == "default"
+
+        # A second watcher shares the polling loop and starts with the latest data:
+        async with contextlib.aclosing(
+            client.watch(
+                Command.VALVE_STATUS, max_queue_size=1, overflow=Overflow.DROP_OLDEST
+            )
+        ) as other_updates:
+            assert (await anext(other_updates)).data == update.data
+
+    # Only the watched command was polled:
+    assert {
+        json.loads(call.args[0])["command"]
+        for call in mock_datagram_endpoint.sendto.call_args_list
+    } == {Command.VALVE_STATUS.value}
+
+    # The polling loop stops once nobody is watching:
+    assert client._poller._task is None  # type: ignore[union-attr]
+
+    with pytest.raises(CommandError):
+        await anext(client.watch(Command.WIFI_LIST))
+
+
+@pytest.mark.asyncio
+async def test_watch_backpressure() -> None:
+    """Test what happens when a watcher falls behind."""
+
+    def make_update(command: Command, **changes: Any) -> PollUpdate:  # noqa: ANN401
+        """Make an update.
+
+        Args:
+        ----
+            command: The command that was polled.
+            **changes: The fields that changed.
+
+        Returns:
+        -------
+            An update.
+
+        """
+        return PollUpdate(command=command, uid=None, data=changes, changes=changes)
+
+    queue = _UpdateQueue(2, Overflow.DROP_OLDEST)
+    for state in ("opening", "opened", "closing"):
+        queue.put(make_update(Command.VALVE_STATUS, state=state))
+    assert queue.dropped == 1
+    assert (await queue.get()).changes == {"state": "opened"}
+    assert (await queue.get()).changes == {"state": "closing"}
+
+    queue = _UpdateQueue(1, Overflow.COALESCE)
+    queue.put(make_update(Command.VALVE_STATUS, state="opening"))
+    queue.put(make_update(Command.VALVE_STATUS, travel_count=1))
+    assert queue.dropped == 0
+    update = await queue.get()
+    assert update.data == {"travel_count": 1}
+    assert update.changes == {"state": "opening", "travel_count": 1}
+
+    queue.put(make_update(Command.VALVE_STATUS, state="opened"))
+    queue.put(make_update(Command.WIFI_STATUS, rssi=-60))
+    assert queue.dropped == 1
+    assert (await queue.get()).command == Command.WIFI_STATUS
+
+
+@pytest.mark.asyncio
+async def test_subscribed_only(client: Client) -> None:
+    """Test that a poller can be limited to the commands that have subscribers.
+
+    Args:
+    ----
+        client: A connected client.
+
+    """
+    updates: asyncio.Queue[PollUpdate] = asyncio.Queue()
+
+    async with Poller(client, subscribed_only=True) as poller:
+        # Nothing is subscribed, so nothing is polled:
+        await asyncio.sleep(0.01)
+        assert poller.get(Command.VALVE_STATUS) is None
+
+        poller.subscribe(updates.put_nowait)
+        await updates.get()
+        assert poller._polled_commands() == DEFAULT_POLL_INTERVALS.keys()
@@ -0,0 +1,260 @@
+"""Test firmware rollouts."""
+
+# pylint: disable=protected-access
+from collections.abc import AsyncGenerator
+import contextlib
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+
+from aioguardian import Fleet
+from aioguardian.errors import RolloutError
+from aioguardian.helpers.command import Command
+from aioguardian.helpers.retry import RetryPolicy
+from aioguardian.rollout import DeviceStatus, Rollout, RolloutPlan
+from aioguardian.testing import SimulatedDevice
+
+NEW_FIRMWARE = "0.21.0"
+TEST_PLAN = RolloutPlan(
+    firmware=NEW_FIRMWARE, filename="latest.bin", waves=(0.5, 1.0), max_concurrency=2
+)
+
+
+@pytest_asyncio.fixture
+async def devices() -> AsyncGenerator[list[SimulatedDevice], None]:
+    """Define five running simulated devices (on different loopback addresses).
+
+    Yields
+    ------
+        A list of simulated devices.
+
+    """
+    async with contextlib.AsyncExitStack() as stack:
+        first = await stack.enter_async_context(
+            SimulatedDevice(reboot_time=0.05, available_firmware=NEW_FIRMWARE)
+        )
+        devices = [
+            first,
+            *[
+                await stack.enter_async_context(
+                    SimulatedDevice(
+                        host=f"127.0.0.{index}",
+                        port=first.port,
+                        reboot_time=0.05,
+                        available_firmware=NEW_FIRMWARE,
+                    )
+                )
+                for index in range(2, 6)
+            ],
+        ]
+        # Probe restarting devices often (so that these tests run quickly):
+        stack.enter_context(patch("aioguardian.client.RESTART_PROBE_INTERVAL", 0.01))
+        stack.enter_context(patch("aioguardian.rollout.UPGRADE_POLL_INTERVAL", 0.01))
+        yield devices
+
+
+@pytest_asyncio.fixture
+async def fleet(devices: list[SimulatedDevice]) -> AsyncGenerator[Fleet, None]:
+    """Define a connected fleet of simulated devices.
+
+    Args:
+    ----
+        devices: A list of simulated devices.
+
+    Yields:
+    ------
+        A connected fleet.
+
+    """
+    async with Fleet(
+        [device.host for device in devices],
+        port=devices[0].port,
+        request_timeout=1,
+        retry_policy=RetryPolicy(
+            min_timeout=0.02,
+            # Restarting devices are probed with pings, which shouldn't wait long:
+            overrides={Command.SYSTEM_PING: RetryPolicy(timeout=0.05)},
+        ),
+    ) as fleet:
+        yield fleet
+
+
+@pytest.mark.asyncio
+async def test_rollout(
+    devices: list[SimulatedDevice], fleet: Fleet, tmp_path: Path
+) -> None:
+    """Test rolling out firmware across a fleet.
+
+    Args:
+    ----
+        devices: A list of simulated devices.
+        fleet: A connected fleet.
+        tmp_path: A temporary directory.
+
+    """
+    # The last device already runs the new firmware:
+    devices[-1].diagnostics["firmware"] = NEW_FIRMWARE
+
+    progress_file = tmp_path / "rollout.json"
+    rollout = Rollout(fleet, TEST_PLAN, progress_file=progress_file)
+    assert rollout._waves() == [
+        ["127.0.0.1"],
+        ["127.0.0.2", "127.0.0.3"],
+        ["127.0.0.4", "127.0.0.5"],
+    ]
+
+    progress = await rollout.run()
+    assert set(progress.values()) == {DeviceStatus.UPGRADED}
+    assert not rollout.errors
+    for device in devices:
+        assert device.diagnostics["firmware"] == NEW_FIRMWARE
+    assert Command.SYSTEM_UPGRADE_FIRMWARE not in devices[-1].received
+
+    assert json.loads(progress_file.read_text()) == {
+        "firmware": NEW_FIRMWARE,
+        "devices": {device.host: "upgraded" for device in devices},
+    }
+
+
+@pytest.mark.asyncio
+async def test_rollout_halt_and_resume(
+    devices: list[SimulatedDevice], fleet: Fleet, tmp_path: Path
+) -> None:
+    """Test that a rollout halts on failures and resumes where it left off.
+
+    Args:
+    ----
+        devices: A list of simulated devices.
+        fleet: A connected fleet.
+        tmp_path: A temporary directory.
+
+    """
+    progress_file = tmp_path / "rollout.json"
+    devices[0].fail(Command.SYSTEM_UPGRADE_FIRMWARE)
+
+    rollout = Rollout(fleet, TEST_PLAN, progress_file=progress_file)
+    with pytest.raises(RolloutError) as err:
+        await rollout.run()
+    assert str(err.value) == (
+        "Halting the rollout after wave 0: 1 of 1 upgrades failed"
+    )
+    assert rollout.progress["127.0.0.1"] == DeviceStatus.FAILED
+    assert rollout.progress["127.0.0.2"] == DeviceStatus.PENDING
+    assert "127.0.0.1" in rollout.errors
+    for device in devices[1:]:
+        assert Command.SYSTEM_UPGRADE_FIRMWARE not in device.received
+
+    # Once the problem is fixed, a new rollout picks up from the saved progress:
+    devices[0].recover(Command.SYSTEM_UPGRADE_FIRMWARE)
+    devices[1].diagnostics["firmware"] = NEW_FIRMWARE
+    progress_file.write_text(
+        json.dumps(
+            {
+                "firmware": NEW_FIRMWARE,
+                "devices": {
+                    "127.0.0.1": "failed",
+                    "127.0.0.2": "upgraded",
+                    # Devices that are no longer in the fleet are ignored:
+                    "127.0.0.99": "upgraded",
+                },
+            }
+        )
+    )
+    rollout = Rollout(fleet, TEST_PLAN, progress_file=progress_file)
+    progress = await rollout.run()
+    assert set(progress.values()) == {DeviceStatus.UPGRADED}
+    # Devices that were already upgraded aren't touched again:
+    assert Command.SYSTEM_DIAGNOSTICS not in devices[1].received
+
+
+@pytest.mark.asyncio
+async def test_rollout_progress_for_other_firmware(
+    fleet: Fleet, tmp_path: Path
+) -> None:
+    """Test that progress saved for other firmware isn't resumed.
+
+    Args:
+    ----
+        fleet: A connected fleet.
+        tmp_path: A temporary directory.
+
+    """
+    progress_file = tmp_path / "rollout.json"
+    progress_file.write_text(json.dumps({"firmware": "0.20.0", "devices": {}}))
+
+    with pytest.raises(RolloutError) as err:
+        Rollout(fleet, TEST_PLAN, progress_file=progress_file)
+    assert str(err.value) == (
+        f"{progress_file} tracks a rollout of 0.20.0 (not {NEW_FIRMWARE})"
+    )
+
+
+@pytest.mark.asyncio
+async def test_rollout_verification(
+    devices: list[SimulatedDevice], fleet: Fleet
+) -> None:
+    """Test that a device that restarts with the old firmware counts as a failure.
+
+    Args:
+    ----
+        devices: A list of simulated devices.
+        fleet: A connected fleet.
+
+    """
+    devices[2].available_firmware = None
+
+    rollout = Rollout(
+        fleet,
+        RolloutPlan(
+            firmware=NEW_FIRMWARE,
+            waves=(1.0,),
+            max_error_rate=0.5,
+            upgrade_timeout=0.2,
+        ),
+    )
+    progress = await rollout.run()
+    assert progress["127.0.0.3"] == DeviceStatus.FAILED
+    assert str(rollout.errors["127.0.0.3"]) == (
+        "Device still reports firmware 0.20.9-beta+official.ef3 0.2 seconds after "
+        "upgrading"
+    )
+    assert list(progress.values()).count(DeviceStatus.UPGRADED) == 4
+
+
+@pytest.mark.asyncio
+async def test_rollout_delayed_restart(
+    devices: list[SimulatedDevice], fleet: Fleet
+) -> None:
+    """Test that a device that restarts well after acknowledging an upgrade is awaited.
+
+    Args:
+    ----
+        devices: A list of simulated devices.
+        fleet: A connected fleet.
+
+    """
+    # The first device downloads the firmware for longer than the client holds
+    # commands, then takes a while to reboot; the second never gets around to it:
+    devices[0].upgrade_delay = 0.3
+    devices[0].reboot_time = 1.0
+    devices[1].upgrade_delay = 60
+
+    rollout = Rollout(
+        fleet,
+        RolloutPlan(
+            firmware=NEW_FIRMWARE, waves=(1.0,), max_error_rate=0.5, upgrade_timeout=3
+        ),
+    )
+    with patch("aioguardian.client.RESTART_GRACE_PERIOD", 0.05):
+        progress = await rollout.run()
+
+    assert progress["127.0.0.1"] == DeviceStatus.UPGRADED
+    assert devices[0].diagnostics["firmware"] == NEW_FIRMWARE
+    assert progress["127.0.0.2"] == DeviceStatus.FAILED
+    assert str(rollout.errors["127.0.0.2"]) == (
+        "Device still reports firmware 0.20.9-beta+official.ef3 3 seconds after "
+        "upgrading"
+    )
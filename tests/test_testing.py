@@ -0,0 +1,272 @@
+"""Test the simulated device."""
+
+# pylint: disable=protected-access
+import asyncio
+from collections.abc import AsyncGenerator
+import json
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+
+from aioguardian import Client
+from aioguardian.errors import CommandError, SocketError
+from aioguardian.helpers.command import Command
+from aioguardian.helpers.datagram import DatagramEndpoint
+from aioguardian.helpers.retry import RetryPolicy
+from aioguardian.models import ValveState
+from aioguardian.testing import FaultProfile, SimulatedDevice
+
+TEST_TRAVEL_TIME = 0.04
+
+
+@pytest_asyncio.fixture
+async def device() -> AsyncGenerator[SimulatedDevice, None]:
+    """Define a running simulated device.
+
+    Yields
+    ------
+        A simulated device.
+
+    """
+    async with SimulatedDevice(
+        reboot_time=0.05,
+        valve_travel_time=TEST_TRAVEL_TIME,
+        available_firmware="0.21.0",
+    ) as device:
+        yield device
+
+
+def make_client(device: SimulatedDevice, **kwargs: RetryPolicy | int) -> Client:
+    """Make a client for a simulated device.
+
+    Args:
+    ----
+        device: A simulated device.
+        **kwargs: Additional keyword arguments for the client.
+
+    Returns:
+    -------
+        A client.
+
+    """
+    return Client(device.host, port=device.port, **kwargs)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_sensor_commands(device: SimulatedDevice) -> None:
+    """Test sensor commands against a simulated device.
+
+    Args:
+    ----
+        device: A simulated device.
+
+    """
+    async with make_client(device) as client:
+        await client.sensor.pair_sensor("AAAAAAAAAAAA")
+        assert (await client.sensor.pair_dump())["data"] == {
+            "pair_count": 2,
+            "paired_uids": ["6309FB799CDE", "AAAAAAAAAAAA"],
+        }
+
+        device.set_wet(True, uid="AAAAAAAAAAAA")
+        status = await client.sensor.get_paired_sensor_status("AAAAAAAAAAAA")
+        assert status.wet
+
+        await client.sensor.unpair_sensor("AAAAAAAAAAAA")
+        with pytest.raises(CommandError) as err:
+            await client.sensor.paired_sensor_status("AAAAAAAAAAAA")
+        assert "sensor_not_paired" in str(err.value)
+
+        await client.iot.publish_state()
+
+    assert device.received[Command.SENSOR_PAIRED_SENSOR_STATUS] == 2
+
+
+@pytest.mark.asyncio
+async def test_system_commands(device: SimulatedDevice) -> None:
+    """Test system commands against a simulated device.
+
+    Args:
+    ----
+        device: A simulated device.
+
+    """
+    client = make_client(
+        device, request_timeout=1, retry_policy=RetryPolicy(min_timeout=0.02)
+    )
+    async with client:
+        assert (await client.system.ping())["data"] == {"uid": "ABCDEF123456"}
+        assert (await client.system.ping(silent=False)).get("silent") is None
+
+        device.set_wet(True)
+        assert (await client.system.get_onboard_sensor_status()).wet
+
+        # Commands sent while the device restarts are held until it's back:
+        with patch("aioguardian.client.RESTART_PROBE_INTERVAL", 0.01):
+            await client.system.upgrade_firmware(filename="latest.bin")
+            assert device.rebooting
+            await client.system.reboot()
+            diagnostics = await client.system.get_diagnostics()
+            assert diagnostics.firmware == "0.21.0"
+            assert diagnostics.uptime == 0
+
+            await client.wifi.configure("Other_Network", "password")
+            await client.system.factory_reset()
+            assert (await client.sensor.pair_dump())["data"]["pair_count"] == 0
+            assert (await client.wifi.status())["data"]["ssid"] == "My_Network"
+
+
+@pytest.mark.asyncio
+async def test_valve_motion(device: SimulatedDevice) -> None:
+    """Test that the simulated valve moves through its states.
+
+    Args:
+    ----
+        device: A simulated device.
+
+    """
+    async with make_client(device) as client:
+        await client.valve.open()
+        status = await client.valve.get_status()
+        assert status.state.transitional
+        assert status.enabled
+
+        await asyncio.sleep(TEST_TRAVEL_TIME * 1.5)
+        status = await client.valve.get_status()
+        assert status.state == ValveState.OPENED
+        assert status.travel_count == 1
+        with pytest.raises(CommandError) as err:
+            await client.valve.open()
+        assert "valve_already_opened" in str(err.value)
+
+        await client.valve.close()
+        await client.valve.halt()
+        assert (await client.valve.get_status()).state == ValveState.START_HALT
+        await asyncio.sleep(TEST_TRAVEL_TIME)
+        assert (await client.valve.get_status()).state == ValveState.HALTED
+        with pytest.raises(CommandError) as err:
+            await client.valve.halt()
+        assert "valve_already_stopped" in str(err.value)
+
+        await client.valve.close()
+        await client.valve.reset()
+        assert (await client.valve.get_status()).state == ValveState.DEFAULT
+
+        await client.valve.close()
+        await asyncio.sleep(TEST_TRAVEL_TIME * 1.5)
+        with pytest.raises(CommandError) as err:
+            await client.valve.close()
+        assert "valve_already_closed" in str(err.value)
+
+        # Stopping the device stops the valve:
+        await client.valve.open()
+        device.close()
+        assert device._motion_task is None
+
+
+@pytest.mark.asyncio
+async def test_wifi_commands(device: SimulatedDevice) -> None:
+    """Test WiFi commands against a simulated device.
+
+    Args:
+    ----
+        device: A simulated device.
+
+    """
+    async with make_client(device) as client:
+        await client.wifi.disable_ap()
+        assert (await client.wifi.status())["data"]["ap_enabled"] is False
+        await client.wifi.enable_ap()
+        assert (await client.wifi.status())["data"]["ap_enabled"] is True
+
+        await client.wifi.scan()
+        assert len(await client.wifi.get_scan_records()) == 1
+        await client.wifi.reset()
+
+
+@pytest.mark.asyncio
+async def test_failures(device: SimulatedDevice) -> None:
+    """Test making commands fail.
+
+    Args:
+    ----
+        device: A simulated device.
+
+    """
+    async with make_client(device) as client:
+        device.fail(Command.SENSOR_PAIRED_SENSOR_STATUS, error_code=5)
+        with pytest.raises(CommandError) as err:
+            await client.sensor.paired_sensor_status("6309FB799CDE")
+        assert "sensor_error_loading" in str(err.value)
+
+        device.fail(Command.SYSTEM_PING)
+        with pytest.raises(CommandError):
+            await client.system.ping()
+
+        device.recover(Command.SYSTEM_PING)
+        await client.system.ping()
+
+
+@pytest.mark.asyncio
+async def test_invalid_requests(device: SimulatedDevice) -> None:
+    """Test that invalid requests are handled.
+
+    Args:
+    ----
+        device: A simulated device.
+
+    """
+    replies: list[bytes] = []
+    endpoint = DatagramEndpoint()
+    await endpoint.open(("127.0.0.1", 0))
+    try:
+        await endpoint.register(
+            device.host, device.port, lambda data, _: replies.append(data)
+        )
+        endpoint.sendto(b"not json", (device.host, device.port))
+        endpoint.sendto(b'{"command": 99}', (device.host, device.port))
+        await asyncio.sleep(0.05)
+    finally:
+        endpoint.close()
+
+    assert [json.loads(reply) for reply in replies] == [
+        {"command": 99, "status": "error"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_faults(device: SimulatedDevice) -> None:
+    """Test injecting network faults.
+
+    Args:
+    ----
+        device: A simulated device.
+
+    """
+    policy = RetryPolicy(attempts=2, backoff_base=0.01, deadline=0.1)
+
+    # Every reply is lost:
+    device.faults = FaultProfile(loss=1)
+    async with make_client(device, request_timeout=1, retry_policy=policy) as client:
+        with pytest.raises(SocketError):
+            await client.system.ping()
+
+    # Every reply is delayed, duplicated, and reordered:
+    device.faults = FaultProfile(
+        latency=0.01, jitter=0.01, duplicate=1, reorder=1, reorder_delay=0.01, seed=1
+    )
+    async with make_client(device) as client:
+        started = asyncio.get_running_loop().time()
+        results = await asyncio.gather(client.system.ping(), client.valve.status())
+        assert asyncio.get_running_loop().time() - started >= 0.02
+        assert [result["command"] for result in results] == [0, 16]
+
+        # Replies still in flight when the device stops are never sent:
+        await client.wifi.status()
+        device.faults = FaultProfile(latency=0.01)
+        task = asyncio.create_task(client.system.ping())
+        await asyncio.sleep(0)
+        device.close()
+        await asyncio.sleep(0.02)
+        task.cancel()